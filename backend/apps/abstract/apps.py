@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class AbstractConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.abstract"
+
+    def ready(self):
+        from apps.abstract import signals  # noqa: F401
@@ -0,0 +1,221 @@
+# Python modules
+from typing import Any, Callable, Optional
+import logging
+import math
+import random
+import time
+import uuid
+from threading import Event, Lock
+
+# Third-party modules
+from redis.exceptions import WatchError
+
+# Django modules
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+# Constants
+LOCK_KEY = "lock:{key}"
+_settings: dict[str, Any] = getattr(settings, "CACHE_STAMPEDE", {})
+XFETCH_BETA: float = _settings.get("BETA", 1.0)
+STALE_TIMEOUT: int = _settings.get("STALE_TIMEOUT", 300)
+LOCK_TIMEOUT: int = _settings.get("LOCK_TIMEOUT", 10)
+WAIT_TIMEOUT: float = _settings.get("WAIT_TIMEOUT", 2.0)
+
+
+class SingleFlight:
+    """
+    Collapse concurrent calls for the same key inside one process,
+    so only the first caller runs the function and the rest share its result.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._calls: dict[str, tuple[Event, dict[str, Any]]] = {}
+
+    def do(self, key: str, func: Callable[[], Any]) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = (Event(), {})
+                self._calls[key] = call
+
+        event, result = call
+        if not leader:
+            event.wait()
+            if "error" in result:
+                raise result["error"]
+            return result["value"]
+
+        try:
+            result["value"] = func()
+            return result["value"]
+        except Exception as e:
+            result["error"] = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            event.set()
+
+
+_single_flight = SingleFlight()
+
+
+def acquire_lock(lock_key: str) -> Optional[str]:
+    """
+    Take a rebuild lock, returning the owner token to release it with.
+    """
+    owner = uuid.uuid4().hex
+    return owner if cache.add(lock_key, owner, LOCK_TIMEOUT) else None
+
+
+def release_lock(lock_key: str, owner: str) -> None:
+    """
+    Delete the lock only if it is still ours: a rebuild outliving
+    LOCK_TIMEOUT must not free the lock another worker took since.
+    WATCH makes the compare and delete atomic.
+    """
+    client = cache.client.get_client(write=True)
+    full_key = cache.make_key(lock_key)
+    with client.pipeline() as pipe:
+        try:
+            pipe.watch(full_key)
+            value = pipe.get(full_key)
+            if value is None or cache.client.decode(value) != owner:
+                return
+            pipe.multi()
+            pipe.delete(full_key)
+            pipe.execute()
+        except WatchError:
+            # Expired and taken over while we compared, so not ours anymore
+            pass
+
+
+def _get_envelope(key: str) -> Optional[dict[str, Any]]:
+    envelope = cache.get(key)
+    # Plain values written before get_or_rebuild was used count as a miss
+    if not isinstance(envelope, dict) or "expires_at" not in envelope:
+        return None
+    return envelope
+
+
+def _should_recompute(envelope: dict[str, Any], beta: float) -> bool:
+    """
+    Probabilistic early expiration (XFetch): the closer the entry is to
+    its expiry and the slower it was to build, the likelier a recompute.
+    """
+    jitter = -envelope["delta"] * beta * math.log(1.0 - random.random())
+    return time.time() + jitter >= envelope["expires_at"]
+
+
+def _rebuild(key: str, builder: Callable[[], Any], timeout: int) -> Any:
+    started = time.perf_counter()
+    value = builder()
+    delta = time.perf_counter() - started
+
+    cache.set(
+        key,
+        {"value": value, "delta": delta, "expires_at": time.time() + timeout},
+        timeout + STALE_TIMEOUT,
+    )
+    logger.debug(f"Rebuilt cache key={key} in {delta * 1000:.1f} ms")
+    return value
+
+
+def get_or_rebuild(
+    key: str,
+    builder: Callable[[], Any],
+    timeout: int,
+    beta: Optional[float] = None,
+) -> Any:
+    """
+    Read a cached value with stampede protection.
+
+    - XFetch recomputes hot keys shortly before they expire
+    - a Redis lock lets a single worker rebuild while the others keep
+      serving the stale value (kept for STALE_TIMEOUT past expiry)
+    - in-process singleflight collapses concurrent misses in this worker
+
+    Args:
+        key: Cache key
+        builder: Callable producing the fresh value
+        timeout: Freshness in seconds
+        beta: XFetch aggressiveness, > 1 favours earlier recomputation
+    Returns:
+        Cached or freshly built value
+    """
+
+    beta = XFETCH_BETA if beta is None else beta
+    envelope = _get_envelope(key)
+
+    if envelope is not None and not _should_recompute(envelope, beta):
+        return envelope["value"]
+
+    lock_key = LOCK_KEY.format(key=key)
+
+    if envelope is not None:
+        # Stale or early: one worker rebuilds, everyone else serves stale
+        owner = acquire_lock(lock_key)
+        if owner:
+            try:
+                return _single_flight.do(key, lambda: _rebuild(key, builder, timeout))
+            finally:
+                release_lock(lock_key, owner)
+        return envelope["value"]
+
+    def rebuild_on_miss():
+        owner = acquire_lock(lock_key)
+        if owner:
+            try:
+                return _rebuild(key, builder, timeout)
+            finally:
+                release_lock(lock_key, owner)
+
+        # Another worker is rebuilding: wait for its value, then give up
+        deadline = time.monotonic() + WAIT_TIMEOUT
+        while time.monotonic() < deadline:
+            time.sleep(0.01)
+            envelope = _get_envelope(key)
+            if envelope is not None:
+                return envelope["value"]
+        logger.warning(f"Timed out waiting for cache rebuild: key={key}")
+        return _rebuild(key, builder, timeout)
+
+    return _single_flight.do(key, rebuild_on_miss)
+
+
+def get_many_fresh(keys: list[str]) -> dict[str, Any]:
+    """
+    Read several values stored by get_or_rebuild in one round trip,
+    skipping entries that are missing or past their freshness.
+    """
+
+    now = time.time()
+    return {
+        key: envelope["value"]
+        for key, envelope in cache.get_many(keys).items()
+        if isinstance(envelope, dict) and envelope.get("expires_at", 0) > now
+    }
+
+
+def expire(*keys: str) -> None:
+    """
+    Mark cached values as expired without dropping them, so the next reader
+    rebuilds each under the lock while concurrent readers get the stale copy.
+    Values not stored by get_or_rebuild are deleted.
+    """
+
+    envelopes = {
+        key: {**envelope, "expires_at": 0}
+        for key, envelope in cache.get_many(keys).items()
+        if isinstance(envelope, dict) and "expires_at" in envelope
+    }
+    if envelopes:
+        cache.set_many(envelopes, STALE_TIMEOUT)
+    others = [key for key in keys if key not in envelopes]
+    if others:
+        cache.delete_many(others)
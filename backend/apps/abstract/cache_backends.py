@@ -0,0 +1,222 @@
+# Python modules
+from typing import Any, Iterable, Optional
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+
+# Third-party modules
+from django_redis.cache import RedisCache
+
+# Django modules
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+
+# Project modules
+from apps.abstract.lru import LRUCache
+from apps.abstract import metrics, profiling
+
+logger = logging.getLogger(__name__)
+
+# Constants
+INVALIDATION_CHANNEL = "cache:invalidate"
+CLEAR_ALL = "*"
+
+
+class TwoTierRedisCache(RedisCache):
+    """
+    django_redis cache with a bounded in-process LRU in front of it.
+
+    Only keys starting with one of LOCAL_CACHE["KEY_PREFIXES"] are kept
+    locally, so locks, counters and blacklist entries always hit Redis.
+    Every write or delete is broadcast over Redis pub/sub and each worker
+    evicts its local copy; LOCAL_CACHE["TTL"] bounds staleness if a
+    message is lost. Locally cached values are shared between callers
+    and must be treated as read-only.
+
+    OPTIONS:
+        LOCAL_CACHE:
+            - MAX_SIZE: entries per process
+            - TTL: seconds a value may live locally
+            - KEY_PREFIXES: keys eligible for the local tier
+    """
+
+    def __init__(self, server: str, params: dict[str, Any]) -> None:
+        options = dict(params.get("OPTIONS", {}))
+        local_options = options.pop("LOCAL_CACHE", {})
+        super().__init__(server, {**params, "OPTIONS": options})
+
+        self.local_ttl = local_options.get("TTL", 5)
+        self.local_prefixes = tuple(local_options.get("KEY_PREFIXES", ()))
+        self._local = LRUCache(
+            max_size=local_options.get("MAX_SIZE", 1000),
+            ttl=self.local_ttl,
+        )
+        self._origin = uuid.uuid4().hex
+        self._listener_pid: Optional[int] = None
+        self._listener_lock = threading.Lock()
+
+    # Local tier
+
+    def _is_local(self, key: str) -> bool:
+        return bool(self.local_prefixes) and key.startswith(self.local_prefixes)
+
+    def _local_timeout(self, timeout: Any) -> float:
+        timeout = self.get_backend_timeout(timeout)
+        if timeout is None:
+            return self.local_ttl
+        return min(self.local_ttl, timeout)
+
+    def _ensure_listener(self) -> None:
+        # Started lazily and per pid, so forked workers get their own thread
+        if self._listener_pid == os.getpid():
+            return
+
+        with self._listener_lock:
+            if self._listener_pid == os.getpid():
+                return
+            self._local.clear()
+            self._listener_pid = os.getpid()
+            threading.Thread(
+                target=self._listen,
+                name="cache-invalidation",
+                daemon=True,
+            ).start()
+
+    def _listen(self) -> None:
+        backoff = 1
+        while True:
+            try:
+                pubsub = self.client.get_client(write=True).pubsub(
+                    ignore_subscribe_messages=True
+                )
+                pubsub.subscribe(INVALIDATION_CHANNEL)
+                # Anything cached before we subscribed may have been missed
+                self._local.clear()
+                backoff = 1
+
+                for message in pubsub.listen():
+                    data = json.loads(message["data"])
+                    if data["origin"] == self._origin:
+                        continue
+                    for key in data["keys"]:
+                        if key == CLEAR_ALL:
+                            self._local.clear()
+                        else:
+                            self._local.delete(key)
+            except Exception as e:
+                logger.warning(f"Cache invalidation listener error: {e}")
+                self._local.clear()
+                time.sleep(backoff)
+                backoff = min(backoff * 2, 30)
+
+    def _broadcast(self, keys: Iterable[str]) -> None:
+        keys = list(keys)
+        for key in keys:
+            if key == CLEAR_ALL:
+                self._local.clear()
+            else:
+                self._local.delete(key)
+
+        try:
+            self.client.get_client(write=True).publish(
+                INVALIDATION_CHANNEL,
+                json.dumps({"origin": self._origin, "keys": keys}),
+            )
+        except Exception as e:
+            logger.error(f"Failed to broadcast cache invalidation: {e}")
+
+    # Cache API
+
+    @profiling.timed("cache")
+    def get_many(self, keys, version=None, client=None):
+        return super().get_many(keys, version=version, client=client)
+
+    @profiling.timed_cache_get
+    @metrics.count_cache_get
+    def get(self, key, default=None, version=None, client=None):
+        if not self._is_local(key):
+            return super().get(key, default=default, version=version, client=client)
+
+        self._ensure_listener()
+        full_key = self.make_key(key, version=version)
+        sentinel = object()
+
+        value = self._local.get(full_key, sentinel)
+        if value is not sentinel:
+            return value
+
+        value = super().get(key, default=sentinel, version=version, client=client)
+        if value is sentinel:
+            return default
+
+        ttl = self.client.ttl(key, version=version)
+        self._local.set(
+            full_key,
+            value,
+            ttl=self.local_ttl if ttl is None else min(self.local_ttl, ttl),
+        )
+        return value
+
+    @profiling.timed("cache")
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None, **kwargs):
+        result = super().set(key, value, timeout=timeout, version=version, **kwargs)
+        if self._is_local(key):
+            self._ensure_listener()
+            full_key = self.make_key(key, version=version)
+            self._broadcast([full_key])
+            if result:
+                self._local.set(full_key, value, ttl=self._local_timeout(timeout))
+        return result
+
+    @profiling.timed("cache")
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None, **kwargs):
+        result = super().add(key, value, timeout=timeout, version=version, **kwargs)
+        if result and self._is_local(key):
+            self._broadcast([self.make_key(key, version=version)])
+        return result
+
+    @profiling.timed("cache")
+    def delete(self, key, version=None, **kwargs):
+        result = super().delete(key, version=version, **kwargs)
+        if self._is_local(key):
+            self._broadcast([self.make_key(key, version=version)])
+        return result
+
+    @profiling.timed("cache")
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None, **kwargs):
+        result = super().set_many(data, timeout=timeout, version=version, **kwargs)
+        local_keys = [
+            self.make_key(key, version=version) for key in data if self._is_local(key)
+        ]
+        if local_keys:
+            self._broadcast(local_keys)
+        return result
+
+    @profiling.timed("cache")
+    def delete_many(self, keys, version=None, **kwargs):
+        keys = list(keys)
+        result = super().delete_many(keys, version=version, **kwargs)
+        local_keys = [
+            self.make_key(key, version=version) for key in keys if self._is_local(key)
+        ]
+        if local_keys:
+            self._broadcast(local_keys)
+        return result
+
+    def expire(self, key, timeout, version=None, **kwargs):
+        result = super().expire(key, timeout, version=version, **kwargs)
+        if self._is_local(key):
+            self._broadcast([self.make_key(key, version=version)])
+        return result
+
+    def delete_pattern(self, *args, **kwargs):
+        result = super().delete_pattern(*args, **kwargs)
+        self._broadcast([CLEAR_ALL])
+        return result
+
+    def clear(self):
+        result = super().clear()
+        self._broadcast([CLEAR_ALL])
+        return result
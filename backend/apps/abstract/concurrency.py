@@ -0,0 +1,98 @@
+# Python modules
+from threading import Lock
+import time
+
+# Constants
+# Fraction of the concurrency limit each priority may fill. Lower
+# priorities are shed first, "critical" (cached reads) never is.
+PRIORITY_SHARES = {
+    "critical": float("inf"),
+    "high": 1.0,
+    "normal": 0.75,
+    "low": 0.5,
+}
+# Weight of each sample in a route's latency baseline (EWMA)
+BASELINE_ALPHA = 0.05
+# Weight of a congested sample, so the baseline follows lasting changes
+# (data growth) but does not learn an overload as the new normal
+BASELINE_DRIFT = 0.001
+# Samples a route needs before its baseline is trusted as a signal
+WARMUP_SAMPLES = 20
+
+
+class AdaptiveLimiter:
+    """
+    AIMD concurrency limit of one process, driven by observed latency.
+
+    Every route keeps a baseline, an EWMA of its latency that congested
+    samples only move slowly. Callers pass cache hits and misses as
+    separate routes, so a fast hit does not make every miss look
+    congested. While at least half the limit is in use, a request slower
+    than TOLERANCE x its route's baseline, or failing with a 5xx, is a
+    congestion signal and multiplies the limit by BACKOFF, at most once
+    per cooldown. Fast requests grow it by 1/limit, about +1 per round.
+    With little in flight, slow requests say nothing about concurrency
+    and leave the limit alone.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 20,
+        min_limit: int = 4,
+        max_limit: int = 200,
+        tolerance: float = 2.0,
+        backoff: float = 0.9,
+        cooldown: float = 1.0,
+    ) -> None:
+        self.limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.tolerance = tolerance
+        self.backoff = backoff
+        self.cooldown = cooldown
+        self.inflight = 0
+        # route -> (baseline latency, samples)
+        self.baselines: dict[str, tuple[float, int]] = {}
+        self.last_decrease = 0.0
+        self.lock = Lock()
+
+    def try_acquire(self, priority: str) -> bool:
+        share = PRIORITY_SHARES.get(priority, PRIORITY_SHARES["normal"])
+        with self.lock:
+            if self.inflight >= max(1.0, self.limit * share):
+                return False
+            self.inflight += 1
+            return True
+
+    def release(self, route: str, latency: float, failed: bool = False) -> None:
+        with self.lock:
+            busy = self.inflight >= self.limit / 2
+            self.inflight -= 1
+            baseline, samples = self.baselines.get(route, (latency, 0))
+            congested = failed or (
+                samples >= WARMUP_SAMPLES and latency > baseline * self.tolerance
+            )
+
+            if congested and busy:
+                now = time.monotonic()
+                if now - self.last_decrease >= self.cooldown:
+                    self.limit = max(self.min_limit, self.limit * self.backoff)
+                    self.last_decrease = now
+            elif not congested and busy:
+                self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+
+            if not failed:
+                alpha = BASELINE_DRIFT if congested else BASELINE_ALPHA
+                baseline += (latency - baseline) * alpha
+            self.baselines[route] = (baseline, samples + 1)
+
+    def get_retry_after(self) -> int:
+        """
+        Seconds a shed client should wait: about the time for the
+        requests in flight to drain at the slowest route's pace.
+        """
+        with self.lock:
+            slowest = max(
+                (baseline for baseline, _ in self.baselines.values()), default=0.0
+            )
+            return max(1, round(slowest * self.inflight / max(self.limit, 1.0)))
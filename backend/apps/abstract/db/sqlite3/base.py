@@ -0,0 +1,49 @@
+# Python modules
+from typing import Any
+
+# Django modules
+from django.db.backends.sqlite3.base import DatabaseWrapper as SQLiteDatabaseWrapper
+
+# Constants
+DEFAULT_PRAGMAS: dict[str, Any] = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "busy_timeout": 5000,
+    "mmap_size": 256 * 1024 * 1024,
+    "cache_size": -64 * 1024,
+    "temp_store": "MEMORY",
+}
+
+
+def apply_pragmas(cursor: Any, pragmas: dict[str, Any]) -> None:
+    """
+    Apply PRAGMA statements to a freshly opened SQLite connection.
+
+    Args:
+        cursor: DB-API cursor of the connection
+        pragmas: Mapping of pragma name to value
+    Returns:
+        None
+    """
+
+    for name, value in pragmas.items():
+        cursor.execute(f"PRAGMA {name} = {value}")
+
+
+class DatabaseWrapper(SQLiteDatabaseWrapper):
+    """
+    SQLite backend that opens atomic blocks with BEGIN IMMEDIATE.
+
+    A deferred BEGIN takes a read lock first and upgrades it on the
+    first write, which fails with "database is locked" as soon as
+    another writer got there first. Taking the writer lock up front
+    lets busy_timeout queue writers instead.
+
+    Settings:
+        - TRANSACTION_MODE: "IMMEDIATE" (default), "DEFERRED" or "EXCLUSIVE"
+        - PRAGMAS: applied on connection_created (see apps.abstract.signals)
+    """
+
+    def _start_transaction_under_autocommit(self):
+        mode = self.settings_dict.get("TRANSACTION_MODE", "IMMEDIATE")
+        self.cursor().execute(f"BEGIN {mode}")
@@ -0,0 +1,150 @@
+# Python modules
+from functools import wraps
+from typing import Any
+import hashlib
+import logging
+
+# Django modules
+from django.conf import settings
+from django.core.cache import cache
+
+# Third-party modules
+from rest_framework.response import Response as DRFResponse
+from rest_framework.status import (
+    HTTP_400_BAD_REQUEST,
+    HTTP_409_CONFLICT,
+    HTTP_422_UNPROCESSABLE_ENTITY,
+    HTTP_429_TOO_MANY_REQUESTS,
+)
+
+# Project modules
+from apps.abstract import metrics
+
+logger = logging.getLogger(__name__)
+
+# Constants
+IDEMPOTENCY_HEADER = "HTTP_IDEMPOTENCY_KEY"
+IDEMPOTENCY_KEY = "idempotency:{user}:{digest}"
+IN_FLIGHT = "in_flight"
+DONE = "done"
+_settings: dict[str, Any] = getattr(settings, "IDEMPOTENCY", {})
+TIMEOUT: int = _settings.get("TIMEOUT", 86400)
+LOCK_TIMEOUT: int = _settings.get("LOCK_TIMEOUT", 30)
+MAX_KEY_LENGTH: int = _settings.get("MAX_KEY_LENGTH", 255)
+
+
+def get_fingerprint(request) -> str:
+    # Reading body first keeps it available to the parsers afterwards
+    return hashlib.sha256(request.body).hexdigest()
+
+
+def is_replayable(status_code: int) -> bool:
+    # Server errors and rate limiting are transient, a retry must run again
+    return status_code < 500 and status_code != HTTP_429_TOO_MANY_REQUESTS
+
+
+def idempotent(timeout=None):
+    """
+    Honor the Idempotency-Key header of a POST endpoint.
+
+    The first request with a key marks it in flight with an atomic
+    cache.add, runs the view and stores its response. Retries with the
+    same key, user and path get the stored response back with
+    Idempotent-Replayed: true instead of running the write path again.
+    A retry arriving while the first request still runs gets 409, a key
+    reused with another body gets 422. Requests without the header are
+    handled as usual.
+
+    Args:
+        timeout: Seconds a response is kept for replay, IDEMPOTENCY["TIMEOUT"] by default
+    """
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(self, request, *args, **kwargs):
+            idempotency_key = request.META.get(IDEMPOTENCY_HEADER)
+            if request.method != "POST" or idempotency_key is None:
+                return func(self, request, *args, **kwargs)
+
+            view = metrics.get_view_label(request)
+            if not idempotency_key or len(idempotency_key) > MAX_KEY_LENGTH:
+                return DRFResponse(
+                    data={
+                        "detail": f"Idempotency-Key must be 1 to {MAX_KEY_LENGTH} characters."
+                    },
+                    status=HTTP_400_BAD_REQUEST,
+                )
+
+            user = request.user.id if request.user.is_authenticated else "anonymous"
+            cache_key = IDEMPOTENCY_KEY.format(
+                user=user,
+                digest=hashlib.sha256(
+                    f"{request.path}\n{idempotency_key}".encode()
+                ).hexdigest(),
+            )
+            fingerprint = get_fingerprint(request)
+
+            if not cache.add(
+                cache_key,
+                {"state": IN_FLIGHT, "fingerprint": fingerprint},
+                LOCK_TIMEOUT,
+            ):
+                return replay(cache.get(cache_key), fingerprint, view)
+
+            try:
+                response = func(self, request, *args, **kwargs)
+            except Exception:
+                cache.delete(cache_key)
+                raise
+
+            if not is_replayable(response.status_code):
+                cache.delete(cache_key)
+                return response
+
+            cache.set(
+                cache_key,
+                {
+                    "state": DONE,
+                    "fingerprint": fingerprint,
+                    "status": response.status_code,
+                    "data": response.data,
+                },
+                TIMEOUT if timeout is None else timeout,
+            )
+            metrics.IDEMPOTENT_REQUESTS.labels(view, "executed").inc()
+            logger.info(
+                f"Stored idempotent response: view={view}, user={user}, "
+                f"status={response.status_code}"
+            )
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+def replay(entry, fingerprint: str, view: str) -> DRFResponse:
+    if entry is None or entry["state"] == IN_FLIGHT:
+        # Expired between add and get counts as still running, the client retries
+        metrics.IDEMPOTENT_REQUESTS.labels(view, "conflict").inc()
+        return DRFResponse(
+            data={"detail": "A request with this Idempotency-Key is in progress."},
+            status=HTTP_409_CONFLICT,
+            headers={"Retry-After": "1"},
+        )
+
+    if entry["fingerprint"] != fingerprint:
+        metrics.IDEMPOTENT_REQUESTS.labels(view, "mismatch").inc()
+        return DRFResponse(
+            data={
+                "detail": "Idempotency-Key was already used with a different request body."
+            },
+            status=HTTP_422_UNPROCESSABLE_ENTITY,
+        )
+
+    metrics.IDEMPOTENT_REQUESTS.labels(view, "replayed").inc()
+    return DRFResponse(
+        data=entry["data"],
+        status=entry["status"],
+        headers={"Idempotent-Replayed": "true"},
+    )
@@ -0,0 +1,184 @@
+# Python modules
+import os
+import sqlite3
+import statistics
+import tempfile
+import threading
+import time
+
+# Django modules
+from django.core.management.base import BaseCommand
+
+# Project modules
+from apps.abstract.db.sqlite3.base import DEFAULT_PRAGMAS, apply_pragmas
+
+# Constants
+SCHEMA = """
+CREATE TABLE post (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    title VARCHAR(200) NOT NULL,
+    body TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX post_created_at ON post (created_at);
+"""
+READ_SQL = (
+    "SELECT id, title, body, created_at FROM post ORDER BY created_at DESC LIMIT 10"
+)
+WRITE_CHECK_SQL = "SELECT COUNT(*) FROM post WHERE title = ?"
+WRITE_SQL = "INSERT INTO post (title, body, created_at) VALUES (?, ?, ?)"
+
+PROFILES = {
+    # Django defaults: rollback journal, new connection per request, deferred BEGIN
+    "default": {
+        "pragmas": {},
+        "begin": "BEGIN",
+        "persistent": False,
+    },
+    "tuned": {
+        "pragmas": DEFAULT_PRAGMAS,
+        "begin": "BEGIN IMMEDIATE",
+        "persistent": True,
+    },
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Run a concurrent read/write benchmark against SQLite with the "
+        "default and the tuned (WAL, pragmas, BEGIN IMMEDIATE) profiles"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--readers", type=int, default=8)
+        parser.add_argument("--writers", type=int, default=2)
+        parser.add_argument(
+            "--duration",
+            type=float,
+            default=5.0,
+            help="Seconds to run each profile",
+        )
+        parser.add_argument(
+            "--rows",
+            type=int,
+            default=10_000,
+            help="Rows to seed before measuring",
+        )
+
+    def handle(self, *args, **options):
+        """
+        Benchmark each profile on its own temporary database file
+        and print throughput, lock errors and latency percentiles.
+        """
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"SQLite benchmark: readers={options['readers']}, "
+                f"writers={options['writers']}, duration={options['duration']}s"
+            )
+        )
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            results = {}
+            for name, profile in PROFILES.items():
+                path = os.path.join(tmp_dir, f"{name}.sqlite3")
+                self._seed(path, profile, options["rows"])
+                results[name] = self._run(path, profile, options)
+                self._report(name, results[name])
+
+        default, tuned = results["default"], results["tuned"]
+        for kind in ("read", "write"):
+            base = default[kind]["ops"] or 1
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"{kind} throughput gain: {tuned[kind]['ops'] / base:.1f}x"
+                )
+            )
+
+    def _connect(self, path, profile):
+        conn = sqlite3.connect(path, timeout=5, isolation_level=None)
+        apply_pragmas(conn.cursor(), profile["pragmas"])
+        return conn
+
+    def _seed(self, path, profile, rows):
+        conn = self._connect(path, profile)
+        conn.executescript(SCHEMA)
+        now = time.time()
+        conn.execute("BEGIN")
+        conn.executemany(
+            WRITE_SQL,
+            ((f"seed {i}", "x" * 512, now - i) for i in range(rows)),
+        )
+        conn.execute("COMMIT")
+        conn.close()
+
+    def _run(self, path, profile, options):
+        stop_at = time.perf_counter() + options["duration"]
+        stats = {
+            "read": {"latencies": [], "errors": 0},
+            "write": {"latencies": [], "errors": 0},
+        }
+        lock = threading.Lock()
+
+        def worker(kind):
+            latencies = []
+            errors = 0
+            conn = self._connect(path, profile) if profile["persistent"] else None
+            counter = 0
+
+            while time.perf_counter() < stop_at:
+                started = time.perf_counter()
+                current = conn or self._connect(path, profile)
+                try:
+                    if kind == "read":
+                        current.execute(READ_SQL).fetchall()
+                    else:
+                        counter += 1
+                        title = f"{threading.get_ident()}-{counter}"
+                        current.execute(profile["begin"])
+                        current.execute(WRITE_CHECK_SQL, (title,)).fetchone()
+                        current.execute(WRITE_SQL, (title, "y" * 512, time.time()))
+                        current.execute("COMMIT")
+                    latencies.append((time.perf_counter() - started) * 1000)
+                except sqlite3.OperationalError:
+                    errors += 1
+                    if current.in_transaction:
+                        current.execute("ROLLBACK")
+                finally:
+                    if conn is None:
+                        current.close()
+
+            if conn is not None:
+                conn.close()
+            with lock:
+                stats[kind]["latencies"].extend(latencies)
+                stats[kind]["errors"] += errors
+
+        threads = [
+            threading.Thread(target=worker, args=("read",))
+            for _ in range(options["readers"])
+        ] + [
+            threading.Thread(target=worker, args=("write",))
+            for _ in range(options["writers"])
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for kind in stats:
+            latencies = sorted(stats[kind]["latencies"]) or [0.0]
+            stats[kind]["ops"] = len(stats[kind]["latencies"]) / options["duration"]
+            stats[kind]["p50"] = statistics.median(latencies)
+            stats[kind]["p95"] = latencies[
+                min(len(latencies) - 1, int(len(latencies) * 0.95))
+            ]
+        return stats
+
+    def _report(self, name, stats):
+        self.stdout.write(f"\n[{name}]")
+        for kind, values in stats.items():
+            self.stdout.write(
+                f"  {kind:<6} {values['ops']:>10.1f} ops/s  "
+                f"p50={values['p50']:.2f} ms  p95={values['p95']:.2f} ms  "
+                f"lock errors={values['errors']}"
+            )
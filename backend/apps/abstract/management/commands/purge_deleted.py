@@ -0,0 +1,167 @@
+# Python modules
+from datetime import timedelta
+import re
+import time
+
+# Django modules
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import CASCADE
+from django.utils import timezone
+
+# Constants
+# Children first, so a purged parent cascades over as few rows as possible
+PURGED_MODELS = ("blog.Comment", "blog.Post", "users.CustomUser")
+DURATION_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+
+
+def get_cascades(model):
+    """
+    Reverse relations deleting along with model, auto-created
+    many-to-many through tables included.
+    """
+    return [
+        field
+        for field in model._meta.get_fields(include_hidden=True)
+        if (field.one_to_many or field.one_to_one)
+        and field.auto_created
+        and not field.concrete
+        and field.on_delete is CASCADE
+    ]
+
+
+def parse_duration(value):
+    match = re.fullmatch(r"(\d+)([smhdw])", value.strip())
+    if not match:
+        raise CommandError(f"Invalid duration '{value}', expected e.g. 30d, 12h, 90m")
+    return timedelta(seconds=int(match.group(1)) * DURATION_UNITS[match.group(2)])
+
+
+class Command(BaseCommand):
+    help = (
+        "Hard-delete soft-deleted posts, comments and users older than a "
+        "cutoff, in small keyset batches"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--older-than",
+            default="30d",
+            help="Minimum age of the tombstones, e.g. 30d, 12h",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=200,
+            help="Rows deleted per transaction, cascaded children are deleted "
+            "first in batches of the same size",
+        )
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=0.05,
+            help="Pause between batches in seconds, lets other writers in",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only count what would be deleted",
+        )
+
+    def handle(self, *args, **options):
+        """
+        Walk each model's tombstones by id and delete them batch by batch,
+        each batch in its own short transaction, so the SQLite writer lock
+        is never held for longer than one batch. Rows a batch would cascade
+        to are deleted first, in bounded batches of their own, so the
+        Collector never has to load a whole cascade at once.
+        """
+        cutoff = timezone.now() - parse_duration(options["older_than"])
+        self.batch_size = options["batch_size"]
+        self.sleep = options["sleep"]
+        if self.batch_size < 1:
+            raise CommandError("--batch-size must be positive")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Purging rows soft-deleted before {cutoff:%Y-%m-%d %H:%M}"
+                f"{' (dry run)' if options['dry_run'] else ''}"
+            )
+        )
+
+        for label in PURGED_MODELS:
+            model = apps.get_model(label)
+            tombstones = model.objects.filter(deleted_at__lt=cutoff)
+
+            if options["dry_run"]:
+                self.report_dry_run(model, tombstones)
+                continue
+
+            self.started = time.perf_counter()
+            self.deleted = {}
+            self.label = label
+            self.delete_in_batches(tombstones)
+
+            summary = ", ".join(
+                f"{name}={count}" for name, count in sorted(self.deleted.items())
+            )
+            self.stdout.write(
+                self.style.SUCCESS(f"✓ {label}: {summary or 'nothing to purge'}")
+            )
+
+    def delete_in_batches(self, queryset):
+        model = queryset.model
+        last_id = 0
+        while True:
+            ids = list(
+                queryset.filter(id__gt=last_id)
+                .order_by("id")
+                .values_list("id", flat=True)[: self.batch_size]
+            )
+            if not ids:
+                return
+            last_id = ids[-1]
+
+            # Children first, depth first, each level in its own batches
+            for relation in get_cascades(model):
+                self.delete_in_batches(
+                    relation.related_model._base_manager.filter(
+                        **{f"{relation.field.name}__in": ids}
+                    )
+                )
+
+            with transaction.atomic():
+                # QuerySet.delete bypasses the soft delete of Model.delete
+                _, per_model = model._base_manager.filter(id__in=ids).delete()
+            for name, count in per_model.items():
+                self.deleted[name] = self.deleted.get(name, 0) + count
+
+            elapsed = time.perf_counter() - self.started
+            total = sum(self.deleted.values())
+            self.stdout.write(
+                f"  {self.label}: {total} rows deleted, "
+                f"{total / elapsed if elapsed else 0:.0f} rows/s"
+            )
+            time.sleep(self.sleep)
+
+    def report_dry_run(self, model, tombstones):
+        counts = {}
+        self.count_cascade(tombstones, counts)
+        summary = ", ".join(f"{name}={count}" for name, count in counts.items())
+        self.stdout.write(f"  would delete {summary}")
+
+    def count_cascade(self, queryset, counts):
+        """
+        Count the rows delete_in_batches would remove, walking the same
+        cascades with the same managers, soft-deleted children included.
+        """
+        model = queryset.model
+        counts[model._meta.label] = counts.get(model._meta.label, 0) + queryset.count()
+        for relation in get_cascades(model):
+            self.count_cascade(
+                relation.related_model._base_manager.filter(
+                    **{f"{relation.field.name}__in": queryset.values("id")}
+                ),
+                counts,
+            )
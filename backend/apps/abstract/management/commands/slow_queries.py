@@ -0,0 +1,147 @@
+# Python modules
+import glob
+import json
+import os
+
+# Django modules
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+
+def get_log_file():
+    handler = settings.LOGGING.get("handlers", {}).get("slow_queries", {})
+    return handler.get("filename", "logs/slow_queries.jsonl")
+
+
+class Command(BaseCommand):
+    help = "Top slow query fingerprints by total time, from the slow query log"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--file",
+            default=None,
+            help="Slow query log, its rotated backups are read too",
+        )
+        parser.add_argument(
+            "--top",
+            type=int,
+            default=20,
+            help="Number of fingerprints to show",
+        )
+        parser.add_argument(
+            "--view",
+            default=None,
+            help="Only queries run by this route name, e.g. post-list",
+        )
+        parser.add_argument(
+            "--full-scans",
+            action="store_true",
+            help="Only queries whose plan fully scans a table",
+        )
+        parser.add_argument(
+            "--plans",
+            action="store_true",
+            help="Print the latest plan of each fingerprint",
+        )
+
+    def handle(self, *args, **options):
+        """
+        Group slow records by fingerprint and rank them by total time,
+        the cost a query shape actually puts on the database. Full scans
+        logged below the threshold are listed apart, their durations
+        would skew the ranking.
+        """
+        path = options["file"] or get_log_file()
+        # Oldest backup first, so the newest sample wins
+        paths = sorted(glob.glob(f"{glob.escape(path)}.*"), reverse=True)
+        if os.path.exists(path):
+            paths.append(path)
+        if not paths:
+            raise CommandError(f"No slow query log at {path}")
+
+        stats = {}
+        scans = {}
+        for record in self.read_records(paths):
+            if options["view"] and record.get("view") != options["view"]:
+                continue
+            if record.get("reason") == "full_scan":
+                scans[record["fingerprint_id"]] = record
+                continue
+            if options["full_scans"] and not record.get("full_scans"):
+                continue
+
+            entry = stats.setdefault(
+                record["fingerprint_id"],
+                {"count": 0, "total_ms": 0.0, "max_ms": 0.0, "views": set()},
+            )
+            entry["count"] += 1
+            entry["total_ms"] += record["duration_ms"]
+            entry["max_ms"] = max(entry["max_ms"], record["duration_ms"])
+            entry["views"].add(record.get("view"))
+            entry["fingerprint"] = record["fingerprint"]
+            entry["full_scans"] = record.get("full_scans") or []
+            entry["plan"] = record.get("plan") or []
+
+        self.write_ranking(stats, options)
+        self.write_full_scans(scans, options)
+
+    def write_ranking(self, stats, options):
+        if not stats:
+            self.stdout.write(self.style.WARNING("No matching slow queries"))
+            return
+
+        ranked = sorted(stats.items(), key=lambda item: -item[1]["total_ms"])
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Top {min(options['top'], len(ranked))} of {len(ranked)} "
+                f"fingerprints by total time"
+            )
+        )
+        for rank, (fingerprint_id, entry) in enumerate(ranked[: options["top"]], 1):
+            self.stdout.write(
+                f"\n{rank:>3}. {fingerprint_id}  total {entry['total_ms']:.1f}ms  "
+                f"count {entry['count']}  "
+                f"avg {entry['total_ms'] / entry['count']:.1f}ms  "
+                f"max {entry['max_ms']:.1f}ms"
+            )
+            self.stdout.write(f"     views: {', '.join(sorted(map(str, entry['views'])))}")
+            if entry["full_scans"]:
+                self.stdout.write(
+                    self.style.ERROR(f"     full scan: {', '.join(entry['full_scans'])}")
+                )
+            self.stdout.write(f"     {entry['fingerprint'][:300]}")
+            if options["plans"]:
+                for line in entry["plan"]:
+                    self.stdout.write(f"       | {line}")
+
+    def write_full_scans(self, scans, options):
+        if not scans:
+            return
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"\n{len(scans)} full scans of watched tables below the threshold"
+            )
+        )
+        for fingerprint_id, record in scans.items():
+            self.stdout.write(
+                f"\n     {fingerprint_id}  {record['duration_ms']:.1f}ms  "
+                f"view {record.get('view')}"
+            )
+            self.stdout.write(
+                self.style.ERROR(f"     full scan: {', '.join(record['full_scans'])}")
+            )
+            self.stdout.write(f"     {record['fingerprint'][:300]}")
+            if options["plans"]:
+                for line in record.get("plan") or []:
+                    self.stdout.write(f"       | {line}")
+
+    def read_records(self, paths):
+        for path in paths:
+            with open(path, encoding="utf-8") as file:
+                for line in file:
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        # A line cut short by a crash or a rotation
+                        continue
@@ -0,0 +1,56 @@
+# Python modules
+import sqlite3
+import time
+
+# Django modules
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS
+
+
+class Command(BaseCommand):
+    help = "Copy the primary SQLite database into the local SQLite read replicas"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=0,
+            help="Keep syncing every N seconds (0 syncs once)",
+        )
+
+    def handle(self, *args, **options):
+        """
+        Snapshot the primary into every replica alias with the
+        SQLite online backup API, once or on an interval.
+        """
+        primary = settings.DATABASES[DEFAULT_DB_ALIAS]
+        replicas = [
+            alias
+            for alias in settings.DATABASE_REPLICAS
+            if "sqlite3" in settings.DATABASES[alias]["ENGINE"]
+        ]
+
+        if "sqlite3" not in primary["ENGINE"] or not replicas:
+            raise CommandError("sync_replica needs a SQLite primary and SQLite replicas")
+
+        while True:
+            for alias in replicas:
+                started = time.perf_counter()
+                source = sqlite3.connect(primary["NAME"])
+                target = sqlite3.connect(settings.DATABASES[alias]["NAME"])
+                try:
+                    source.backup(target)
+                finally:
+                    target.close()
+                    source.close()
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        f"✓ Synced '{alias}' in "
+                        f"{(time.perf_counter() - started) * 1000:.1f} ms"
+                    )
+                )
+
+            if not options["interval"]:
+                break
+            time.sleep(options["interval"])
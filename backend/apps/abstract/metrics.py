@@ -0,0 +1,134 @@
+"""
+Prometheus metrics.
+
+With several gunicorn/uvicorn workers, point PROMETHEUS_MULTIPROC_DIR
+at an empty directory shared by every worker (and by listen_comments),
+wiped on deploy. Each process then writes its samples to mmap files
+that /metrics aggregates on scrape. Without it, metrics are per process.
+"""
+
+# Python modules
+from functools import wraps
+from typing import Callable
+import hmac
+import os
+
+# Third-party modules
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+# Django modules
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseForbidden
+
+# Constants
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "Request latency by view",
+    ("view", "method"),
+)
+RESPONSES = Counter(
+    "http_responses_total",
+    "Responses by view and status code",
+    ("view", "method", "status"),
+)
+DB_QUERIES = Counter(
+    "db_queries_total",
+    "SQL queries run while serving each view",
+    ("view",),
+)
+CACHE_REQUESTS = Counter(
+    "cache_requests_total",
+    "Cache reads by key family (key prefix) and result",
+    ("family", "result"),
+)
+RATELIMIT_REJECTIONS = Counter(
+    "ratelimit_rejections_total",
+    "Requests rejected by the ratelimit decorator",
+    ("view",),
+)
+COMMENT_EVENTS = Counter(
+    "comment_events_total",
+    "Comment events published to Redis",
+    ("result",),
+)
+IDEMPOTENT_REQUESTS = Counter(
+    "idempotent_requests_total",
+    "POST requests carrying an Idempotency-Key, by outcome",
+    ("view", "result"),
+)
+LOAD_SHED = Counter(
+    "load_shed_total",
+    "Requests rejected with 503 by the adaptive concurrency limit",
+    ("view", "priority"),
+)
+CONCURRENCY_LIMIT = Gauge(
+    "concurrency_limit",
+    "Adaptive concurrency limit, summed over worker processes",
+    multiprocess_mode="livesum",
+)
+COMMENT_CONSUMER_LAG = Gauge(
+    "comment_consumer_lag_seconds",
+    "Delay between publishing a comment event and listen_comments receiving it",
+    multiprocess_mode="livemax",
+)
+
+
+def get_key_family(key: str) -> str:
+    return key.split(":", 1)[0]
+
+
+def get_view_label(request) -> str:
+    # Route names keep the label cardinality bounded, unlike paths
+    match = getattr(request, "resolver_match", None)
+    return getattr(match, "view_name", None) or "unmatched"
+
+
+def count_cache_get(func: Callable) -> Callable:
+    """
+    Count hits and misses of cache.get per key family.
+    """
+
+    @wraps(func)
+    def wrapper(self, key, default=None, *args, **kwargs):
+        value = func(self, key, default, *args, **kwargs)
+        CACHE_REQUESTS.labels(
+            get_key_family(key), "miss" if value is default else "hit"
+        ).inc()
+        return value
+
+    return wrapper
+
+
+def get_registry():
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return registry
+    return REGISTRY
+
+
+def metrics_view(request):
+    """
+    Prometheus text exposition of every metric, across workers.
+    Requires "Authorization: Bearer <METRICS_TOKEN>". Without a token
+    configured it is only served with DEBUG on.
+    """
+    token = getattr(settings, "METRICS_TOKEN", "")
+    if not token:
+        if not settings.DEBUG:
+            return HttpResponseForbidden()
+    elif not hmac.compare_digest(
+        request.META.get("HTTP_AUTHORIZATION", "").encode(),
+        f"Bearer {token}".encode(),
+    ):
+        return HttpResponseForbidden()
+    return HttpResponse(generate_latest(get_registry()), content_type=CONTENT_TYPE_LATEST)
@@ -0,0 +1,428 @@
+# Python modules
+from contextlib import ExitStack
+import itertools
+import json
+import logging
+import random
+import time
+
+# Third-party modules
+import jwt
+
+# Django modules
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.core.handlers.asgi import ASGIRequest
+from django.core.cache import cache
+from django.db import connections
+from django.http import JsonResponse
+
+# Project modules
+from apps.abstract.routers import pin_to_primary, unpin
+from apps.abstract import metrics, profiling, streaming, traffic
+from apps.abstract.concurrency import AdaptiveLimiter
+from apps.abstract.response_cache import is_cached
+from apps.abstract.slow_queries import SlowQueryRecorder
+
+logger = logging.getLogger(__name__)
+
+# Constants
+PRIMARY_PIN_COOKIE = "db_primary_pin"
+PRIMARY_PIN_CACHE_KEY = "db_pin:user:{user_id}"
+UNSAFE_METHODS = ("POST", "PUT", "PATCH", "DELETE")
+
+
+def get_unverified_user_id(request):
+    """
+    Read the user id claim of a Bearer token without verifying it.
+    Only used for routing, a forged token can at most pin to the primary.
+    """
+    header = request.META.get("HTTP_AUTHORIZATION", "")
+    parts = header.split()
+    if len(parts) != 2 or parts[0] != "Bearer":
+        return None
+    try:
+        payload = jwt.decode(parts[1], options={"verify_signature": False})
+    except jwt.PyJWTError:
+        return None
+    return payload.get(settings.SIMPLE_JWT.get("USER_ID_CLAIM", "user_id"))
+
+
+class AsyncStreamingMiddleware:
+    """
+    Stream the sync bodies of StreamingHttpResponse under ASGI.
+
+    Django's ASGI handler reads a sync streaming body into a list before
+    sending any of it, so a bulk export would be held in memory whole.
+    The body is read in batches in the request's thread instead, sent as
+    each batch is ready. WSGI requests are left as they are.
+
+    Must be first in MIDDLEWARE, to convert the body once every other
+    middleware has wrapped it.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        if (
+            isinstance(request, ASGIRequest)
+            and response.streaming
+            and not response.is_async
+        ):
+            response.streaming_content = streaming.aiter_batches(
+                response.streaming_content
+            )
+        return response
+
+
+class PrimaryStickinessMiddleware:
+    """
+    Read-your-writes stickiness for PrimaryReplicaRouter.
+
+    Unsafe requests always run against the primary. After a successful
+    write the client is pinned to the primary for
+    settings.REPLICA_STICKINESS_SECONDS, through a cookie and, for JWT
+    clients that drop cookies, a cache marker keyed by user id.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.window = getattr(settings, "REPLICA_STICKINESS_SECONDS", 5)
+        self.enabled = bool(getattr(settings, "DATABASE_REPLICAS", []))
+
+    def __call__(self, request):
+        if not self.enabled:
+            return self.get_response(request)
+
+        user_id = get_unverified_user_id(request)
+        pinned = (
+            request.method in UNSAFE_METHODS
+            or PRIMARY_PIN_COOKIE in request.COOKIES
+            or (
+                user_id is not None
+                and cache.get(PRIMARY_PIN_CACHE_KEY.format(user_id=user_id))
+            )
+        )
+
+        token = pin_to_primary(bool(pinned))
+        try:
+            response = self.get_response(request)
+        finally:
+            unpin(token)
+
+        if request.method in UNSAFE_METHODS and response.status_code < 400:
+            response.set_cookie(
+                PRIMARY_PIN_COOKIE,
+                "1",
+                max_age=self.window,
+                httponly=True,
+                samesite="Lax",
+            )
+            if user_id is not None:
+                cache.set(
+                    PRIMARY_PIN_CACHE_KEY.format(user_id=user_id),
+                    1,
+                    self.window,
+                )
+            logger.debug(f"Pinned client to primary for {self.window}s")
+
+        return response
+
+
+class ProfilingMiddleware:
+    """
+    Per-request profile of a sample of requests.
+
+    Sampled requests time every SQL query through connection.execute_wrapper
+    and collect the cache, Redis publish, serializer and renderer timings
+    recorded by apps.abstract.profiling hooks. Totals are returned in a
+    Server-Timing header and logged as one JSON line. Unsampled requests
+    only pay for a random() call.
+
+    settings.PROFILING:
+        - SAMPLE_RATE: fraction of requests profiled, 0 disables
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.sample_rate = getattr(settings, "PROFILING", {}).get("SAMPLE_RATE", 0)
+
+    def __call__(self, request):
+        if not self.sample_rate or random.random() >= self.sample_rate:
+            return self.get_response(request)
+
+        token = profiling.start()
+        try:
+            with ExitStack() as stack:
+                for alias in connections:
+                    stack.enter_context(
+                        connections[alias].execute_wrapper(profiling.sql_wrapper)
+                    )
+                response = self.get_response(request)
+            profile = profiling.current()
+            total = profile.total
+        finally:
+            profiling.stop(token)
+
+        response["Server-Timing"] = self.get_server_timing(profile, total)
+        logger.info(json.dumps(self.get_log_record(request, response, profile, total)))
+        return response
+
+    def get_server_timing(self, profile, total):
+        metrics = []
+        for name in profiling.METRICS:
+            if name not in profile.counts:
+                continue
+            description = f"{profile.counts[name]} calls"
+            if name == "db":
+                description = f"{profile.counts[name]} queries"
+            elif name == "cache":
+                description = (
+                    f"{profile.counts.get('cache_hit', 0)} hits "
+                    f"{profile.counts.get('cache_miss', 0)} misses"
+                )
+            metrics.append(
+                f'{name};dur={profile.durations[name] * 1000:.2f};desc="{description}"'
+            )
+        metrics.append(f"total;dur={total * 1000:.2f}")
+        return ", ".join(metrics)
+
+    def get_log_record(self, request, response, profile, total):
+        record = {
+            "event": "request_profile",
+            "method": request.method,
+            "path": request.path,
+            "view": getattr(request.resolver_match, "view_name", None),
+            "status": response.status_code,
+            "total_ms": round(total * 1000, 2),
+        }
+        for name in profiling.METRICS:
+            record[f"{name}_ms"] = round(profile.durations.get(name, 0.0) * 1000, 2)
+            record[f"{name}_calls"] = profile.counts.get(name, 0)
+        record["cache_hits"] = profile.counts.get("cache_hit", 0)
+        record["cache_misses"] = profile.counts.get("cache_miss", 0)
+        return record
+
+
+class MetricsMiddleware:
+    """
+    Record latency, status and SQL query count of every request
+    in the Prometheus metrics of apps.abstract.metrics.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        queries = 0
+
+        def count_queries(execute, sql, params, many, context):
+            nonlocal queries
+            queries += 1
+            return execute(sql, params, many, context)
+
+        def watch():
+            stack = ExitStack()
+            for alias in connections:
+                stack.enter_context(connections[alias].execute_wrapper(count_queries))
+            return stack
+
+        def record_queries():
+            if queries:
+                metrics.DB_QUERIES.labels(view).inc(queries)
+
+        started = time.perf_counter()
+        with watch():
+            response = self.get_response(request)
+        elapsed = time.perf_counter() - started
+
+        view = metrics.get_view_label(request)
+        metrics.REQUEST_LATENCY.labels(view, request.method).observe(elapsed)
+        metrics.RESPONSES.labels(view, request.method, response.status_code).inc()
+        if response.streaming:
+            # Queries of the body are counted once it has been sent
+            streaming.instrument(response, watch, on_finish=record_queries)
+        else:
+            record_queries()
+        return response
+
+
+class SlowQueryMiddleware:
+    """
+    Slow query log of every request, see apps.abstract.slow_queries.
+
+    settings.SLOW_QUERIES:
+        - THRESHOLD_MS: queries at least this slow are logged, 0 disables
+        - EXPLAIN: attach the query plan to each record, off by default
+        - WATCHED_TABLES: tables whose full scans are logged even when
+          fast, needs EXPLAIN
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.config = getattr(settings, "SLOW_QUERIES", {})
+        if not self.config.get("THRESHOLD_MS"):
+            raise MiddlewareNotUsed
+
+    def __call__(self, request):
+        def watch():
+            stack = ExitStack()
+            for alias in connections:
+                connection = connections[alias]
+                stack.enter_context(
+                    connection.execute_wrapper(
+                        SlowQueryRecorder(request, connection, self.config)
+                    )
+                )
+            return stack
+
+        with watch():
+            response = self.get_response(request)
+        streaming.instrument(response, watch)
+        return response
+
+
+class TrafficCaptureMiddleware:
+    """
+    Record a sample of requests for `manage.py replay_traffic`.
+
+    Keeps the method, path, query string, caller class (anonymous, user,
+    staff), body size, status and latency, never bodies or credentials.
+    Records are written off the request path by apps.abstract.traffic.
+
+    settings.TRAFFIC_CAPTURE:
+        - SAMPLE_RATE: fraction of requests recorded, 0 disables
+        - FILE: JSONL path, "{pid}" is replaced by the worker's pid
+        - MAX_BYTES, BACKUP_COUNT: rotation of each file
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.sample_rate = getattr(settings, "TRAFFIC_CAPTURE", {}).get(
+            "SAMPLE_RATE", 0
+        )
+        if not self.sample_rate:
+            raise MiddlewareNotUsed
+
+    def __call__(self, request):
+        if random.random() >= self.sample_rate:
+            return self.get_response(request)
+
+        ts = time.time()
+        started = time.perf_counter()
+        response = self.get_response(request)
+        elapsed = time.perf_counter() - started
+
+        traffic.get_recorder().record(
+            {
+                "ts": round(ts, 3),
+                "method": request.method,
+                "path": request.path,
+                "query": request.META.get("QUERY_STRING", ""),
+                "view": metrics.get_view_label(request),
+                "identity": traffic.get_identity(request),
+                "body_size": int(request.META.get("CONTENT_LENGTH") or 0),
+                "status": response.status_code,
+                "latency_ms": round(elapsed * 1000, 2),
+            }
+        )
+        return response
+
+
+class ConcurrencyLimitMiddleware:
+    """
+    Shed load with 503 and Retry-After once the process is saturated,
+    instead of letting every request queue until it times out.
+
+    Requests are admitted against an AdaptiveLimiter limit depending on
+    their priority: anonymous GETs with a fresh cached response are
+    "critical" and always served, other reads default to "normal" and
+    writes to "low", so uncached lists and writes are shed first.
+
+    settings.CONCURRENCY_LIMIT:
+        - ENABLED: False removes the middleware
+        - INITIAL_LIMIT, MIN_LIMIT, MAX_LIMIT: bounds of the limit
+        - TOLERANCE: latency over TOLERANCE x a route's baseline is congestion
+        - BACKOFF: multiplicative decrease on congestion
+        - COOLDOWN: minimum seconds between two decreases
+        - ROUTE_PRIORITIES: route name -> "high", "normal" or "low"
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        config = getattr(settings, "CONCURRENCY_LIMIT", {})
+        if not config.get("ENABLED", False):
+            raise MiddlewareNotUsed
+
+        self.limiter = AdaptiveLimiter(
+            initial_limit=config.get("INITIAL_LIMIT", 20),
+            min_limit=config.get("MIN_LIMIT", 4),
+            max_limit=config.get("MAX_LIMIT", 200),
+            tolerance=config.get("TOLERANCE", 2.0),
+            backoff=config.get("BACKOFF", 0.9),
+            cooldown=config.get("COOLDOWN", 1.0),
+        )
+        self.route_priorities = config.get("ROUTE_PRIORITIES", {})
+        # next() on a count is atomic, worker threads shed concurrently
+        self.shed = itertools.count(1)
+        metrics.CONCURRENCY_LIMIT.set(self.limiter.limit)
+
+    def __call__(self, request):
+        response = self.get_response(request)
+
+        started = getattr(request, "_concurrency_started", None)
+        if started is not None:
+            self.limiter.release(
+                # Cache hits would make every miss of the route look slow
+                f"{metrics.get_view_label(request)}:"
+                f"{'hit' if response.get('X-Cache') == 'HIT' else 'miss'}",
+                time.perf_counter() - started,
+                failed=response.status_code >= 500,
+            )
+            metrics.CONCURRENCY_LIMIT.set(self.limiter.limit)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        view = metrics.get_view_label(request)
+        priority = self.get_priority(request, view)
+        # The cache is only looked up for requests that would be shed
+        admitted = self.limiter.try_acquire(priority)
+        if not admitted and self.serves_cached(request, view_func):
+            admitted = self.limiter.try_acquire("critical")
+        if admitted:
+            request._concurrency_started = time.perf_counter()
+            return None
+
+        metrics.LOAD_SHED.labels(view, priority).inc()
+        shed = next(self.shed)
+        # Overloaded is the worst time to write a line per request
+        if shed % 100 == 1:
+            logger.warning(
+                f"Shedding load, {shed} shed so far: {request.method} {view} "
+                f"({priority}), {self.limiter.inflight} in flight, "
+                f"limit {self.limiter.limit:.1f}"
+            )
+        response = JsonResponse(
+            {"detail": "Server is overloaded, retry later."}, status=503
+        )
+        response["Retry-After"] = str(self.limiter.get_retry_after())
+        return response
+
+    def get_priority(self, request, view):
+        if view in self.route_priorities:
+            return self.route_priorities[view]
+        return "normal" if request.method in ("GET", "HEAD", "OPTIONS") else "low"
+
+    def serves_cached(self, request, view_func):
+        """
+        Whether the view would answer from a fresh cache_response entry.
+        """
+        if request.method != "GET" or "HTTP_AUTHORIZATION" in request.META:
+            return False
+        # ViewSet.as_view() keeps the viewset class and its method -> action map
+        action = getattr(view_func, "actions", {}).get("get")
+        handler = getattr(getattr(view_func, "cls", None), action or "", None)
+        group = getattr(handler, "response_cache_group", None)
+        return bool(group) and is_cached(group, request)
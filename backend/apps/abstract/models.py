@@ -39,6 +39,8 @@ class AbstractTimeStamptModel(Model):
         Soft delete the object
         by setting the deleted_at
         field to the current time.
+        updated_at moves too, so delta
+        sync reports the tombstone.
             Args:
                 *args: tuple of positional arguments
                 **kwargs: dict of keyword arguments
@@ -47,4 +49,4 @@ class AbstractTimeStamptModel(Model):
         """
 
         self.deleted_at = django_timezone.now()
-        self.save(update_fields=["deleted_at"])
+        self.save(update_fields=["deleted_at", "updated_at"])
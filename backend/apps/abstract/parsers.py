@@ -0,0 +1,40 @@
+# Third-party modules
+from rest_framework import parsers
+from rest_framework.exceptions import ParseError
+
+# Django modules
+from django.conf import settings
+
+# Project modules
+from apps.abstract.renderers import JSONRenderer, orjson
+
+# Constants
+UTF8_ALIASES = ("utf-8", "utf8")
+
+
+class JSONParser(parsers.JSONParser):
+    """
+    Drop-in replacement of rest_framework's JSONParser.
+
+    Request bodies are decoded with orjson when it is installed. orjson
+    always rejects NaN and Infinity, so it only replaces the stdlib in
+    STRICT_JSON mode, the default.
+    """
+
+    renderer_class = JSONRenderer
+    use_orjson = orjson is not None
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        if not (self.use_orjson and self.strict):
+            return super().parse(stream, media_type, parser_context)
+
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+
+        try:
+            body = stream.read()
+            if encoding.lower() not in UTF8_ALIASES:
+                body = body.decode(encoding)
+            return orjson.loads(body)
+        except ValueError as exc:
+            raise ParseError(f"JSON parse error - {exc}")
@@ -0,0 +1,106 @@
+# Python modules
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, Callable, Optional
+import time
+
+# Constants
+# Server-Timing metric names, in header order
+METRICS = ("db", "cache", "redis", "serialize", "render")
+
+
+class RequestProfile:
+    """
+    Timings and counters collected for one sampled request.
+    """
+
+    __slots__ = ("started", "durations", "counts")
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self.durations: dict[str, float] = {}
+        self.counts: dict[str, int] = {}
+
+    def add(self, name: str, seconds: float, count: int = 1) -> None:
+        self.durations[name] = self.durations.get(name, 0.0) + seconds
+        self.counts[name] = self.counts.get(name, 0) + count
+
+    def incr(self, name: str, count: int = 1) -> None:
+        self.counts[name] = self.counts.get(name, 0) + count
+
+    @property
+    def total(self) -> float:
+        return time.perf_counter() - self.started
+
+
+_current: ContextVar[Optional[RequestProfile]] = ContextVar(
+    "request_profile", default=None
+)
+
+
+def start() -> Any:
+    return _current.set(RequestProfile())
+
+
+def stop(token: Any) -> None:
+    _current.reset(token)
+
+
+def current() -> Optional[RequestProfile]:
+    return _current.get()
+
+
+def timed(name: str) -> Callable:
+    """
+    Add the wrapped call's duration to the active profile under name.
+    A single ContextVar lookup when the request is not sampled.
+    """
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            profile = _current.get()
+            if profile is None:
+                return func(*args, **kwargs)
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                profile.add(name, time.perf_counter() - started)
+
+        return wrapper
+
+    return decorator
+
+
+def timed_cache_get(func: Callable) -> Callable:
+    """
+    timed("cache") that also counts hits and misses of cache.get.
+    """
+
+    @wraps(func)
+    def wrapper(self, key, default=None, *args, **kwargs):
+        profile = _current.get()
+        if profile is None:
+            return func(self, key, default, *args, **kwargs)
+        started = time.perf_counter()
+        value = func(self, key, default, *args, **kwargs)
+        profile.add("cache", time.perf_counter() - started)
+        profile.incr("cache_hit" if value is not default else "cache_miss")
+        return value
+
+    return wrapper
+
+
+def sql_wrapper(execute, sql, params, many, context):
+    """
+    connection.execute_wrapper hook timing every query of the request.
+    """
+    profile = _current.get()
+    if profile is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        profile.add("db", time.perf_counter() - started)
@@ -9,6 +9,9 @@ from django.core.cache import cache
 from rest_framework.response import Response as DRFResponse
 from rest_framework.status import HTTP_429_TOO_MANY_REQUESTS
 
+# Project modules
+from apps.abstract import metrics
+
 
 def get_client_ip(request):
     x_forwarded_for = request.META.get("HTTP_X_FORWARDED_FOR")
@@ -53,6 +56,7 @@ def ratelimit(key_func, rate, method="ALL"):
                 cache.set(cache_key, data, remaining_time)
                 return func(self, request, *args, **kwargs)
 
+            metrics.RATELIMIT_REJECTIONS.labels(metrics.get_view_label(request)).inc()
             return DRFResponse(
                 data={"detail": "Too many requests. Try again later."},
                 status=HTTP_429_TOO_MANY_REQUESTS,
@@ -0,0 +1,78 @@
+# Third-party modules
+from rest_framework import renderers
+from rest_framework.utils import encoders
+from rest_framework.settings import api_settings
+
+# Project modules
+from apps.abstract import profiling
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Constants
+SHORT_SEPARATORS = (",", ":")
+ORJSON_OPTIONS = (
+    orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME if orjson else 0
+)
+LINE_SEPARATOR = "\u2028".encode()
+PARAGRAPH_SEPARATOR = "\u2029".encode()
+
+# DRF's encoder defines the wire format of datetimes, Decimals, UUIDs,
+# lazy strings and querysets; orjson defers to it for every such value
+_drf_encoder = encoders.JSONEncoder()
+
+
+class JSONRenderer(renderers.JSONRenderer):
+    """
+    Drop-in replacement of rest_framework's JSONRenderer.
+
+    Compact responses are encoded with orjson when it is installed,
+    otherwise with a reused C encoder that skips the per call setup and
+    circular reference checks of json.dumps. Pretty printed responses
+    (indent=N, browsable API) go through the stock renderer.
+
+    Output matches the stock renderer, except that orjson writes NaN and
+    Infinity as null instead of raising.
+    """
+
+    use_orjson = orjson is not None
+    stdlib_encoder = encoders.JSONEncoder(
+        ensure_ascii=not api_settings.UNICODE_JSON,
+        allow_nan=not api_settings.STRICT_JSON,
+        separators=SHORT_SEPARATORS,
+        check_circular=False,
+    )
+
+    @profiling.timed("render")
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        renderer_context = renderer_context or {}
+        indent = self.get_indent(accepted_media_type, renderer_context)
+        if indent is not None or not self.compact:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        if self.use_orjson and not self.ensure_ascii:
+            try:
+                ret = orjson.dumps(
+                    data,
+                    default=_drf_encoder.default,
+                    option=ORJSON_OPTIONS,
+                )
+            except orjson.JSONEncodeError:
+                # e.g. integers wider than 64 bits, left to the stdlib
+                pass
+            else:
+                # Same JavaScript-safe escaping as the stock renderer
+                if LINE_SEPARATOR in ret or PARAGRAPH_SEPARATOR in ret:
+                    ret = ret.replace(LINE_SEPARATOR, b"\\u2028").replace(
+                        PARAGRAPH_SEPARATOR, b"\\u2029"
+                    )
+                return ret
+
+        ret = self.stdlib_encoder.encode(data)
+        ret = ret.replace("\u2028", "\\u2028").replace("\u2029", "\\u2029")
+        return ret.encode()
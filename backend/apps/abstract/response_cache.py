@@ -0,0 +1,165 @@
+# Python modules
+from functools import wraps
+import gzip
+import logging
+
+# Django modules
+from django.http import HttpResponse
+from django.utils.cache import patch_vary_headers
+
+# Project modules
+from apps.abstract.cache import get_or_rebuild, get_many_fresh, STALE_TIMEOUT
+from apps.abstract import surrogate
+
+logger = logging.getLogger(__name__)
+
+# Constants
+RESPONSE_CACHE_KEY = "response:{group}:{host}{path}"
+GZIP_MIN_LENGTH = 512
+GZIP_LEVEL = 6
+
+
+class _UncacheableResponse(Exception):
+    """Carries a response that must not be stored out of the rebuild."""
+
+    def __init__(self, response):
+        self.response = response
+
+
+def get_response_cache_key(group, request):
+    # Paginated payloads embed absolute links, so the host is part of the key
+    return RESPONSE_CACHE_KEY.format(
+        group=group,
+        host=request.get_host(),
+        path=request.get_full_path(),
+    )
+
+
+def get_cached_entries(group, host, paths):
+    """
+    Fresh cached responses of the given paths, keyed by path.
+    Lets aggregate endpoints reuse entries built by single object views.
+    """
+    keys = {
+        RESPONSE_CACHE_KEY.format(group=group, host=host, path=path): path
+        for path in paths
+    }
+    return {
+        keys[key]: entry for key, entry in get_many_fresh(list(keys)).items()
+    }
+
+
+def is_cached(group, request):
+    """
+    Whether a fresh response for this request is cached, without
+    building anything. Lets ConcurrencyLimitMiddleware admit cheap hits.
+    """
+    return bool(get_many_fresh([get_response_cache_key(group, request)]))
+
+
+def accepts_gzip(request):
+    return "gzip" in request.META.get("HTTP_ACCEPT_ENCODING", "")
+
+
+def build_cached_response(entry, request):
+    """
+    Build an HttpResponse straight from cached bytes, no rendering involved.
+    """
+    if entry["gzip"] is not None and accepts_gzip(request):
+        response = HttpResponse(entry["gzip"], content_type=entry["content_type"])
+        response["Content-Encoding"] = "gzip"
+    else:
+        response = HttpResponse(entry["body"], content_type=entry["content_type"])
+
+    response.status_code = entry["status"]
+    response["Content-Length"] = str(len(response.content))
+    if entry["surrogate_keys"]:
+        response[surrogate.SURROGATE_KEY_HEADER] = " ".join(entry["surrogate_keys"])
+    patch_vary_headers(response, ("Accept", "Accept-Encoding", "Authorization"))
+    return response
+
+
+def render_entry(view, request, response):
+    """
+    Render a DRF response once and keep its JSON bytes plus a gzip variant.
+    Views list what the payload depends on in response.surrogate_keys.
+    """
+    surrogate_keys = sorted(set(getattr(response, "surrogate_keys", ())))
+    response = view.finalize_response(request, response)
+    response.render()
+    body = response.content
+    return {
+        "status": response.status_code,
+        "content_type": response["Content-Type"],
+        "body": body,
+        "gzip": (
+            gzip.compress(body, compresslevel=GZIP_LEVEL)
+            if len(body) >= GZIP_MIN_LENGTH
+            else None
+        ),
+        "surrogate_keys": surrogate_keys,
+    }
+
+
+def cache_response(group, timeout=60):
+    """
+    Cache the rendered JSON of a public GET endpoint.
+
+    Applies to anonymous GET requests that negotiated the JSON renderer.
+    Hits are written straight into the response honoring Accept-Encoding,
+    misses are rebuilt with stampede protection (see get_or_rebuild).
+    Entries are tagged with the response's surrogate keys and purged
+    through apps.abstract.surrogate when the underlying rows change.
+
+    Args:
+        group: Namespace of the cache keys
+        timeout: Freshness in seconds
+    """
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(self, request, *args, **kwargs):
+            if (
+                request.method != "GET"
+                or request.user.is_authenticated
+                or request.accepted_renderer.format != "json"
+            ):
+                return func(self, request, *args, **kwargs)
+
+            cache_key = get_response_cache_key(group, request)
+            built = []
+
+            def build_entry():
+                built.append(True)
+                response = func(self, request, *args, **kwargs)
+                if response.status_code != 200:
+                    raise _UncacheableResponse(response)
+                entry = render_entry(self, request, response)
+                surrogate.tag(
+                    cache_key,
+                    entry["surrogate_keys"],
+                    timeout + STALE_TIMEOUT,
+                )
+                return entry
+
+            try:
+                entry = get_or_rebuild(cache_key, build_entry, timeout)
+            except _UncacheableResponse as e:
+                if built:
+                    return e.response
+                # Raised by another request's build: the response object is
+                # its own, render ours
+                return func(self, request, *args, **kwargs)
+
+            response = build_cached_response(entry, request)
+            response["X-Cache"] = "MISS" if built else "HIT"
+            # finalize_response copies the view headers over ours
+            self.headers["Vary"] = response["Vary"]
+            return response
+
+        # Read by ConcurrencyLimitMiddleware before the view runs
+        wrapper.response_cache_group = group
+        return wrapper
+
+    return decorator
+
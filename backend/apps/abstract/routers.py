@@ -0,0 +1,66 @@
+# Python modules
+from contextvars import ContextVar
+import random
+
+# Django modules
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+
+_pinned_to_primary: ContextVar[bool] = ContextVar("pinned_to_primary", default=False)
+
+
+def pin_to_primary(pinned: bool = True):
+    """
+    Route every read of the current context to the primary.
+
+    Returns:
+        Token to pass to unpin
+    """
+    return _pinned_to_primary.set(pinned)
+
+
+def unpin(token) -> None:
+    _pinned_to_primary.reset(token)
+
+
+def is_pinned_to_primary() -> bool:
+    return _pinned_to_primary.get()
+
+
+class PrimaryReplicaRouter:
+    """
+    Database router for a primary with read replicas.
+
+    Reads of settings.REPLICATED_MODELS go to a random alias from
+    settings.DATABASE_REPLICAS, unless the current request is pinned
+    to the primary (see PrimaryStickinessMiddleware). Everything else,
+    and every write, goes to the default database.
+    """
+
+    def __init__(self) -> None:
+        self.replicas = list(getattr(settings, "DATABASE_REPLICAS", []))
+        self.replicated_models = {
+            label.lower() for label in getattr(settings, "REPLICATED_MODELS", [])
+        }
+        self.pool = {DEFAULT_DB_ALIAS, *self.replicas}
+
+    def db_for_read(self, model, **hints):
+        if (
+            not self.replicas
+            or model._meta.label_lower not in self.replicated_models
+            or is_pinned_to_primary()
+        ):
+            return DEFAULT_DB_ALIAS
+        return random.choice(self.replicas)
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        if obj1._state.db in self.pool and obj2._state.db in self.pool:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # Replicas receive the schema through replication (or sync_replica)
+        return db == DEFAULT_DB_ALIAS
@@ -0,0 +1,17 @@
+# Django modules
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+# Project modules
+from apps.abstract.db.sqlite3.base import apply_pragmas
+
+
+@receiver(connection_created)
+def apply_sqlite_pragmas(sender, connection, **kwargs):
+    """
+    Apply the PRAGMAS of a SQLite database entry to every new connection.
+    """
+    pragmas = connection.settings_dict.get("PRAGMAS")
+    if connection.vendor == "sqlite" and pragmas:
+        with connection.cursor() as cursor:
+            apply_pragmas(cursor, pragmas)
@@ -0,0 +1,158 @@
+# Python modules
+from contextvars import ContextVar
+from hashlib import sha1
+from typing import Any, Optional
+import json
+import logging
+import re
+import time
+
+# Django modules
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+# JSONL records only, routed to their own rotating file in LOGGING
+record_logger = logging.getLogger("slow_queries")
+
+# Constants
+MAX_SQL_LENGTH = 4000
+# Bound on the per-process memo of already explained statements
+MAX_EXPLAINED = 2000
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PARAM_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_SPACE = re.compile(r"\s+")
+# SQLite "SCAN blog_post" / "SCAN TABLE blog_post" and PostgreSQL
+# "Seq Scan on blog_post", but not index scans "SCAN x USING INDEX"
+_FULL_SCAN = re.compile(r"\b(?:SCAN(?: TABLE)?|Seq Scan on) (\w+)\b(?! USING)")
+
+_explaining: ContextVar[bool] = ContextVar("explaining_query", default=False)
+# sql -> (plan, full scans), shared by the threads of a process
+_explained: dict[str, tuple[list[str], list[str]]] = {}
+# Fingerprints whose full scan was already reported by this process
+_reported: set[str] = set()
+
+
+def fingerprint(sql: str) -> str:
+    """
+    Normalize a statement so every execution of the same query shape,
+    whatever its literals or IN list length, gets the same text.
+    """
+    sql = _STRING.sub("?", sql)
+    sql = _NUMBER.sub("?", sql.replace("%s", "?"))
+    sql = _PARAM_LIST.sub("(...)", sql)
+    return _SPACE.sub(" ", sql).strip()
+
+
+def fingerprint_id(normalized: str) -> str:
+    return sha1(normalized.encode()).hexdigest()[:12]
+
+
+def get_full_scans(plan: list[str]) -> list[str]:
+    return sorted({table for line in plan for table in _FULL_SCAN.findall(line)})
+
+
+def explain(connection, sql: str, params: Any) -> list[str]:
+    """
+    Plan of a SELECT through the backend's own EXPLAIN prefix
+    (EXPLAIN QUERY PLAN on SQLite). Empty when it cannot be explained.
+    """
+    if not sql.lstrip()[:6].upper().startswith(("SELECT", "WITH")):
+        return []
+    if connection.needs_rollback:
+        return []
+
+    token = _explaining.set(True)
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(f"{connection.ops.explain_query_prefix()} {sql}", params)
+            return [str(row[-1]) for row in cursor.fetchall()]
+    except Exception as e:
+        logger.debug(f"Could not explain query: {e}")
+        return []
+    finally:
+        _explaining.reset(token)
+
+
+class SlowQueryRecorder:
+    """
+    connection.execute_wrapper hook of one request.
+
+    Queries slower than THRESHOLD_MS are written to the slow query log.
+    With EXPLAIN on, slow queries carry their plan, every distinct
+    statement is also explained once per process, and a full scan of a
+    WATCHED_TABLES table is logged the first time it is seen, however
+    fast it ran on today's data. EXPLAIN runs inline on the request's
+    connection, so it is off by default.
+    """
+
+    def __init__(self, request, connection, config: dict[str, Any]) -> None:
+        self.request = request
+        self.connection = connection
+        self.threshold = config.get("THRESHOLD_MS", 100) / 1000
+        self.use_explain = config.get("EXPLAIN", False)
+        self.watched_tables = set(config.get("WATCHED_TABLES", ()))
+
+    def __call__(self, execute, sql, params, many, context):
+        if _explaining.get():
+            return execute(sql, params, many, context)
+
+        started = time.perf_counter()
+        result = execute(sql, params, many, context)
+        if not many:
+            self.inspect(sql, params, time.perf_counter() - started)
+        return result
+
+    def inspect(self, sql: str, params: Any, elapsed: float) -> None:
+        plan: Optional[list[str]] = None
+        full_scans: list[str] = []
+
+        if self.use_explain and self.watched_tables and sql not in _explained:
+            plan = explain(self.connection, sql, params)
+            full_scans = get_full_scans(plan)
+            if len(_explained) >= MAX_EXPLAINED:
+                _explained.clear()
+            _explained[sql] = (plan, full_scans)
+
+            watched = self.watched_tables.intersection(full_scans)
+            if watched and elapsed < self.threshold:
+                normalized = fingerprint(sql)
+                if normalized not in _reported:
+                    _reported.add(normalized)
+                    self.write(sql, elapsed, plan, full_scans, reason="full_scan")
+                    logger.warning(
+                        f"Full scan of {', '.join(sorted(watched))} "
+                        f"in {self.get_view()}: {normalized[:200]}"
+                    )
+
+        if elapsed < self.threshold:
+            return
+        if plan is None:
+            plan, full_scans = _explained.get(sql) or ([], [])
+            if not plan and self.use_explain:
+                plan = explain(self.connection, sql, params)
+                full_scans = get_full_scans(plan)
+        self.write(sql, elapsed, plan, full_scans, reason="slow")
+
+    def get_view(self) -> str:
+        match = getattr(self.request, "resolver_match", None)
+        return getattr(match, "view_name", None) or "unmatched"
+
+    def write(self, sql, elapsed, plan, full_scans, reason) -> None:
+        normalized = fingerprint(sql)
+        record = {
+            "ts": timezone.now().isoformat(),
+            "reason": reason,
+            "view": self.get_view(),
+            "method": self.request.method,
+            "path": self.request.path,
+            "db": self.connection.alias,
+            "duration_ms": round(elapsed * 1000, 2),
+            "fingerprint_id": fingerprint_id(normalized),
+            "fingerprint": normalized[:MAX_SQL_LENGTH],
+            "sql": sql[:MAX_SQL_LENGTH],
+            "plan": plan,
+            "full_scans": full_scans,
+        }
+        record_logger.info(json.dumps(record))
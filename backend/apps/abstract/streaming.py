@@ -0,0 +1,59 @@
+# Python modules
+from itertools import islice
+from typing import AsyncIterator, Callable, ContextManager, Iterator, Optional
+
+# Third-party modules
+from asgiref.sync import sync_to_async
+
+# Constants
+# Chunks of a streaming body read per worker thread hop under ASGI
+BATCH_SIZE = 500
+
+
+def instrument(
+    response,
+    watch: Callable[[], ContextManager],
+    on_finish: Optional[Callable[[], None]] = None,
+) -> None:
+    """
+    Run the body of a streaming response under watch() as well.
+
+    A streaming body runs its queries after the middleware chain has
+    returned, outside the execute_wrapper hooks the middleware installed
+    around the view. Each chunk is produced under a fresh watch() so the
+    hooks are installed on the connection of whichever thread reads it.
+
+    Args:
+        watch: Returns the context installing the middleware's hooks
+        on_finish: Called once the body is exhausted or closed
+    """
+
+    if not response.streaming or response.is_async:
+        return
+
+    content = response.streaming_content
+
+    def iterate() -> Iterator[bytes]:
+        try:
+            while True:
+                with watch():
+                    chunk = next(content, None)
+                if chunk is None:
+                    return
+                yield chunk
+        finally:
+            if on_finish is not None:
+                on_finish()
+
+    response.streaming_content = iterate()
+
+
+async def aiter_batches(content: Iterator[bytes], size=BATCH_SIZE) -> AsyncIterator[bytes]:
+    """
+    Async version of a sync streaming body, read size chunks at a time
+    in the request's thread so database connections stay the same.
+    """
+
+    read = sync_to_async(lambda: list(islice(content, size)), thread_sensitive=True)
+    while chunks := await read():
+        yield b"".join(chunks)
@@ -0,0 +1,79 @@
+# Python modules
+from typing import Iterable
+import logging
+
+# Django modules
+from django.core.cache import cache
+from django.db import transaction
+
+# Project modules
+from apps.abstract.cache import expire
+
+logger = logging.getLogger(__name__)
+
+# Constants
+SURROGATE_SET_KEY = "surrogate:{key}"
+SURROGATE_KEY_HEADER = "Surrogate-Key"
+
+
+def tag(cache_key: str, surrogate_keys: Iterable[str], timeout: int) -> None:
+    """
+    Record that cache_key depends on every surrogate key.
+    Each surrogate key is a Redis set of cache keys living as long
+    as the longest entry added to it.
+
+    Args:
+        cache_key: Key of the cached entry
+        surrogate_keys: Keys such as "post:1", "author:2", "tag:3"
+        timeout: Lifetime of the cached entry in seconds
+    Returns:
+        None
+    """
+
+    for surrogate_key in set(surrogate_keys):
+        set_key = SURROGATE_SET_KEY.format(key=surrogate_key)
+        cache.sadd(set_key, cache_key)
+        ttl = cache.ttl(set_key)
+        if ttl is None or ttl < timeout:
+            cache.expire(set_key, timeout)
+
+
+def purge(*surrogate_keys: str) -> int:
+    """
+    Expire every cached entry tagged with one of the surrogate keys.
+    Entries stay readable while a single worker rebuilds them, see
+    apps.abstract.cache.expire.
+
+    Returns:
+        Number of cache keys purged
+    """
+
+    set_keys = [SURROGATE_SET_KEY.format(key=key) for key in set(surrogate_keys)]
+    try:
+        cache_keys = set()
+        for set_key in set_keys:
+            cache_keys.update(
+                key.decode() if isinstance(key, bytes) else key
+                for key in cache.smembers(set_key)
+            )
+
+        if cache_keys:
+            expire(*cache_keys)
+        cache.delete_many(set_keys)
+    except Exception as e:
+        logger.error(f"Failed to purge surrogate keys: {e}", exc_info=True)
+        return 0
+
+    logger.info(
+        f"Expired {len(cache_keys)} cached entries for surrogate keys: "
+        f"{' '.join(sorted(surrogate_keys))}"
+    )
+    return len(cache_keys)
+
+
+def purge_on_commit(*surrogate_keys: str) -> None:
+    """
+    Purge once the current transaction commits, immediately outside one.
+    """
+
+    transaction.on_commit(lambda: purge(*surrogate_keys))
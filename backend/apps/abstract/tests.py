@@ -1,3 +1,344 @@
-from django.test import TestCase
+# Python modules
+from base64 import urlsafe_b64encode
+from datetime import timedelta
+from io import StringIO
 
-# Create your tests here.
+# Third-party modules
+from rest_framework.exceptions import ValidationError
+from rest_framework.request import Request
+
+# Django modules
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import MiddlewareNotUsed
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.http import HttpResponse
+from django.urls import resolve, reverse
+from django.utils import timezone
+
+# Project modules
+from apps.abstract import surrogate
+from apps.abstract.cache import get_many_fresh, get_or_rebuild
+from apps.abstract.concurrency import WARMUP_SAMPLES, AdaptiveLimiter
+from apps.abstract.middleware import ConcurrencyLimitMiddleware
+from apps.abstract.sync import (
+    MAX_PAGE_SIZE,
+    PAGE_SIZE,
+    decode_token,
+    encode_token,
+    get_page_size,
+)
+from apps.blog.models import Comment, Post, Tag
+from apps.users.models import CustomUser
+
+# Constants
+FAST_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
+
+class SyncTokenTests(SimpleTestCase):
+    def get_request(self, **params):
+        return Request(RequestFactory().get("/", params))
+
+    def test_token_round_trip(self):
+        key = (timezone.now(), 42)
+        issued_at = timezone.now()
+
+        self.assertEqual(decode_token(encode_token(key, issued_at)), (key, issued_at))
+
+    def test_token_is_opaque(self):
+        token = encode_token((timezone.now(), 42), timezone.now())
+
+        self.assertRegex(token, r"^[A-Za-z0-9_-]+$")
+
+    def test_invalid_token_is_a_validation_error(self):
+        missing_field = urlsafe_b64encode(b"1700000000000000:42").decode()
+        for token in ("", "not-a-token", missing_field):
+            with self.subTest(token=token), self.assertRaises(ValidationError):
+                decode_token(token)
+
+    def test_page_size(self):
+        self.assertEqual(get_page_size(self.get_request()), PAGE_SIZE)
+        self.assertEqual(get_page_size(self.get_request(limit=10)), 10)
+        self.assertEqual(
+            get_page_size(self.get_request(limit=MAX_PAGE_SIZE + 1)), MAX_PAGE_SIZE
+        )
+
+    def test_invalid_page_size(self):
+        for limit in ("0", "-1", "ten"):
+            with self.subTest(limit=limit), self.assertRaises(ValidationError):
+                get_page_size(self.get_request(limit=limit))
+
+
+@override_settings(PASSWORD_HASHERS=FAST_HASHERS)
+class PurgeDeletedTests(TestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(
+            email="author@example.com",
+            first_name="Test",
+            last_name="User",
+            password="test-password",
+        )
+        self.tag = Tag.objects.create(name="Tag", slug="tag")
+        self.old = self.create_post("Old tombstone")
+        self.recent = self.create_post("Recent tombstone")
+        self.live = self.create_post("Live")
+        # A soft-deleted comment is purged along with its post too
+        self.old.comments.first().delete()
+
+        self.old.delete()
+        self.recent.delete()
+        Post.objects.filter(pk=self.old.pk).update(
+            deleted_at=timezone.now() - timedelta(days=40)
+        )
+
+    def create_post(self, title):
+        post = Post.objects.create(author=self.user, title=title, body="Body")
+        post.tags.add(self.tag)
+        for i in range(3):
+            Comment.objects.create(post=post, author=self.user, body=f"Comment {i}")
+        return post
+
+    def purge(self, **options):
+        stdout = StringIO()
+        call_command("purge_deleted", sleep=0, stdout=stdout, **options)
+        return stdout.getvalue()
+
+    def test_purges_old_tombstones_with_their_cascade(self):
+        self.purge(batch_size=1)
+
+        self.assertQuerySetEqual(Post.objects.order_by("id"), [self.recent, self.live])
+        self.assertFalse(Comment.objects.filter(post_id=self.old.pk).exists())
+        self.assertFalse(Post.tags.through.objects.filter(post_id=self.old.pk).exists())
+        self.assertEqual(Comment.objects.count(), 6)
+        self.assertEqual(CustomUser.objects.count(), 1)
+
+    def test_dry_run_counts_the_cascade_without_deleting(self):
+        output = self.purge(dry_run=True)
+
+        self.assertIn("blog.Post=1, blog.Post_tags=1, blog.Comment=3", output)
+        self.assertEqual(Post.objects.count(), 3)
+        self.assertEqual(Comment.objects.count(), 9)
+
+    def test_older_than(self):
+        self.purge(older_than="0s")
+
+        self.assertQuerySetEqual(Post.objects.all(), [self.live])
+
+    def test_invalid_arguments(self):
+        for options in ({"older_than": "month"}, {"batch_size": 0}):
+            with self.subTest(**options), self.assertRaises(CommandError):
+                self.purge(**options)
+
+
+class SurrogateKeyTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        for key, keys in (
+            ("response:a", {"post:1", "author:1"}),
+            ("response:b", {"post:2", "author:1"}),
+            ("response:c", {"post:3"}),
+        ):
+            get_or_rebuild(key, lambda key=key: key.upper(), 60)
+            surrogate.tag(key, keys, 60)
+
+    def get_fresh(self):
+        return set(get_many_fresh(["response:a", "response:b", "response:c"]))
+
+    def test_purge_expires_every_tagged_entry(self):
+        self.assertEqual(surrogate.purge("author:1"), 2)
+
+        self.assertEqual(self.get_fresh(), {"response:c"})
+
+    def test_purged_entries_are_served_stale_until_rebuilt(self):
+        surrogate.purge("post:1")
+
+        # Still there for concurrent readers, rebuilt by the next one
+        self.assertEqual(cache.get("response:a")["value"], "RESPONSE:A")
+        self.assertEqual(get_or_rebuild("response:a", lambda: "rebuilt", 60), "rebuilt")
+
+    def test_purge_of_unknown_keys(self):
+        self.assertEqual(surrogate.purge("post:4"), 0)
+
+        self.assertEqual(len(self.get_fresh()), 3)
+
+    def test_purge_on_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            surrogate.purge_on_commit("post:2")
+            self.assertEqual(len(self.get_fresh()), 3)
+
+        self.assertEqual(self.get_fresh(), {"response:a", "response:c"})
+
+
+class AdaptiveLimiterTests(SimpleTestCase):
+    def setUp(self):
+        self.limiter = AdaptiveLimiter(
+            initial_limit=10, min_limit=4, max_limit=12, cooldown=60
+        )
+
+    def fill(self, count):
+        for _ in range(count):
+            self.assertTrue(self.limiter.try_acquire("critical"))
+
+    def warm_up(self, route="posts:miss", latency=0.01):
+        for _ in range(WARMUP_SAMPLES):
+            self.limiter.try_acquire("critical")
+            self.limiter.release(route, latency)
+
+    def test_lower_priorities_get_a_smaller_share(self):
+        for priority, admitted in (
+            ("low", 5),
+            ("normal", 8),
+            ("high", 10),
+            ("critical", 20),
+        ):
+            with self.subTest(priority):
+                limiter = AdaptiveLimiter(initial_limit=10)
+                results = [limiter.try_acquire(priority) for _ in range(20)]
+                self.assertEqual(results.count(True), admitted)
+
+    def test_release_frees_a_slot(self):
+        self.fill(10)
+        self.assertFalse(self.limiter.try_acquire("high"))
+
+        self.limiter.release("posts:miss", 0.01)
+
+        self.assertTrue(self.limiter.try_acquire("high"))
+
+    def test_slow_requests_under_load_back_off(self):
+        self.warm_up()
+        self.fill(6)
+
+        self.limiter.release("posts:miss", 1.0)
+
+        self.assertAlmostEqual(self.limiter.limit, 9.0)
+
+    def test_failures_under_load_back_off(self):
+        self.fill(6)
+
+        self.limiter.release("posts:miss", 0.01, failed=True)
+
+        self.assertAlmostEqual(self.limiter.limit, 9.0)
+
+    def test_backs_off_once_per_cooldown(self):
+        self.warm_up()
+        self.fill(8)
+
+        self.limiter.release("posts:miss", 1.0)
+        self.limiter.release("posts:miss", 1.0)
+
+        self.assertAlmostEqual(self.limiter.limit, 9.0)
+
+    def test_slow_requests_without_load_keep_the_limit(self):
+        self.warm_up()
+        self.fill(1)
+
+        self.limiter.release("posts:miss", 1.0)
+
+        self.assertEqual(self.limiter.limit, 10.0)
+
+    def test_fast_requests_under_load_grow_the_limit(self):
+        self.warm_up()
+        self.fill(6)
+
+        self.limiter.release("posts:miss", 0.01)
+
+        self.assertAlmostEqual(self.limiter.limit, 10.1)
+
+    def test_limit_stays_within_bounds(self):
+        for _ in range(50):
+            self.fill(10)
+            for _ in range(10):
+                self.limiter.release("posts:miss", 0.01)
+        self.assertEqual(self.limiter.limit, 12)
+
+        for _ in range(50):
+            self.limiter.last_decrease = 0.0
+            self.fill(6)
+            for _ in range(6):
+                self.limiter.release("posts:miss", 0.01, failed=True)
+        self.assertEqual(self.limiter.limit, 4)
+
+    def test_congestion_does_not_become_the_baseline(self):
+        self.warm_up()
+        for _ in range(100):
+            self.fill(1)
+            self.limiter.release("posts:miss", 1.0)
+
+        baseline, _ = self.limiter.baselines["posts:miss"]
+        self.assertLess(baseline, 0.2)
+
+
+@override_settings(
+    PASSWORD_HASHERS=FAST_HASHERS,
+    CONCURRENCY_LIMIT={
+        **settings.CONCURRENCY_LIMIT,
+        "ENABLED": True,
+        "INITIAL_LIMIT": 4,
+        "MIN_LIMIT": 4,
+    },
+)
+class ConcurrencyLimitMiddlewareTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.middleware = ConcurrencyLimitMiddleware(lambda request: HttpResponse())
+        self.limiter = self.middleware.limiter
+        user = CustomUser.objects.create_user(
+            email="author@example.com",
+            first_name="Test",
+            last_name="User",
+            password="test-password",
+        )
+        self.post = Post.objects.create(
+            author=user, title="Post", body="Body", status=Post.Status.PUBLISHED
+        )
+        self.path = reverse("post-detail", kwargs={"slug": self.post.slug})
+
+    def process(self, method="get", path=None):
+        path = path or self.path
+        request = getattr(RequestFactory(), method)(path)
+        request.resolver_match = match = resolve(path)
+        return request, self.middleware.process_view(
+            request, match.func, match.args, match.kwargs
+        )
+
+    def test_sheds_with_retry_after_when_saturated(self):
+        self.limiter.inflight = 4
+
+        _, response = self.process()
+
+        self.assertEqual(response.status_code, 503)
+        self.assertGreaterEqual(int(response["Retry-After"]), 1)
+
+    def test_writes_are_shed_before_reads(self):
+        self.limiter.inflight = 2
+
+        _, write = self.process("post", reverse("post-list"))
+        _, read = self.process()
+
+        self.assertEqual(write.status_code, 503)
+        self.assertIsNone(read)
+
+    def test_cached_reads_are_served_when_saturated(self):
+        self.assertEqual(self.client.get(self.path)["X-Cache"], "MISS")
+        self.limiter.inflight = 4
+
+        _, response = self.process()
+
+        self.assertIsNone(response)
+        self.assertEqual(self.limiter.inflight, 5)
+
+    def test_admitted_request_is_released(self):
+        request, response = self.process()
+        self.assertIsNone(response)
+        self.assertEqual(self.limiter.inflight, 1)
+
+        self.middleware(request)
+
+        self.assertEqual(self.limiter.inflight, 0)
+
+    def test_disabled(self):
+        with override_settings(CONCURRENCY_LIMIT={"ENABLED": False}):
+            with self.assertRaises(MiddlewareNotUsed):
+                ConcurrencyLimitMiddleware(lambda request: HttpResponse())
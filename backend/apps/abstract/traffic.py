@@ -0,0 +1,96 @@
+# Python modules
+from logging.handlers import QueueListener, RotatingFileHandler
+from queue import Full, Queue
+from threading import Lock
+from typing import Any, Optional
+import atexit
+import json
+import logging
+import os
+
+# Django modules
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# Constants
+# Records waiting for the writer thread, beyond that they are dropped
+# rather than slowing requests down
+MAX_PENDING = 10_000
+
+
+class JSONLineFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        return json.dumps(record.msg, separators=(",", ":"))
+
+
+class TrafficRecorder:
+    """
+    Append request records to a rotating JSONL file from a background
+    thread. Requests only pay for a non-blocking queue put, encoding
+    and disk writes happen on the QueueListener thread.
+    """
+
+    def __init__(self, path: str, max_bytes: int = 0, backup_count: int = 0) -> None:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        handler = RotatingFileHandler(
+            path, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8"
+        )
+        handler.setFormatter(JSONLineFormatter())
+        self.path = path
+        self.dropped = 0
+        self.queue: Queue = Queue(maxsize=MAX_PENDING)
+        self.listener = QueueListener(self.queue, handler)
+        self.listener.start()
+        atexit.register(self.close)
+
+    def record(self, data: dict[str, Any]) -> None:
+        try:
+            self.queue.put_nowait(logging.makeLogRecord({"msg": data}))
+        except Full:
+            self.dropped += 1
+            if self.dropped % 1000 == 1:
+                logger.warning(f"Traffic capture queue full, {self.dropped} dropped")
+
+    def close(self) -> None:
+        # Flushes what is still queued
+        if self.listener._thread is not None:
+            self.listener.stop()
+
+
+_recorder: Optional[TrafficRecorder] = None
+_recorder_lock = Lock()
+
+
+def get_recorder() -> TrafficRecorder:
+    """
+    The process-wide recorder, created on first use so each worker
+    process gets its own writer thread and, with "{pid}" in FILE, its
+    own file.
+    """
+    global _recorder
+    if _recorder is None:
+        with _recorder_lock:
+            if _recorder is None:
+                config = getattr(settings, "TRAFFIC_CAPTURE", {})
+                _recorder = TrafficRecorder(
+                    config.get("FILE", "logs/traffic-{pid}.jsonl").format(pid=os.getpid()),
+                    max_bytes=config.get("MAX_BYTES", 0),
+                    backup_count=config.get("BACKUP_COUNT", 0),
+                )
+    return _recorder
+
+
+def get_identity(request) -> str:
+    """
+    Class of the caller, enough to replay with a comparable token
+    without recording who it was. DRF sets request.user on the Django
+    request once it has authenticated the JWT.
+    """
+    user = getattr(request, "user", None)
+    if user is None or not user.is_authenticated:
+        return "anonymous"
+    return "staff" if user.is_staff else "user"
@@ -0,0 +1,216 @@
+# Python modules
+from contextlib import ExitStack
+from threading import Thread
+from typing import Optional
+import http.client
+import math
+import re
+import socket
+import time
+
+# Django modules
+from django.db import connections
+from django.test import Client
+
+# Constants
+# Query count reported by ProfilingMiddleware, see apps.abstract.profiling
+SERVER_TIMING_QUERIES = re.compile(r'(?:^|,\s*)db;dur=[\d.]+;desc="(\d+) queries"')
+SERVER_START_TIMEOUT = 10
+
+
+def percentile(values: list[float], q: float) -> float:
+    """
+    Nearest-rank percentile of an already sorted list.
+    """
+    if not values:
+        return 0.0
+    return values[max(0, math.ceil(q / 100 * len(values)) - 1)]
+
+
+def summarize(latencies: list[float]) -> dict[str, float]:
+    """
+    p50/p95/p99, mean and max of latencies in seconds, in milliseconds.
+    """
+    values = sorted(latencies)
+    return {
+        "p50": round(percentile(values, 50) * 1000, 3),
+        "p95": round(percentile(values, 95) * 1000, 3),
+        "p99": round(percentile(values, 99) * 1000, 3),
+        "mean": round(sum(values) / len(values) * 1000, 3) if values else 0.0,
+        "max": round(values[-1] * 1000, 3) if values else 0.0,
+    }
+
+
+def get_query_count(server_timing: Optional[str]) -> int:
+    match = SERVER_TIMING_QUERIES.search(server_timing or "")
+    return int(match.group(1)) if match else 0
+
+
+def drain_counting_queries(response) -> int:
+    """
+    Consume a streaming response, returning the SQL queries its body ran.
+    Server-Timing is built before the body streams, so it misses them.
+    """
+    queries = 0
+
+    def count_query(execute, sql, params, many, context):
+        nonlocal queries
+        queries += 1
+        return execute(sql, params, many, context)
+
+    with ExitStack() as stack:
+        for alias in connections:
+            stack.enter_context(connections[alias].execute_wrapper(count_query))
+        for _ in response.streaming_content:
+            pass
+    return queries
+
+
+class ClientRunner:
+    """
+    Send requests in-process through django.test.Client.
+    """
+
+    name = "client"
+
+    def __init__(self) -> None:
+        self.client = Client()
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        body: Optional[bytes] = None,
+        headers: Optional[dict[str, str]] = None,
+    ) -> tuple[int, float, int]:
+        """
+        Returns:
+            Status code, latency in seconds and SQL queries run
+        """
+        started = time.perf_counter()
+        response = self.client.generic(
+            method,
+            path,
+            data=body or b"",
+            content_type="application/json",
+            headers=headers,
+        )
+        queries = get_query_count(response.get("Server-Timing"))
+        if response.streaming:
+            # The body runs in this thread, so its queries can be counted here
+            queries += drain_counting_queries(response)
+        elapsed = time.perf_counter() - started
+        return response.status_code, elapsed, queries
+
+    def close(self) -> None:
+        pass
+
+
+class HttpRunner:
+    """
+    Send requests over one HTTP keep-alive connection to a running server.
+    Queries of streaming bodies run server side after Server-Timing is
+    sent and are not counted, ClientRunner counts them.
+    """
+
+    name = "http"
+
+    def __init__(self, host: str, port: int) -> None:
+        self.host = host
+        self.port = port
+        self.connection = http.client.HTTPConnection(host, port, timeout=60)
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        body: Optional[bytes] = None,
+        headers: Optional[dict[str, str]] = None,
+        retry: bool = True,
+    ) -> tuple[int, float, int]:
+        started = time.perf_counter()
+        try:
+            self.connection.request(
+                method,
+                path,
+                body=body,
+                headers={"Content-Type": "application/json", **(headers or {})},
+            )
+            response = self.connection.getresponse()
+            response.read()
+        except (http.client.HTTPException, ConnectionError):
+            if not retry:
+                raise
+            # The server closed the keep-alive connection, retry on a new one
+            self.connection.close()
+            self.connection = http.client.HTTPConnection(
+                self.host, self.port, timeout=60
+            )
+            return self.request(method, path, body, headers, retry=False)
+        elapsed = time.perf_counter() - started
+        return (
+            response.status,
+            elapsed,
+            get_query_count(response.getheader("Server-Timing")),
+        )
+
+    def close(self) -> None:
+        self.connection.close()
+
+
+class AsgiServer:
+    """
+    uvicorn serving the project's ASGI application from a thread of this
+    process, so it shares the database and settings of the caller.
+    """
+
+    def __init__(self, host: str = "127.0.0.1") -> None:
+        # Third-party modules
+        import uvicorn
+
+        # Django modules
+        from django.core.asgi import get_asgi_application
+
+        with socket.socket() as sock:
+            sock.bind((host, 0))
+            self.port = sock.getsockname()[1]
+        self.host = host
+
+        self.server = uvicorn.Server(
+            uvicorn.Config(
+                get_asgi_application(),
+                host=host,
+                port=self.port,
+                lifespan="off",
+                log_level="warning",
+                access_log=False,
+            )
+        )
+        self.thread = Thread(target=self.server.run, daemon=True)
+        self.thread.start()
+
+        deadline = time.monotonic() + SERVER_START_TIMEOUT
+        while not self.server.started:
+            if time.monotonic() > deadline or not self.thread.is_alive():
+                raise RuntimeError(f"uvicorn did not start on {host}:{self.port}")
+            time.sleep(0.05)
+
+    def close(self) -> None:
+        self.server.should_exit = True
+        self.thread.join(SERVER_START_TIMEOUT)
+
+
+class AsgiServerRunner(HttpRunner):
+    """
+    HttpRunner against its own in-process AsgiServer.
+    """
+
+    name = "asgi"
+
+    def __init__(self, host: str = "127.0.0.1") -> None:
+        self.server = AsgiServer(host)
+        super().__init__(host, self.server.port)
+
+    def close(self) -> None:
+        super().close()
+        self.server.close()
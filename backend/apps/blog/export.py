@@ -0,0 +1,150 @@
+# Python modules
+from datetime import datetime
+from typing import Any, Iterator
+import csv
+import json
+
+# Project modules
+from apps.blog.models import Post, Comment
+from apps.abstract.renderers import orjson
+
+# Constants
+DEFAULT_CHUNK_SIZE = 2000
+EXPORT_FORMATS = {
+    "jsonl": "application/x-ndjson",
+    "csv": "text/csv",
+}
+POST_COLUMNS = (
+    "id",
+    "author_id",
+    "title",
+    "slug",
+    "body",
+    "category_id",
+    "status",
+    "created_at",
+    "updated_at",
+    "deleted_at",
+)
+COMMENT_COLUMNS = (
+    "id",
+    "post_id",
+    "author_id",
+    "body",
+    "created_at",
+    "updated_at",
+    "deleted_at",
+)
+
+
+def iter_keyset(queryset, columns, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Yield .values() rows ordered by id, one bounded "id > last" query per
+    chunk, so neither the database nor this process ever holds more than
+    chunk_size rows and no OFFSET scan is needed.
+    """
+    last_id = 0
+    while True:
+        chunk = list(
+            queryset.filter(id__gt=last_id).order_by("id").values(*columns)[
+                :chunk_size
+            ]
+        )
+        if not chunk:
+            return
+        yield chunk
+        last_id = chunk[-1]["id"]
+
+
+def iter_posts(chunk_size=DEFAULT_CHUNK_SIZE) -> Iterator[dict[str, Any]]:
+    # A chunk holds every post in its id range, so one range scan over
+    # the (post_id, tag_id) index loads all of its tags
+    for chunk in iter_keyset(Post.objects.all(), POST_COLUMNS, chunk_size):
+        tags = {}
+        for post_id, tag_id in (
+            Post.tags.through.objects.filter(
+                post_id__gte=chunk[0]["id"],
+                post_id__lte=chunk[-1]["id"],
+            )
+            .order_by("post_id", "tag_id")
+            .values_list("post_id", "tag_id")
+            .iterator(chunk_size=chunk_size)
+        ):
+            tags.setdefault(post_id, []).append(tag_id)
+
+        for row in chunk:
+            row["tags"] = tags.get(row["id"], [])
+            yield row
+
+
+def iter_comments(chunk_size=DEFAULT_CHUNK_SIZE) -> Iterator[dict[str, Any]]:
+    for chunk in iter_keyset(Comment.objects.all(), COMMENT_COLUMNS, chunk_size):
+        yield from chunk
+
+
+EXPORTS = {
+    "posts": (iter_posts, POST_COLUMNS + ("tags",)),
+    "comments": (iter_comments, COMMENT_COLUMNS),
+}
+
+
+def _default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def iter_jsonl(rows: Iterator[dict[str, Any]]) -> Iterator[bytes]:
+    if orjson is not None:
+        option = orjson.OPT_APPEND_NEWLINE | orjson.OPT_PASSTHROUGH_DATETIME
+        for row in rows:
+            yield orjson.dumps(row, default=_default, option=option)
+        return
+
+    for row in rows:
+        yield (
+            json.dumps(row, default=_default, ensure_ascii=False, separators=(",", ":"))
+            + "\n"
+        ).encode()
+
+
+class _Echo:
+    """
+    File-like object whose write() returns the value, for csv.writer.
+    """
+
+    def write(self, value):
+        return value
+
+
+def iter_csv(rows: Iterator[dict[str, Any]], columns) -> Iterator[bytes]:
+    writer = csv.writer(_Echo())
+    yield writer.writerow(columns).encode()
+    for row in rows:
+        if "tags" in row:
+            row["tags"] = " ".join(map(str, row["tags"]))
+        yield writer.writerow(
+            [
+                value.isoformat() if isinstance(value, datetime) else value
+                for value in (row[column] for column in columns)
+            ]
+        ).encode()
+
+
+def export(resource, export_format, chunk_size=DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Stream a whole table as JSONL or CSV bytes in constant memory.
+
+    Args:
+        resource: "posts" or "comments"
+        export_format: "jsonl" or "csv"
+        chunk_size: Rows per keyset query
+    Returns:
+        Iterator of encoded lines
+    """
+
+    iter_rows, columns = EXPORTS[resource]
+    rows = iter_rows(chunk_size)
+    if export_format == "csv":
+        return iter_csv(rows, columns)
+    return iter_jsonl(rows)
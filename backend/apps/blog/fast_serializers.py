@@ -0,0 +1,306 @@
+# Python modules
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Iterable, Optional
+from operator import itemgetter
+
+# Third-party modules
+from rest_framework.exceptions import ValidationError
+
+# Django modules
+from django.conf import settings
+from django.db.models import QuerySet
+from django.utils import timezone
+
+# Project modules
+from apps.blog.models import Post
+from apps.blog.surrogate_keys import post_keys, comment_keys
+from apps.abstract import profiling
+from apps.users.models import CustomUser
+
+# Constants
+DATETIME_FORMAT = "%H:%M %d-%m-%Y"
+AUTHOR_COLUMNS = (
+    "author__email",
+    "author__first_name",
+    "author__last_name",
+    "author__avatar",
+)
+CATEGORY_COLUMNS = ("category__name", "category__slug")
+
+
+def parse_field_list(value: Optional[str]) -> Optional[set[str]]:
+    if value is None:
+        return None
+    # An empty ?fields= means no selection rather than an empty object
+    return {name.strip() for name in value.split(",") if name.strip()} or None
+
+
+class ValuesSerializer(ABC):
+    """
+    Read-only serializer over .values() rows.
+
+    Produces the same data as the matching ModelSerializer, without
+    building field objects or model instances per row. prepare() selects
+    only the columns and joins the output needs; the resulting rows can
+    be paginated like a regular queryset.
+
+    Sparse fieldsets:
+        - no ?fields=: every field, relations as nested objects
+        - ?fields=id,title,author: only the listed fields, relations
+          as ids, so neither the join nor the related columns are read
+        - ?expand=author: render the listed relations as nested objects
+
+    Usage:
+        serializer = Serializer.from_request(request)
+        rows = paginator.paginate_queryset(serializer.prepare(qs), request)
+        data = serializer.serialize(rows)
+    """
+
+    # Output fields in order, each mapped to the columns it reads
+    field_columns: dict[str, tuple[str, ...]] = {}
+    # Extra columns read by a relation rendered as a nested object
+    relation_columns: dict[str, tuple[str, ...]] = {}
+    # Always selected: cursor pagination and surrogate keys rely on them
+    base_columns: tuple[str, ...] = ("id", "created_at")
+
+    def __init__(
+        self,
+        fields: Optional[Iterable[str]] = None,
+        expand: Optional[Iterable[str]] = None,
+    ) -> None:
+        expand = set(expand or ())
+        errors = {}
+        if fields is not None:
+            fields = set(fields)
+            unknown = fields - set(self.field_columns)
+            if unknown:
+                errors["fields"] = [f"Unknown fields: {', '.join(sorted(unknown))}"]
+        unknown = expand - set(self.relation_columns)
+        if unknown:
+            errors["expand"] = [f"Unknown relations: {', '.join(sorted(unknown))}"]
+        if errors:
+            raise ValidationError(errors)
+
+        if fields is None:
+            self.fields = tuple(self.field_columns)
+            self.expand = set(self.relation_columns)
+        else:
+            # Expanding a relation implies selecting it
+            self.fields = tuple(
+                name for name in self.field_columns if name in fields | expand
+            )
+            self.expand = expand
+
+        self.localtime = self.get_localtime()
+        self.avatar_url = CustomUser._meta.get_field("avatar").storage.url
+        self.getters: list[tuple[str, Callable[[dict[str, Any]], Any]]] = [
+            (name, self.get_getter(name)) for name in self.fields
+        ]
+
+    @classmethod
+    def from_request(cls, request) -> "ValuesSerializer":
+        return cls(
+            fields=parse_field_list(request.query_params.get("fields")),
+            expand=parse_field_list(request.query_params.get("expand")),
+        )
+
+    def get_getter(self, name: str) -> Callable[[dict[str, Any]], Any]:
+        if name in self.expand:
+            return getattr(self, f"expand_{name}")
+        return getattr(self, f"get_{name}", itemgetter(name))
+
+    def get_columns(self) -> list[str]:
+        columns = dict.fromkeys(self.base_columns)
+        for name in self.fields:
+            columns.update(dict.fromkeys(self.field_columns[name]))
+            if name in self.expand:
+                columns.update(dict.fromkeys(self.relation_columns[name]))
+        return list(columns)
+
+    def prepare(self, queryset: QuerySet) -> QuerySet:
+        return queryset.values(*self.get_columns())
+
+    @profiling.timed("serialize")
+    def serialize(self, rows: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+        rows = list(rows)
+        self.prefetch(rows)
+        getters = self.getters
+        return [{name: get(row) for name, get in getters} for row in rows]
+
+    def prefetch(self, rows: list[dict[str, Any]]) -> None:
+        """
+        Load many-to-many data for the whole page before serializing.
+        """
+
+    @abstractmethod
+    def surrogate_keys(self, rows: Iterable[dict[str, Any]]) -> set[str]:
+        """
+        Surrogate keys of the objects rendered from rows, which purge
+        the cached responses containing them.
+        """
+
+    def get_localtime(self):
+        # Same conversion as rest_framework DateTimeField.enforce_timezone
+        if not settings.USE_TZ:
+            return lambda value: value
+        current = timezone.get_current_timezone()
+        return lambda value: (
+            value.astimezone(current) if timezone.is_aware(value) else value
+        )
+
+    def format_datetime(self, value) -> Optional[str]:
+        if not value:
+            return None
+        return self.localtime(value).strftime(DATETIME_FORMAT)
+
+    def get_created_at(self, row: dict[str, Any]) -> Optional[str]:
+        return self.format_datetime(row["created_at"])
+
+    def get_updated_at(self, row: dict[str, Any]) -> Optional[str]:
+        return self.format_datetime(row["updated_at"])
+
+    def get_author(self, row: dict[str, Any]) -> int:
+        return row["author_id"]
+
+    def expand_author(self, row: dict[str, Any]) -> dict[str, Any]:
+        avatar = row["author__avatar"]
+        return {
+            "id": row["author_id"],
+            "email": row["author__email"],
+            "first_name": row["author__first_name"],
+            "last_name": row["author__last_name"],
+            "avatar": self.avatar_url(avatar) if avatar else None,
+        }
+
+
+class PostValuesSerializer(ValuesSerializer):
+    """
+    Shared row handling of the post list and detail representations.
+    """
+
+    base_columns = ("id", "created_at", "author_id", "category_id")
+    relation_columns = {
+        "author": AUTHOR_COLUMNS,
+        "category": CATEGORY_COLUMNS,
+        "tags": (),
+    }
+
+    def get_category(self, row: dict[str, Any]) -> Optional[int]:
+        return row["category_id"]
+
+    def expand_category(self, row: dict[str, Any]) -> Optional[dict[str, Any]]:
+        if row["category_id"] is None:
+            return None
+        return {
+            "id": row["category_id"],
+            "name": row["category__name"],
+            "slug": row["category__slug"],
+        }
+
+    def get_tags(self, row: dict[str, Any]) -> list[Any]:
+        return self.tags.get(row["id"], [])
+
+    expand_tags = get_tags
+
+    def prefetch(self, rows):
+        """
+        Fetch the tags of every post in one query, joining the tag table
+        only when tags are expanded. Ordered by tag id, the order the
+        per-post relation returns through the (post_id, tag_id) unique
+        index.
+        """
+        self.tags: dict[int, list[Any]] = {}
+        if "tags" not in self.fields:
+            return
+
+        through = Post.tags.through.objects.filter(
+            post_id__in=[row["id"] for row in rows]
+        ).order_by("post_id", "tag_id")
+
+        if "tags" not in self.expand:
+            for post_id, tag_id in through.values_list("post_id", "tag_id"):
+                self.tags.setdefault(post_id, []).append(tag_id)
+            return
+
+        for post_id, tag_id, name, slug in through.values_list(
+            "post_id", "tag_id", "tag__name", "tag__slug"
+        ):
+            self.tags.setdefault(post_id, []).append(
+                {"id": tag_id, "name": name, "slug": slug}
+            )
+
+    def surrogate_keys(self, rows):
+        keys = set()
+        for row in rows:
+            keys |= post_keys(
+                row["id"],
+                author_id=row["author_id"] if "author" in self.expand else None,
+                category_id=row["category_id"] if "category" in self.expand else None,
+                tag_ids=(
+                    [tag["id"] for tag in self.tags.get(row["id"], ())]
+                    if "tags" in self.expand
+                    else ()
+                ),
+            )
+        return keys
+
+
+class PostListValuesSerializer(PostValuesSerializer):
+    """
+    Fast path of PostListSerializer.
+    """
+
+    field_columns = {
+        "id": (),
+        "author": (),
+        "title": ("title",),
+        "slug": ("slug",),
+        "category": (),
+        "tags": (),
+        "status": ("status",),
+        "created_at": (),
+    }
+
+
+class PostDetailValuesSerializer(PostValuesSerializer):
+    """
+    Fast path of PostDetailSerializer.
+    """
+
+    field_columns = {
+        "id": (),
+        "author": (),
+        "title": ("title",),
+        "slug": ("slug",),
+        "body": ("body",),
+        "category": (),
+        "tags": (),
+        "status": ("status",),
+        "created_at": (),
+        "updated_at": ("updated_at",),
+    }
+
+
+class CommentValuesSerializer(ValuesSerializer):
+    """
+    Fast path of CommentSerializer.
+    """
+
+    base_columns = ("id", "created_at", "author_id")
+    field_columns = {
+        "id": (),
+        "author": (),
+        "body": ("body",),
+        "created_at": (),
+        "updated_at": ("updated_at",),
+    }
+    relation_columns = {"author": AUTHOR_COLUMNS}
+
+    def surrogate_keys(self, rows):
+        keys = set()
+        for row in rows:
+            keys |= comment_keys(
+                row["id"],
+                author_id=row["author_id"] if "author" in self.expand else None,
+            )
+        return keys
@@ -0,0 +1,528 @@
+# Python modules
+from datetime import timedelta
+from itertools import count
+from typing import Any, Callable, Optional
+import json
+import logging
+import os
+
+# Third-party modules
+from rest_framework_simplejwt.tokens import RefreshToken
+
+# Django modules
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.db.models import Count
+from django.test.utils import override_settings, setup_databases, teardown_databases
+from django.urls import URLPattern, URLResolver, reverse
+from django.utils import timezone
+
+# Project modules
+from apps.blog import benchmark
+from apps.blog.models import Post, Comment
+from apps.blog.seed import seed, SEED_PASSWORD
+from apps.abstract import sync
+from apps.users.models import CustomUser
+
+# Constants
+BENCHMARKED_URLCONFS = ("apps.blog.urls", "apps.users.auth.urls")
+DEFAULT_BASELINE = os.path.join(settings.BASE_DIR, "benchmarks", "baseline.json")
+# Routes whose cost is dominated by password hashing or a full table dump
+SLOW_ROUTE_REQUESTS = 10
+
+
+class Case:
+    """
+    One benchmarked route. build(i) runs untimed before request i and
+    returns its (path, body, headers), so it can create the rows a
+    DELETE consumes.
+    """
+
+    def __init__(
+        self,
+        route: str,
+        method: str,
+        build: Callable[[int], tuple[str, Any, dict[str, str]]],
+        expected: int = 200,
+        max_requests: Optional[int] = None,
+    ) -> None:
+        self.route = route
+        self.method = method
+        self.build = build
+        self.expected = expected
+        self.max_requests = max_requests
+
+    @property
+    def name(self) -> str:
+        return f"{self.method} {self.route}"
+
+
+def get_route_names(urlconf: str) -> set[str]:
+    def walk(patterns):
+        for pattern in patterns:
+            if isinstance(pattern, URLResolver):
+                yield from walk(pattern.url_patterns)
+            elif isinstance(pattern, URLPattern) and pattern.name:
+                yield pattern.name
+
+    return set(walk(URLResolver(r"^/", urlconf).url_patterns))
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed a throwaway database, drive every blog and auth route through "
+        "the test client and a real ASGI server, and compare latency "
+        "percentiles and queries per request with a stored baseline"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=200)
+        parser.add_argument("--tags", type=int, default=30)
+        parser.add_argument("--categories", type=int, default=10)
+        parser.add_argument("--posts", type=int, default=2000)
+        parser.add_argument("--comments", type=int, default=10_000)
+        parser.add_argument("--random-seed", type=int, default=0)
+        parser.add_argument(
+            "--requests",
+            type=int,
+            default=50,
+            help="Timed requests per route and server",
+        )
+        parser.add_argument(
+            "--warmup",
+            type=int,
+            default=3,
+            help="Untimed requests per route before measuring",
+        )
+        parser.add_argument(
+            "--server",
+            choices=("client", "asgi", "both"),
+            default="both",
+            help="Test client, uvicorn over HTTP, or both",
+        )
+        parser.add_argument(
+            "--cold",
+            action="store_true",
+            help="Bust the response cache on every GET",
+        )
+        parser.add_argument(
+            "--only",
+            default=None,
+            help="Only routes whose name contains this, e.g. post-",
+        )
+        parser.add_argument(
+            "--database-file",
+            default="benchmark.sqlite3",
+            help="SQLite file of the throwaway database",
+        )
+        parser.add_argument(
+            "--keepdb",
+            action="store_true",
+            help="Keep the seeded database for the next run",
+        )
+        parser.add_argument(
+            "--baseline",
+            default=DEFAULT_BASELINE,
+            help="Baseline JSON to compare with",
+        )
+        parser.add_argument(
+            "--save-baseline",
+            action="store_true",
+            help="Write this run as the new baseline",
+        )
+        parser.add_argument(
+            "--compare",
+            action="store_true",
+            help="Fail unless every route is compared with the baseline, for CI",
+        )
+        parser.add_argument(
+            "--threshold",
+            type=float,
+            default=0.25,
+            help="Allowed relative p95 increase over the baseline",
+        )
+        parser.add_argument(
+            "--min-delta-ms",
+            type=float,
+            default=2.0,
+            help="p95 increases below this are noise, whatever the ratio",
+        )
+
+    def handle(self, *args, **options):
+        """
+        Run the suite on its own database and cache key prefix, so the
+        development data and cache are never touched, then fail on
+        regressions against the baseline.
+        """
+        if options["users"] < 1 or options["posts"] < 1:
+            raise CommandError("--users and --posts must be positive")
+
+        connections["default"].settings_dict.setdefault("TEST", {})["NAME"] = (
+            options["database_file"]
+        )
+        old_config = setup_databases(
+            verbosity=0, interactive=False, keepdb=options["keepdb"]
+        )
+        try:
+            if not Post.objects.exists():
+                self.stdout.write("Seeding benchmark database...")
+                created = seed(
+                    users=options["users"],
+                    tags=options["tags"],
+                    categories=options["categories"],
+                    posts=options["posts"],
+                    comments=options["comments"],
+                    random_seed=options["random_seed"],
+                )
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        "Seeded "
+                        + ", ".join(f"{name}={rows}" for name, rows in created.items())
+                    )
+                )
+
+            results = self.run_suite(options)
+        finally:
+            teardown_databases(old_config, verbosity=0, keepdb=options["keepdb"])
+
+        self.report(results, options)
+
+    def run_suite(self, options) -> dict[str, dict[str, Any]]:
+        cases = self.get_cases(options)
+        covered = {case.route for case in cases}
+        missing = set().union(*map(get_route_names, BENCHMARKED_URLCONFS)) - covered
+        if missing and not options["only"]:
+            self.stdout.write(
+                self.style.WARNING(f"Routes not benchmarked: {', '.join(sorted(missing))}")
+            )
+        if options["only"]:
+            cases = [case for case in cases if options["only"] in case.name]
+
+        runners = ("client", "asgi") if options["server"] == "both" else (options["server"],)
+        caches = {
+            alias: {**config, "KEY_PREFIX": f"{config.get('KEY_PREFIX', '')}:benchmark"}
+            for alias, config in settings.CACHES.items()
+        }
+
+        results = {}
+        # Full sampling makes ProfilingMiddleware report queries per request
+        # in Server-Timing, whichever way the request arrived
+        with override_settings(PROFILING={"SAMPLE_RATE": 1.0}, CACHES=caches):
+            logging.disable(logging.INFO)
+            try:
+                for runner_name in runners:
+                    runner = self.get_runner(runner_name)
+                    try:
+                        for case in cases:
+                            results[f"{runner_name} {case.name}"] = self.run_case(
+                                runner, case, options
+                            )
+                    finally:
+                        runner.close()
+            finally:
+                logging.disable(logging.NOTSET)
+        return results
+
+    def get_runner(self, name):
+        if name == "client":
+            return benchmark.ClientRunner()
+        try:
+            return benchmark.AsgiServerRunner()
+        except ImportError:
+            raise CommandError("uvicorn is required for --server asgi/both")
+
+    def run_case(self, runner, case: Case, options) -> dict[str, Any]:
+        requests = options["requests"]
+        if case.max_requests:
+            requests = min(requests, case.max_requests)
+
+        latencies = []
+        queries = 0
+        errors = 0
+        for i in range(-options["warmup"], requests):
+            path, body, headers = case.build(i)
+            if options["cold"] and case.method == "GET":
+                path += f"{'&' if '?' in path else '?'}cache_bust={next(self.sequence)}"
+            status, elapsed, query_count = runner.request(
+                case.method,
+                path,
+                json.dumps(body).encode() if body is not None else None,
+                {"X-Forwarded-For": self.get_client_ip(), **headers},
+            )
+            if i < 0:
+                continue
+            if status != case.expected:
+                errors += 1
+            latencies.append(elapsed)
+            queries += query_count
+
+        result = benchmark.summarize(latencies)
+        result["queries"] = round(queries / requests, 2)
+        result["requests"] = requests
+        result["errors"] = errors
+        return result
+
+    def get_client_ip(self) -> str:
+        # A new address per request keeps the auth ratelimits out of the way
+        n = next(self.sequence)
+        return f"10.{n >> 16 & 255}.{n >> 8 & 255}.{n & 255}"
+
+    def get_cases(self, options) -> list[Case]:
+        self.sequence = count(1)
+        author = CustomUser.objects.order_by("id").first()
+        staff, _ = CustomUser.objects.get_or_create(
+            email="benchmark-staff@example.com",
+            defaults={"first_name": "Bench", "last_name": "Staff", "is_staff": True},
+        )
+        author_auth = {
+            "Authorization": f"Bearer {RefreshToken.for_user(author).access_token}"
+        }
+        # Post creation is ratelimited per user, so it rotates over authors
+        creators_auth = [
+            {"Authorization": f"Bearer {RefreshToken.for_user(user).access_token}"}
+            for user in CustomUser.objects.order_by("id")[:100]
+        ]
+        staff_auth = {
+            "Authorization": f"Bearer {RefreshToken.for_user(staff).access_token}"
+        }
+
+        # The most commented published post, the one a cache miss hurts most
+        hot = (
+            Post.objects.filter(status=Post.Status.PUBLISHED)
+            .annotate(comment_count=Count("comments"))
+            .order_by("-comment_count", "id")
+            .first()
+        )
+        batch_ids = ",".join(
+            map(str, Post.objects.order_by("id").values_list("id", flat=True)[:20])
+        )
+        own_post = Post.objects.create(
+            author=author,
+            title=f"Benchmark post {next(self.sequence)}",
+            body="Benchmark body",
+            status=Post.Status.PUBLISHED,
+        )
+        own_comment = Comment.objects.create(
+            post=hot, author=author, body="Benchmark comment"
+        )
+
+        def post_to_delete(i):
+            post = Post.objects.create(
+                author=author,
+                title=f"Benchmark delete {next(self.sequence)}",
+                body="Benchmark body",
+            )
+            return reverse("post-detail", kwargs={"slug": post.slug}), None, author_auth
+
+        def comment_to_delete(i):
+            comment = Comment.objects.create(post=hot, author=author, body="Delete me")
+            return reverse("comment-detail", kwargs={"pk": comment.pk}), None, author_auth
+
+        def register(i):
+            n = next(self.sequence)
+            password = f"{SEED_PASSWORD}-{n}"
+            return (
+                reverse("auth-register"),
+                {
+                    "email": f"benchmark-{n}@example.com",
+                    "first_name": "Bench",
+                    "last_name": f"User{n}",
+                    "password": password,
+                    "password_confirm": password,
+                },
+                {},
+            )
+
+        hot_detail = reverse("post-detail", kwargs={"slug": hot.slug})
+        own_detail = reverse("post-detail", kwargs={"slug": own_post.slug})
+        hot_comments = reverse("post-comments", kwargs={"slug": hot.slug})
+        comment_detail = reverse("comment-detail", kwargs={"pk": own_comment.pk})
+        # A client syncing daily: the seeded rows span a year
+        since = sync.encode_token(
+            (timezone.now() - timedelta(days=1), 0), timezone.now()
+        )
+        post_changes = f"{reverse('post-changes')}?since={since}"
+        hot_comment_changes = reverse("post-comment-changes", kwargs={"slug": hot.slug})
+
+        return [
+            Case("api-root", "GET", lambda i: (reverse("api-root"), None, author_auth)),
+            Case("post-list", "GET", lambda i: (reverse("post-list"), None, {})),
+            Case(
+                "post-list",
+                "POST",
+                lambda i: (
+                    reverse("post-list"),
+                    {
+                        "title": f"Benchmark create {next(self.sequence)}",
+                        "body": "Benchmark body",
+                        "status": Post.Status.PUBLISHED,
+                    },
+                    creators_auth[next(self.sequence) % len(creators_auth)],
+                ),
+                expected=201,
+            ),
+            Case(
+                "post-batch",
+                "GET",
+                lambda i: (f"{reverse('post-batch')}?ids={batch_ids}", None, {}),
+            ),
+            Case("post-detail", "GET", lambda i: (hot_detail, None, {})),
+            Case(
+                "post-detail",
+                "PATCH",
+                lambda i: (own_detail, {"body": f"Edited {i}"}, author_auth),
+            ),
+            Case("post-detail", "DELETE", post_to_delete, expected=204),
+            Case("post-comments", "GET", lambda i: (hot_comments, None, {})),
+            Case(
+                "post-comments",
+                "POST",
+                lambda i: (hot_comments, {"body": f"Comment {i}"}, author_auth),
+                expected=201,
+            ),
+            Case("post-changes", "GET", lambda i: (post_changes, None, {})),
+            Case(
+                "post-comment-changes",
+                "GET",
+                lambda i: (hot_comment_changes, None, {}),
+            ),
+            Case("comment-list", "GET", lambda i: (reverse("comment-list"), None, {})),
+            Case("comment-detail", "GET", lambda i: (comment_detail, None, {})),
+            Case(
+                "comment-detail",
+                "PATCH",
+                lambda i: (comment_detail, {"body": f"Edited {i}"}, author_auth),
+            ),
+            Case("comment-detail", "DELETE", comment_to_delete, expected=204),
+            Case(
+                "export",
+                "GET",
+                lambda i: (
+                    reverse(
+                        "export",
+                        kwargs={"resource": "posts", "export_format": "jsonl"},
+                    ),
+                    None,
+                    staff_auth,
+                ),
+                max_requests=SLOW_ROUTE_REQUESTS,
+            ),
+            Case(
+                "auth-token",
+                "POST",
+                lambda i: (
+                    reverse("auth-token"),
+                    {"email": author.email, "password": SEED_PASSWORD},
+                    {},
+                ),
+                max_requests=SLOW_ROUTE_REQUESTS,
+            ),
+            Case(
+                "auth-register",
+                "POST",
+                register,
+                expected=201,
+                max_requests=SLOW_ROUTE_REQUESTS,
+            ),
+            Case(
+                "auth-refresh",
+                "POST",
+                lambda i: (
+                    reverse("auth-refresh"),
+                    {"refresh": str(RefreshToken.for_user(author))},
+                    {},
+                ),
+            ),
+        ]
+
+    def report(self, results: dict[str, dict[str, Any]], options) -> None:
+        volumes = {
+            name: options[name]
+            for name in ("users", "tags", "categories", "posts", "comments")
+        }
+        if options["compare"] and options["save_baseline"]:
+            raise CommandError("--compare and --save-baseline are exclusive")
+        if options["compare"] and not os.path.exists(options["baseline"]):
+            raise CommandError(f"No baseline at {options['baseline']} to compare with")
+
+        baseline = {}
+        if os.path.exists(options["baseline"]) and not options["save_baseline"]:
+            with open(options["baseline"]) as file:
+                stored = json.load(file)
+            baseline = stored.get("results", {})
+            if stored.get("volumes") != volumes or stored.get("cold") != options["cold"]:
+                self.stdout.write(
+                    self.style.WARNING(
+                        "Baseline was recorded with other volumes or cache mode, "
+                        "comparisons are only indicative"
+                    )
+                )
+
+        self.stdout.write(
+            f"\n{'route':<34}{'n':>5}{'p50':>9}{'p95':>9}{'p99':>9}"
+            f"{'queries':>9}{'errors':>8}  baseline p95"
+        )
+        regressions = []
+        failures = []
+        for key, result in results.items():
+            line = (
+                f"{key:<34}{result['requests']:>5}{result['p50']:>9.2f}"
+                f"{result['p95']:>9.2f}{result['p99']:>9.2f}"
+                f"{result['queries']:>9.2f}{result['errors']:>8}"
+            )
+            if result["errors"]:
+                failures.append(f"{key}: {result['errors']} unexpected status codes")
+
+            previous = baseline.get(key)
+            if previous is None:
+                if options["compare"]:
+                    failures.append(f"{key}: not in the baseline")
+                self.stdout.write(line)
+                continue
+
+            reasons = []
+            delta = result["p95"] - previous["p95"]
+            if (
+                delta > options["min_delta_ms"]
+                and result["p95"] > previous["p95"] * (1 + options["threshold"])
+            ):
+                reasons.append(f"p95 {previous['p95']:.2f} -> {result['p95']:.2f}ms")
+            if result["queries"] > previous["queries"]:
+                reasons.append(
+                    f"queries {previous['queries']:.2f} -> {result['queries']:.2f}"
+                )
+
+            line += f"  {previous['p95']:.2f} ({delta:+.2f})"
+            if reasons:
+                regressions.append(f"{key}: {', '.join(reasons)}")
+                self.stdout.write(self.style.ERROR(line))
+            else:
+                self.stdout.write(line)
+
+        if options["save_baseline"]:
+            os.makedirs(os.path.dirname(os.path.abspath(options["baseline"])), exist_ok=True)
+            with open(options["baseline"], "w") as file:
+                json.dump(
+                    {
+                        "volumes": volumes,
+                        "cold": options["cold"],
+                        "results": results,
+                    },
+                    file,
+                    indent=2,
+                    sort_keys=True,
+                )
+            self.stdout.write(self.style.SUCCESS(f"\nBaseline saved to {options['baseline']}"))
+        elif not baseline:
+            self.stdout.write(
+                self.style.WARNING("\nNo baseline to compare with, run with --save-baseline")
+            )
+
+        if failures or regressions:
+            for message in failures + regressions:
+                self.stderr.write(self.style.ERROR(message))
+            raise CommandError(
+                f"{len(regressions)} regressions, {len(failures)} failing routes"
+            )
+        self.stdout.write(self.style.SUCCESS("\n✓ No regressions"))
@@ -0,0 +1,118 @@
+# Python modules
+from decimal import Decimal
+from io import BytesIO
+from itertools import cycle, islice
+import statistics
+import time
+
+# Third-party modules
+from rest_framework import parsers, renderers
+
+# Django modules
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from django.utils.translation import gettext_lazy
+
+# Project modules
+from apps.abstract.parsers import JSONParser
+from apps.abstract.renderers import JSONRenderer, orjson
+from apps.blog.fast_serializers import PostListValuesSerializer
+from apps.blog.models import Post
+
+
+class Command(BaseCommand):
+    help = (
+        "Micro-benchmark the JSON renderer and parser against DRF's stock "
+        "classes over post list pages"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rows",
+            type=int,
+            default=200,
+            help="Posts per page, existing posts are repeated to fill it",
+        )
+        parser.add_argument(
+            "--rounds",
+            type=int,
+            default=200,
+            help="Timed renders and parses per variant",
+        )
+
+    def handle(self, *args, **options):
+        """
+        Render and parse the same payload with every variant, check the
+        bytes match the stock renderer and report the median timings.
+        """
+        rows = options["rows"]
+        rounds = options["rounds"]
+
+        serializer = PostListValuesSerializer()
+        posts = serializer.serialize(
+            serializer.prepare(Post.objects.order_by("-created_at"))[:rows]
+        )
+        if not posts:
+            raise CommandError("No posts to benchmark, create some first")
+
+        payload = {
+            "next": "http://localhost/api/posts/?cursor=cD0yMDI2",
+            "previous": None,
+            "results": list(islice(cycle(posts), rows)),
+        }
+        # Values the encoders have to special-case
+        native_payload = [
+            {
+                "id": index,
+                "created_at": timezone.now(),
+                "score": Decimal("4.25"),
+                "label": gettext_lazy("Published"),
+            }
+            for index in range(rows)
+        ]
+
+        stdlib_renderer = JSONRenderer()
+        stdlib_renderer.use_orjson = False
+        stdlib_parser = JSONParser()
+        stdlib_parser.use_orjson = False
+        variants = [
+            ("drf", renderers.JSONRenderer(), parsers.JSONParser()),
+            ("stdlib", stdlib_renderer, stdlib_parser),
+        ]
+        if orjson is not None:
+            variants.append(("orjson", JSONRenderer(), JSONParser()))
+        else:
+            self.stdout.write(self.style.WARNING("orjson is not installed"))
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Benchmarking JSON: rows={rows}, rounds={rounds}")
+        )
+        self.stdout.write(
+            f"{'payload':<10}{'variant':<10}{'bytes':>9}"
+            f"{'render ms':>12}{'parse ms':>11}{'MB/s':>9}"
+        )
+
+        for name, data in (("posts", payload), ("native", native_payload)):
+            expected = renderers.JSONRenderer().render(data)
+            for variant, renderer, parser in variants:
+                body = renderer.render(data)
+                if body != expected:
+                    raise CommandError(f"{name}: {variant} output differs from DRF")
+
+                render_ms = self.median_ms(lambda: renderer.render(data), rounds)
+                parse_ms = self.median_ms(
+                    lambda: parser.parse(BytesIO(body)), rounds
+                )
+                throughput = len(body) / 1_000_000 / (render_ms / 1000)
+                self.stdout.write(
+                    f"{name:<10}{variant:<10}{len(body):>9}"
+                    f"{render_ms:>12.3f}{parse_ms:>11.3f}{throughput:>9.1f}"
+                )
+
+    def median_ms(self, func, rounds):
+        timings = []
+        for _ in range(rounds):
+            started = time.perf_counter()
+            func()
+            timings.append((time.perf_counter() - started) * 1000)
+        return statistics.median(timings)
@@ -0,0 +1,120 @@
+# Python modules
+import statistics
+import time
+
+# Third-party modules
+from rest_framework.renderers import JSONRenderer
+
+# Django modules
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+# Project modules
+from apps.blog.models import Post, Comment
+from apps.blog.serializers import (
+    PostListSerializer,
+    PostDetailSerializer,
+    CommentSerializer,
+)
+from apps.blog.fast_serializers import (
+    PostListValuesSerializer,
+    PostDetailValuesSerializer,
+    CommentValuesSerializer,
+)
+
+# Constants
+ORDERING = ("-created_at", "-id")
+
+
+class Command(BaseCommand):
+    help = (
+        "Check that the .values() serializers render byte-identical JSON "
+        "and compare their throughput with the ModelSerializers"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rows",
+            type=int,
+            default=200,
+            help="Rows per serialization, the largest page size is 200",
+        )
+        parser.add_argument(
+            "--rounds",
+            type=int,
+            default=20,
+            help="Timed serializations per variant",
+        )
+
+    def handle(self, *args, **options):
+        """
+        Serialize the same rows through both paths, compare the rendered
+        bytes and report rows per second including the queries each path
+        runs.
+        """
+        rows = options["rows"]
+        rounds = options["rounds"]
+        posts = Post.objects.order_by(*ORDERING)
+        comments = Comment.objects.order_by(*ORDERING)
+
+        def fast(serializer_class, queryset):
+            serializer = serializer_class()
+            return serializer.serialize(serializer.prepare(queryset)[:rows])
+
+        cases = (
+            (
+                "post list",
+                lambda: PostListSerializer(posts[:rows], many=True).data,
+                lambda: fast(PostListValuesSerializer, posts),
+            ),
+            (
+                "post detail",
+                lambda: PostDetailSerializer(posts[:rows], many=True).data,
+                lambda: fast(PostDetailValuesSerializer, posts),
+            ),
+            (
+                "comment list",
+                lambda: CommentSerializer(comments[:rows], many=True).data,
+                lambda: fast(CommentValuesSerializer, comments),
+            ),
+        )
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Benchmarking serializers: rows={rows}, rounds={rounds}")
+        )
+        self.stdout.write(
+            f"{'endpoint':<16}{'variant':<10}{'rows':>6}{'queries':>9}"
+            f"{'median ms':>12}{'rows/s':>12}"
+        )
+
+        renderer = JSONRenderer()
+        for name, classic, values in cases:
+            classic_bytes = renderer.render(classic())
+            fast_bytes = renderer.render(values())
+            if classic_bytes != fast_bytes:
+                raise CommandError(f"{name}: fast path JSON differs from the serializer")
+
+            medians = {}
+            for variant, build in (("model", classic), ("values", values)):
+                with CaptureQueriesContext(connection) as queries:
+                    count = len(build())
+                timings = []
+                for _ in range(rounds):
+                    started = time.perf_counter()
+                    build()
+                    timings.append((time.perf_counter() - started) * 1000)
+
+                medians[variant] = statistics.median(timings)
+                throughput = count / (medians[variant] / 1000) if count else 0
+                self.stdout.write(
+                    f"{name:<16}{variant:<10}{count:>6}{len(queries):>9}"
+                    f"{medians[variant]:>12.2f}{throughput:>12.0f}"
+                )
+
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"{name}: identical JSON ({len(fast_bytes)} bytes), "
+                    f"{medians['model'] / medians['values']:.1f}x faster"
+                )
+            )
@@ -1,12 +1,16 @@
 # Python modules
 import json
 import logging
+import time
 
 # Third-party modules
 from django.core.management.base import BaseCommand
 import redis
 from django.conf import settings
 
+# Project modules
+from apps.abstract import metrics
+
 logger = logging.getLogger(__name__)
 
 
@@ -50,6 +54,10 @@ class Command(BaseCommand):
                 if message["type"] == "message":
                     try:
                         data = json.loads(message["data"])
+                        if data.get("published_at"):
+                            metrics.COMMENT_CONSUMER_LAG.set(
+                                time.time() - data["published_at"]
+                            )
 
                         self.stdout.write(self.style.SUCCESS("\n" + "=" * 80))
                         self.stdout.write(
@@ -0,0 +1,263 @@
+# Python modules
+from collections import Counter
+from threading import Lock, Thread
+from urllib.parse import urlsplit
+import json
+import logging
+import time
+
+# Third-party modules
+from rest_framework_simplejwt.tokens import RefreshToken
+
+# Django modules
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+# Project modules
+from apps.blog import benchmark
+from apps.users.models import CustomUser
+
+# Constants
+# Bodies are never captured, so only reads can be replayed faithfully
+REPLAYED_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+class Command(BaseCommand):
+    help = (
+        "Replay traffic captured by TrafficCaptureMiddleware against the app "
+        "and report throughput and latency percentiles"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("files", nargs="+", help="Captured JSONL files")
+        parser.add_argument(
+            "--target",
+            default="client",
+            help="client (in-process), asgi (uvicorn in-process) or http://host:port",
+        )
+        parser.add_argument(
+            "--speedup",
+            type=float,
+            default=1.0,
+            help="Replay rate relative to the capture, 0 sends as fast as possible",
+        )
+        parser.add_argument("--concurrency", type=int, default=8)
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=None,
+            help="Replay only the first N requests",
+        )
+        parser.add_argument(
+            "--user-email",
+            default=None,
+            help="Account replaying 'user' requests, the first active user by default",
+        )
+        parser.add_argument(
+            "--staff-email",
+            default=None,
+            help="Account replaying 'staff' requests, the first staff user by default",
+        )
+
+    def handle(self, *args, **options):
+        """
+        Send the captured reads in capture order, keeping their original
+        spacing divided by --speedup, from --concurrency workers. Workers
+        falling behind the schedule send immediately and the lag is reported.
+        """
+        if options["concurrency"] < 1:
+            raise CommandError("--concurrency must be positive")
+        if options["speedup"] < 0:
+            raise CommandError("--speedup must not be negative")
+
+        records, skipped = self.load(options["files"])
+        credentials = self.get_credentials(options)
+        replayable = []
+        for record in records:
+            if record["identity"] in credentials:
+                replayable.append(record)
+            else:
+                skipped[f"no {record['identity']} account"] += 1
+        replayable = replayable[: options["limit"]]
+        if not replayable:
+            raise CommandError("Nothing to replay")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Replaying {len(replayable)} requests against {options['target']}: "
+                f"speedup={options['speedup']}, concurrency={options['concurrency']}"
+            )
+        )
+        for reason, count in skipped.items():
+            self.stdout.write(self.style.WARNING(f"  skipped {count} ({reason})"))
+
+        make_runner, close = self.get_runner_factory(options["target"])
+        logging.disable(logging.INFO)
+        try:
+            results, wall_time = self.replay(
+                replayable, credentials, make_runner, options
+            )
+        finally:
+            logging.disable(logging.NOTSET)
+            close()
+
+        self.report(replayable, results, wall_time)
+
+    def load(self, paths):
+        records = []
+        skipped = Counter()
+        for path in paths:
+            try:
+                file = open(path, encoding="utf-8")
+            except OSError as e:
+                raise CommandError(f"Cannot read {path}: {e}")
+            with file:
+                for line in file:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        skipped["unreadable line"] += 1
+                        continue
+                    if record.get("method") not in REPLAYED_METHODS:
+                        skipped[f"{record.get('method')} not replayed"] += 1
+                        continue
+                    records.append(record)
+        # Files of several workers interleave by time
+        records.sort(key=lambda record: record["ts"])
+        return records, skipped
+
+    def get_credentials(self, options) -> dict[str, dict[str, str]]:
+        credentials = {"anonymous": {}}
+        accounts = {
+            "user": CustomUser.objects.filter(is_active=True, is_staff=False),
+            "staff": CustomUser.objects.filter(is_active=True, is_staff=True),
+        }
+        emails = {"user": options["user_email"], "staff": options["staff_email"]}
+        for identity, users in accounts.items():
+            if emails[identity]:
+                users = CustomUser.objects.filter(email=emails[identity])
+            user = users.order_by("id").first()
+            if user is None:
+                continue
+            access = RefreshToken.for_user(user).access_token
+            credentials[identity] = {"Authorization": f"Bearer {access}"}
+        return credentials
+
+    def get_runner_factory(self, target):
+        if target == "client":
+            return benchmark.ClientRunner, lambda: None
+
+        if target == "asgi":
+            try:
+                server = benchmark.AsgiServer()
+            except ImportError:
+                raise CommandError("uvicorn is required for --target asgi")
+            return (
+                lambda: benchmark.HttpRunner(server.host, server.port),
+                server.close,
+            )
+
+        url = urlsplit(target)
+        if url.scheme != "http" or not url.hostname:
+            raise CommandError(f"Unsupported target '{target}', expected http://host:port")
+        return (
+            lambda: benchmark.HttpRunner(url.hostname, url.port or 80),
+            lambda: None,
+        )
+
+    def replay(self, records, credentials, make_runner, options):
+        speedup = options["speedup"]
+        first_ts = records[0]["ts"]
+        lock = Lock()
+        pending = iter(records)
+        results = []
+
+        def worker():
+            runner = make_runner()
+            try:
+                while True:
+                    with lock:
+                        record = next(pending, None)
+                    if record is None:
+                        return
+
+                    due = (
+                        started + (record["ts"] - first_ts) / speedup if speedup else 0
+                    )
+                    wait = due - time.perf_counter()
+                    if wait > 0:
+                        time.sleep(wait)
+                    lag = max(0.0, time.perf_counter() - due) if speedup else 0.0
+
+                    path = record["path"]
+                    if record.get("query"):
+                        path = f"{path}?{record['query']}"
+                    try:
+                        status, elapsed, _ = runner.request(
+                            record["method"],
+                            path,
+                            headers=credentials[record["identity"]],
+                        )
+                    except Exception as e:
+                        status, elapsed = f"error: {type(e).__name__}", None
+                    with lock:
+                        results.append((record, status, elapsed, lag))
+            finally:
+                runner.close()
+                connections.close_all()
+
+        started = time.perf_counter()
+        threads = [Thread(target=worker) for _ in range(options["concurrency"])]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results, time.perf_counter() - started
+
+    def report(self, records, results, wall_time):
+        latencies = [elapsed for _, _, elapsed, _ in results if elapsed is not None]
+        overall = benchmark.summarize(latencies)
+        captured = benchmark.summarize(
+            [record["latency_ms"] / 1000 for record in records if "latency_ms" in record]
+        )
+        statuses = Counter(str(status) for _, status, _, _ in results)
+        max_lag = max((lag for _, _, _, lag in results), default=0.0)
+
+        self.stdout.write(
+            f"\n{len(results)} requests in {wall_time:.2f}s "
+            f"({len(results) / wall_time if wall_time else 0:.1f} req/s), "
+            f"max schedule lag {max_lag * 1000:.1f}ms"
+        )
+        self.stdout.write(
+            "statuses: "
+            + ", ".join(f"{status}={count}" for status, count in sorted(statuses.items()))
+        )
+        self.stdout.write(
+            f"\n{'view':<28}{'n':>7}{'p50':>9}{'p95':>9}{'p99':>9}{'captured p50':>14}"
+        )
+
+        by_view = {}
+        for record, _, elapsed, _ in results:
+            if elapsed is not None:
+                by_view.setdefault(record.get("view", "unmatched"), []).append(
+                    (elapsed, record.get("latency_ms"))
+                )
+        rows = [("all", latencies, captured["p50"])]
+        for view, samples in sorted(by_view.items(), key=lambda item: -len(item[1])):
+            recorded = [ms / 1000 for _, ms in samples if ms is not None]
+            rows.append(
+                (view, [elapsed for elapsed, _ in samples], benchmark.summarize(recorded)["p50"])
+            )
+
+        for view, values, captured_p50 in rows:
+            summary = benchmark.summarize(values)
+            self.stdout.write(
+                f"{view:<28}{len(values):>7}{summary['p50']:>9.2f}"
+                f"{summary['p95']:>9.2f}{summary['p99']:>9.2f}{captured_p50:>14.2f}"
+            )
+        if overall["p99"] and captured["p99"]:
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"\np99 {overall['p99']:.2f}ms replayed vs {captured['p99']:.2f}ms captured"
+                )
+            )
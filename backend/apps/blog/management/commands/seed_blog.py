@@ -0,0 +1,104 @@
+# Python modules
+import re
+import time
+
+# Django modules
+from django.core.management.base import BaseCommand, CommandError
+
+# Project modules
+from apps.blog.seed import seed, BATCH_SIZE, SEED_PASSWORD
+
+# Constants
+COUNT_SUFFIXES = {"": 1, "k": 1_000, "m": 1_000_000}
+
+
+def parse_count(value):
+    match = re.fullmatch(r"(\d+(?:\.\d+)?)([kKmM]?)", value.strip())
+    if not match:
+        raise CommandError(f"Invalid count '{value}', expected e.g. 500, 100k, 1M")
+    return int(float(match.group(1)) * COUNT_SUFFIXES[match.group(2).lower()])
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate synthetic users, posts, tags and comments with skewed, "
+        "production-like distributions for load testing"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=parse_count, default="1k")
+        parser.add_argument("--posts", type=parse_count, default="10k")
+        parser.add_argument("--comments", type=parse_count, default="100k")
+        parser.add_argument("--tags", type=parse_count, default="200")
+        parser.add_argument("--categories", type=parse_count, default="20")
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=365,
+            help="Timestamps spread over this many past days",
+        )
+        parser.add_argument(
+            "--skew",
+            type=float,
+            default=0.9,
+            help="Zipf exponent of author, hot post and tag popularity",
+        )
+        parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+        parser.add_argument("--random-seed", type=int, default=0)
+
+    def handle(self, *args, **options):
+        """
+        Append the requested volumes to the database in one transaction,
+        reporting the throughput of every table as it goes.
+        """
+        if options["users"] < 1 and (options["posts"] or options["comments"]):
+            raise CommandError("Posts and comments need at least one user")
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be positive")
+
+        started = time.perf_counter()
+        table_started = {}
+        # A table starts when the previous one is done
+        previous_done = [started]
+        # Whether the last progress line still waits for its newline
+        line_open = [False]
+
+        def progress(table, done, total):
+            table_started.setdefault(table, previous_done[0])
+            elapsed = time.perf_counter() - table_started[table]
+            if done == total:
+                previous_done[0] = time.perf_counter()
+            line_open[0] = done != total
+            self.stdout.write(
+                f"\r  {table}: {done}/{total} "
+                f"({done / elapsed if elapsed else 0:.0f} rows/s)",
+                ending="" if line_open[0] else "\n",
+            )
+            self.stdout.flush()
+
+        self.stdout.write(self.style.SUCCESS("Seeding blog data..."))
+        try:
+            created = seed(
+                users=options["users"],
+                tags=options["tags"],
+                categories=options["categories"],
+                posts=options["posts"],
+                comments=options["comments"],
+                random_seed=options["random_seed"],
+                days=options["days"],
+                skew=options["skew"],
+                batch_size=options["batch_size"],
+                progress=progress,
+            )
+        finally:
+            # Keep an error from being printed on the progress line
+            if line_open[0]:
+                self.stdout.write("")
+
+        summary = ", ".join(f"{name}={rows}" for name, rows in created.items())
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"✓ Seeded {summary} in {time.perf_counter() - started:.1f}s "
+                f"(password of every user: {SEED_PASSWORD})"
+            )
+        )
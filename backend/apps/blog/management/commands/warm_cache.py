@@ -0,0 +1,183 @@
+# Python modules
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from urllib.parse import urlsplit
+import json
+import time
+
+# Django modules
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.db.models import Count
+from django.test import RequestFactory
+from django.urls import resolve, reverse
+
+# Project modules
+from apps.blog.models import Post
+
+
+class RateLimiter:
+    """
+    Space calls at least 1 / rate seconds apart across all threads.
+    """
+
+    def __init__(self, rate: float) -> None:
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._lock = Lock()
+        self._next_at = time.monotonic()
+
+    def wait(self) -> None:
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next_at - now
+            self._next_at = max(now, self._next_at) + self.interval
+        if delay > 0:
+            time.sleep(delay)
+
+
+class Command(BaseCommand):
+    help = (
+        "Warm the response cache after a deploy or cold start: the first "
+        "pages of published posts, the top post details and their first "
+        "comment pages"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--pages",
+            type=int,
+            default=3,
+            help="Pages of the published posts list to warm",
+        )
+        parser.add_argument(
+            "--top",
+            type=int,
+            default=50,
+            help="Most commented posts whose detail and comments to warm",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=4,
+            help="Parallel requests",
+        )
+        parser.add_argument(
+            "--rate",
+            type=float,
+            default=20.0,
+            help="Maximum requests per second, 0 disables the cap",
+        )
+        parser.add_argument(
+            "--host",
+            default=None,
+            help="Host the public API is served on, defaults to the first ALLOWED_HOSTS entry",
+        )
+        parser.add_argument(
+            "--secure",
+            action="store_true",
+            help="Render links with https",
+        )
+
+    def handle(self, *args, **options):
+        """
+        Drive the public views as an anonymous JSON client, so every
+        response is rendered and stored under the exact key a real
+        request would use.
+        """
+        host = options["host"] or self.get_default_host()
+        self.factory = RequestFactory(HTTP_HOST=host, HTTP_ACCEPT="application/json")
+        self.secure = options["secure"]
+        self.limiter = RateLimiter(options["rate"])
+        self.stats = {"written": 0, "warm": 0, "failed": 0}
+        self.stats_lock = Lock()
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Warming cache for host={host}: pages={options['pages']}, "
+                f"top={options['top']}, workers={options['workers']}, "
+                f"rate={options['rate'] or 'unlimited'}/s"
+            )
+        )
+        started = time.perf_counter()
+
+        # List pages are chained through cursors, so they go one by one
+        path = reverse("post-list")
+        for _ in range(options["pages"]):
+            payload = self.fetch(path)
+            if not payload or not payload.get("next"):
+                break
+            next_url = urlsplit(payload["next"])
+            path = f"{next_url.path}?{next_url.query}"
+
+        slugs = list(
+            Post.objects.filter(status=Post.Status.PUBLISHED)
+            .annotate(num_comments=Count("comments"))
+            .order_by("-num_comments", "-created_at")
+            .values_list("slug", flat=True)[: options["top"]]
+        )
+        paths = []
+        for slug in slugs:
+            paths.append(reverse("post-detail", kwargs={"slug": slug}))
+            paths.append(reverse("post-comments", kwargs={"slug": slug}))
+
+        with ThreadPoolExecutor(max_workers=max(1, options["workers"])) as executor:
+            list(executor.map(self.fetch_in_thread, paths))
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Cache warmed in {elapsed:.2f}s: "
+                f"{self.stats['written']} keys written, "
+                f"{self.stats['warm']} already warm, "
+                f"{self.stats['failed']} failed"
+            )
+        )
+
+    def get_default_host(self):
+        hosts = [host for host in settings.ALLOWED_HOSTS if host != "*"]
+        if not hosts:
+            raise CommandError("Pass --host, ALLOWED_HOSTS has no usable entry")
+        return hosts[0].lstrip(".")
+
+    def fetch_in_thread(self, path):
+        try:
+            return self.fetch(path)
+        finally:
+            connections.close_all()
+
+    def fetch(self, path):
+        """
+        Run one anonymous GET through the view and record whether
+        the response cache stored a new entry.
+        """
+        self.limiter.wait()
+        request = self.factory.get(path, secure=self.secure)
+        match = resolve(request.path_info)
+
+        try:
+            response = match.func(request, *match.args, **match.kwargs)
+            if hasattr(response, "render"):
+                response.render()
+        except Exception as e:
+            self.record("failed")
+            self.stderr.write(self.style.ERROR(f"{path}: {e}"))
+            return None
+
+        status = response.get("X-Cache")
+        if response.status_code != 200 or status is None:
+            self.record("failed")
+            self.stderr.write(
+                self.style.WARNING(f"{path}: not cached, status={response.status_code}")
+            )
+            return None
+
+        self.record("written" if status == "MISS" else "warm")
+        self.stdout.write(f"{status:<5} {path}", self.style.HTTP_INFO)
+        return json.loads(response.content)
+
+    def record(self, outcome):
+        with self.stats_lock:
+            self.stats[outcome] += 1
@@ -8,6 +8,7 @@ from django.db.models import (
     ManyToManyField,
     CASCADE,
     SET_NULL,
+    Index,
 )
 from django.utils.text import slugify
 
@@ -19,6 +20,8 @@ from apps.users.models import CustomUser
 CATEGORY_MAX_NAME_LENGTH = 100
 TAG_MAX_NAME_LENGTH = 50
 POST_TITLE_MAX_LENGTH = 200
+# Paths of PostViewSet list routes, /api/posts/<slug>/ would never match
+RESERVED_POST_SLUGS = frozenset({"batch", "changes"})
 
 
 class Category(AbstractTimeStamptModel):
@@ -117,16 +120,25 @@ class Post(AbstractTimeStamptModel):
         default=Status.DRAFT,
     )
 
+    class Meta:
+        indexes = [
+            # Delta sync walks posts in (updated_at, id) order
+            Index(fields=["updated_at", "id"], name="blog_post_updated_idx"),
+        ]
+
     def __str__(self):
         return self.title
 
     def save(self, *args, **kwargs):
-        if not self.slug:
+        if not self.slug or self.slug in RESERVED_POST_SLUGS:
             base_slug = slugify(self.title)
             slug = base_slug
             counter = 1
 
-            while Post.objects.filter(slug=slug).exclude(pk=self.pk).exists():
+            while (
+                slug in RESERVED_POST_SLUGS
+                or Post.objects.filter(slug=slug).exclude(pk=self.pk).exists()
+            ):
                 slug = f"{base_slug}-{counter}"
                 counter += 1
 
@@ -163,3 +175,12 @@ class Comment(AbstractTimeStamptModel):
     )
 
     body = TextField()
+
+    class Meta:
+        indexes = [
+            # Delta sync walks the comments of a post in (updated_at, id) order
+            Index(
+                fields=["post", "updated_at", "id"],
+                name="blog_comment_post_updated_idx",
+            ),
+        ]
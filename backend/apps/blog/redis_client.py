@@ -1,11 +1,15 @@
 # Python modules
 import json
 import logging
+import time
 
 # Third-party modules
 import redis
 from django.conf import settings
 
+# Project modules
+from apps.abstract import metrics, profiling
+
 logger = logging.getLogger(__name__)
 
 redis_client = redis.Redis(
@@ -15,6 +19,7 @@ redis_client = redis.Redis(
 )
 
 
+@profiling.timed("redis")
 def publish_comment_event(comment):
     try:
         event_data = {
@@ -27,10 +32,12 @@ def publish_comment_event(comment):
             "created_at": comment.created_at.isoformat()
             if comment.created_at
             else None,
+            "published_at": time.time(),
         }
 
         message = json.dumps(event_data)
         num_subscribers = redis_client.publish("comments", message)
+        metrics.COMMENT_EVENTS.labels("published").inc()
 
         logger.info(
             f"Published comment event to Redis: comment_id={comment.id}, "
@@ -40,5 +47,6 @@ def publish_comment_event(comment):
         return num_subscribers
 
     except Exception as e:
+        metrics.COMMENT_EVENTS.labels("failed").inc()
         logger.error(f"Failed to publish comment event: {e}", exc_info=True)
         return 0
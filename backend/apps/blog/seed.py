@@ -0,0 +1,304 @@
+# Python modules
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from itertools import accumulate
+from typing import Callable, Iterator, Optional
+import random
+
+# Django modules
+from django.db import connection, transaction
+from django.db.models import Max
+from django.utils import timezone
+
+# Project modules
+from apps.blog.models import Post, Comment, Tag, Category
+from apps.users.models import CustomUser
+from apps.users import hashing
+
+# Constants
+SEED_PASSWORD = "seed-password-123"
+BATCH_SIZE = 5000
+# Distinct bodies generated up front and reused, sampling them is
+# much cheaper than building a text per row
+CONTENT_POOL_SIZE = 1000
+WORDS = (
+    "django cache query index redis python latency request response worker "
+    "thread async token scale shard replica cursor page batch stream profile "
+    "metric trace budget queue event commit schema table memory network"
+).split()
+FIRST_NAMES = ("Alex", "Sam", "Dana", "Aru", "Timur", "Mira", "Dias", "Zhanna")
+LAST_NAMES = ("Smith", "Lee", "Kim", "Nurlanov", "Ivanova", "Garcia", "Chen")
+PUBLISHED_RATIO = 0.9
+# Mean delay between a post and its comments
+COMMENT_DELAY = timedelta(days=2)
+USER_FIELDS = (
+    "id",
+    "email",
+    "first_name",
+    "last_name",
+    "password",
+    "is_active",
+    "is_staff",
+    "is_superuser",
+    "date_joined",
+    "created_at",
+    "updated_at",
+)
+POST_FIELDS = (
+    "id",
+    "author",
+    "title",
+    "slug",
+    "body",
+    "category",
+    "status",
+    "created_at",
+    "updated_at",
+)
+COMMENT_FIELDS = ("post", "author", "body", "created_at", "updated_at")
+
+
+def zipf_cum_weights(n: int, skew: float) -> list[float]:
+    """
+    Cumulative weights of rank 1..n under a Zipf law, for random.choices.
+    A few items get most of the picks: hot posts, prolific authors.
+    """
+    return list(accumulate(1 / rank**skew for rank in range(1, n + 1)))
+
+
+def chunks(total: int, size: int) -> Iterator[range]:
+    for start in range(0, total, size):
+        yield range(start, min(start + size, total))
+
+
+def make_texts(rng: random.Random, count: int, mean_words: int) -> list[str]:
+    texts = []
+    for _ in range(count):
+        # Log-normal lengths, mostly short with a long tail
+        length = max(3, int(rng.lognormvariate(0, 0.6) * mean_words))
+        texts.append(" ".join(rng.choices(WORDS, k=length)))
+    return texts
+
+
+def insert_rows(model, field_names: tuple[str, ...], rows: list[tuple]) -> None:
+    """
+    INSERT already adapted rows with one executemany: the statement
+    bulk_create builds, without its per-value field preparation and model
+    instances, which dominate the cost at millions of rows.
+    """
+    quote = connection.ops.quote_name
+    columns = ", ".join(
+        quote(model._meta.get_field(name).column) for name in field_names
+    )
+    placeholders = ", ".join(["%s"] * len(field_names))
+    table = quote(model._meta.db_table)
+    with connection.cursor() as cursor:
+        cursor.executemany(
+            f"INSERT INTO {table} ({columns}) VALUES ({placeholders})", rows
+        )
+
+
+@contextmanager
+def deferred_indexes(*models) -> Iterator[None]:
+    """
+    Drop the secondary indexes of the tables while they are loaded and
+    build them once at the end, instead of updating them row by row.
+    SQLite only, a no-op elsewhere. Implicit UNIQUE/PK indexes stay.
+    """
+    if connection.vendor != "sqlite":
+        yield
+        return
+
+    tables = [model._meta.db_table for model in models]
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT name, sql FROM sqlite_master WHERE type = 'index' "
+            f"AND sql IS NOT NULL AND tbl_name IN ({', '.join('%s' for _ in tables)})",
+            tables,
+        )
+        indexes = cursor.fetchall()
+        for name, _ in indexes:
+            cursor.execute(f'DROP INDEX "{name}"')
+    try:
+        yield
+    finally:
+        with connection.cursor() as cursor:
+            for _, sql in indexes:
+                cursor.execute(sql)
+            for table in tables:
+                cursor.execute(f'ANALYZE "{table}"')
+
+
+def next_id(model) -> int:
+    return (model.objects.aggregate(last=Max("id"))["last"] or 0) + 1
+
+
+@transaction.atomic
+def seed(
+    users: int = 50,
+    tags: int = 20,
+    categories: int = 8,
+    posts: int = 500,
+    comments: int = 2000,
+    random_seed: int = 0,
+    days: int = 365,
+    skew: float = 0.9,
+    batch_size: int = BATCH_SIZE,
+    progress: Optional[Callable[[str, int, int], None]] = None,
+) -> dict[str, int]:
+    """
+    Add reproducible synthetic content shaped like production traffic.
+
+    Every user shares one password hash (SEED_PASSWORD), rows get explicit
+    ids and go in as plain tuples one executemany batch at a time, so
+    neither the password hasher, the slug loop of Post.save nor model
+    instantiation runs per row and memory stays flat. Authors, commented
+    posts and tags are drawn from Zipf distributions, timestamps spread
+    over the last `days` days with comments following their post.
+
+    Args:
+        progress: Called with (table, rows done, rows total) after each batch
+    Returns:
+        Rows created per table
+    """
+
+    rng = random.Random(random_seed)
+    report = progress or (lambda table, done, total: None)
+    password = hashing.make_password(SEED_PASSWORD)
+    now = timezone.now()
+    start = now - timedelta(days=days)
+    span = (now - start).total_seconds()
+
+    first_user = next_id(CustomUser)
+    first_post = next_id(Post)
+    first_category = next_id(Category)
+    first_tag = next_id(Tag)
+
+    Category.objects.bulk_create(
+        Category(
+            id=category_id,
+            name=f"Category {category_id}",
+            slug=f"category-{category_id}",
+        )
+        for category_id in range(first_category, first_category + categories)
+    )
+    Tag.objects.bulk_create(
+        Tag(id=tag_id, name=f"tag-{tag_id}", slug=f"tag-{tag_id}")
+        for tag_id in range(first_tag, first_tag + tags)
+    )
+
+    titles = make_texts(rng, CONTENT_POOL_SIZE, 5)
+    post_bodies = make_texts(rng, CONTENT_POOL_SIZE, 150)
+    comment_bodies = make_texts(rng, CONTENT_POOL_SIZE, 25)
+
+    # Shuffled so the prolific authors and hot posts are not just the oldest
+    user_ids = list(range(first_user, first_user + users))
+    authors = rng.sample(user_ids, len(user_ids))
+    author_weights = zipf_cum_weights(users, skew)
+    post_ids = list(range(first_post, first_post + posts))
+    hot_posts = rng.sample(post_ids, len(post_ids))
+    post_weights = zipf_cum_weights(posts, skew) if posts else []
+    tag_ids = list(range(first_tag, first_tag + tags))
+    tag_weights = zipf_cum_weights(tags, skew) if tags else []
+    category_ids = list(range(first_category, first_category + categories))
+
+    def post_created_at(post_id: int) -> datetime:
+        # Ids grow with time, as they do in production
+        return start + timedelta(seconds=span * (post_id - first_post) / max(posts, 1))
+
+    adapt = connection.ops.adapt_datetimefield_value
+
+    with deferred_indexes(CustomUser, Post, Post.tags.through, Comment):
+        for batch in chunks(users, batch_size):
+            rows = []
+            for i in batch:
+                user_id = first_user + i
+                joined = adapt(start + timedelta(seconds=rng.random() * span))
+                rows.append(
+                    (
+                        user_id,
+                        f"user{user_id}@example.com",
+                        rng.choice(FIRST_NAMES),
+                        rng.choice(LAST_NAMES),
+                        password,
+                        True,
+                        False,
+                        False,
+                        joined,
+                        joined,
+                        joined,
+                    )
+                )
+            insert_rows(CustomUser, USER_FIELDS, rows)
+            report("users", batch.stop, users)
+
+        for batch in chunks(posts, batch_size):
+            rows = []
+            post_tags = []
+            for i, author_id in zip(
+                batch, rng.choices(authors, cum_weights=author_weights, k=len(batch))
+            ):
+                post_id = first_post + i
+                created_at = adapt(post_created_at(post_id))
+                title = rng.choice(titles)[:180].capitalize()
+                rows.append(
+                    (
+                        post_id,
+                        author_id,
+                        f"{title} {post_id}",
+                        f"post-{post_id}",
+                        rng.choice(post_bodies),
+                        rng.choice(category_ids) if category_ids else None,
+                        (
+                            Post.Status.PUBLISHED
+                            if rng.random() < PUBLISHED_RATIO
+                            else Post.Status.DRAFT
+                        ),
+                        created_at,
+                        created_at,
+                    )
+                )
+                if tag_ids:
+                    picked = set(
+                        rng.choices(
+                            tag_ids, cum_weights=tag_weights, k=rng.randint(0, 4)
+                        )
+                    )
+                    post_tags.extend((post_id, tag_id) for tag_id in picked)
+            insert_rows(Post, POST_FIELDS, rows)
+            insert_rows(Post.tags.through, ("post", "tag"), post_tags)
+            report("posts", batch.stop, posts)
+
+        comment_delay = COMMENT_DELAY.total_seconds()
+        for batch in chunks(comments if posts else 0, batch_size):
+            rows = []
+            for post_id, author_id in zip(
+                rng.choices(hot_posts, cum_weights=post_weights, k=len(batch)),
+                rng.choices(authors, cum_weights=author_weights, k=len(batch)),
+            ):
+                created_at = adapt(
+                    min(
+                        now,
+                        post_created_at(post_id)
+                        + timedelta(seconds=rng.expovariate(1 / comment_delay)),
+                    )
+                )
+                rows.append(
+                    (
+                        post_id,
+                        author_id,
+                        rng.choice(comment_bodies),
+                        created_at,
+                        created_at,
+                    )
+                )
+            insert_rows(Comment, COMMENT_FIELDS, rows)
+            report("comments", batch.stop, comments)
+
+    return {
+        "users": users,
+        "categories": categories,
+        "tags": tags,
+        "posts": posts,
+        "comments": comments if posts else 0,
+    }
@@ -0,0 +1,72 @@
+# Django modules
+from django.db.models.signals import post_save, post_delete, m2m_changed
+from django.dispatch import receiver
+
+# Project modules
+from apps.abstract import surrogate
+from apps.blog.models import Post, Comment, Tag, Category
+from apps.blog.surrogate_keys import (
+    POSTS_LIST_KEY,
+    COMMENTS_LIST_KEY,
+    post_comments_key,
+)
+
+
+def purge_post(post, created=False):
+    if created:
+        surrogate.purge_on_commit(POSTS_LIST_KEY, f"post:{post.pk}")
+        return
+
+    keys = [f"post:{post.pk}"]
+    # A published post may just have been published: a cached detail page
+    # of the draft says nothing about the list pages, which must change.
+    # Unpublishing is covered by the post key the listing pages carry.
+    if post.status == Post.Status.PUBLISHED:
+        keys.append(POSTS_LIST_KEY)
+    surrogate.purge_on_commit(*keys)
+
+
+@receiver(post_save, sender=Post)
+def purge_post_on_save(sender, instance, created, **kwargs):
+    purge_post(instance, created=created)
+
+
+@receiver(post_delete, sender=Post)
+def purge_post_on_delete(sender, instance, **kwargs):
+    surrogate.purge_on_commit(f"post:{instance.pk}", post_comments_key(instance.pk))
+
+
+@receiver(m2m_changed, sender=Post.tags.through)
+def purge_post_on_tags_change(sender, instance, action, **kwargs):
+    if action in ("post_add", "post_remove", "post_clear") and isinstance(
+        instance, Post
+    ):
+        purge_post(instance)
+
+
+@receiver(post_save, sender=Comment)
+def purge_comment_on_save(sender, instance, created, **kwargs):
+    if created:
+        surrogate.purge_on_commit(
+            post_comments_key(instance.post_id),
+            COMMENTS_LIST_KEY,
+        )
+    else:
+        surrogate.purge_on_commit(f"comment:{instance.pk}")
+
+
+@receiver(post_delete, sender=Comment)
+def purge_comment_on_delete(sender, instance, **kwargs):
+    surrogate.purge_on_commit(f"comment:{instance.pk}")
+
+
+@receiver(post_save, sender=Tag)
+@receiver(post_delete, sender=Tag)
+def purge_tag(sender, instance, **kwargs):
+    surrogate.purge_on_commit(f"tag:{instance.pk}")
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def purge_category(sender, instance, **kwargs):
+    surrogate.purge_on_commit(f"category:{instance.pk}")
@@ -0,0 +1,39 @@
+# Python modules
+from typing import Any, Iterable
+
+# Constants
+POSTS_LIST_KEY = "posts:list"
+COMMENTS_LIST_KEY = "comments:list"
+
+
+def post_comments_key(post_id: Any) -> str:
+    return f"post:{post_id}:comments"
+
+
+def post_keys(
+    post_id: Any,
+    author_id: Any = None,
+    category_id: Any = None,
+    tag_ids: Iterable[Any] = (),
+) -> set[str]:
+    """
+    Surrogate keys of a serialized post. Related ids are passed only
+    when the related object is rendered in the payload.
+    """
+    keys = {f"post:{post_id}"}
+    if author_id is not None:
+        keys.add(f"author:{author_id}")
+    if category_id is not None:
+        keys.add(f"category:{category_id}")
+    keys.update(f"tag:{tag_id}" for tag_id in tag_ids)
+    return keys
+
+
+def comment_keys(comment_id: Any, author_id: Any = None) -> set[str]:
+    """
+    Surrogate keys of a serialized comment.
+    """
+    keys = {f"comment:{comment_id}"}
+    if author_id is not None:
+        keys.add(f"author:{author_id}")
+    return keys
@@ -1,3 +1,302 @@
-from django.test import TestCase
+# Python modules
+from datetime import timedelta
+from unittest import mock
+import hashlib
+import json
 
-# Create your tests here.
+# Third-party modules
+from rest_framework_simplejwt.tokens import AccessToken
+
+# Django modules
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+# Project modules
+from apps.abstract.idempotency import IDEMPOTENCY_KEY, IN_FLIGHT, LOCK_TIMEOUT
+from apps.abstract.sync import TOKEN_MAX_AGE, encode_token
+from apps.blog.models import Comment, Post
+from apps.users.models import CustomUser
+
+# Constants
+FAST_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
+
+@override_settings(PASSWORD_HASHERS=FAST_HASHERS)
+class BlogTestCase(TestCase):
+    """
+    An author with a bearer token and an empty cache for every test.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.user = self.create_user("author@example.com")
+        self.auth = self.get_auth(self.user)
+
+    def create_user(self, email):
+        return CustomUser.objects.create_user(
+            email=email,
+            first_name="Test",
+            last_name="User",
+            password="test-password",
+        )
+
+    def get_auth(self, user):
+        return {"HTTP_AUTHORIZATION": f"Bearer {AccessToken.for_user(user)}"}
+
+    def post_json(self, path, data, auth=None, **headers):
+        return self.client.post(
+            path,
+            json.dumps(data),
+            content_type="application/json",
+            **(self.auth if auth is None else auth),
+            **headers,
+        )
+
+
+class IdempotencyTests(BlogTestCase):
+    def setUp(self):
+        super().setUp()
+        self.path = reverse("post-list")
+        self.body = {"title": "Idempotent post", "body": "Written once."}
+
+    def test_retry_replays_stored_response(self):
+        first = self.post_json(self.path, self.body, HTTP_IDEMPOTENCY_KEY="key-1")
+        retry = self.post_json(self.path, self.body, HTTP_IDEMPOTENCY_KEY="key-1")
+
+        self.assertEqual(first.status_code, 201)
+        self.assertEqual(retry.status_code, 201)
+        self.assertEqual(retry["Idempotent-Replayed"], "true")
+        self.assertEqual(retry.json(), first.json())
+        self.assertEqual(Post.objects.count(), 1)
+
+    def test_key_reused_with_another_body_is_rejected(self):
+        self.post_json(self.path, self.body, HTTP_IDEMPOTENCY_KEY="key-1")
+        response = self.post_json(
+            self.path,
+            {**self.body, "title": "Another post"},
+            HTTP_IDEMPOTENCY_KEY="key-1",
+        )
+
+        self.assertEqual(response.status_code, 422)
+        self.assertEqual(Post.objects.count(), 1)
+
+    def test_retry_while_in_flight_conflicts(self):
+        digest = hashlib.sha256(f"{self.path}\nkey-1".encode()).hexdigest()
+        cache.add(
+            IDEMPOTENCY_KEY.format(user=self.user.id, digest=digest),
+            {"state": IN_FLIGHT, "fingerprint": ""},
+            LOCK_TIMEOUT,
+        )
+
+        response = self.post_json(self.path, self.body, HTTP_IDEMPOTENCY_KEY="key-1")
+
+        self.assertEqual(response.status_code, 409)
+        self.assertIn("Retry-After", response)
+        self.assertFalse(Post.objects.exists())
+
+    def test_keys_are_scoped_to_the_user(self):
+        other = self.get_auth(self.create_user("other@example.com"))
+        self.post_json(self.path, self.body, HTTP_IDEMPOTENCY_KEY="key-1")
+        response = self.post_json(
+            self.path, self.body, auth=other, HTTP_IDEMPOTENCY_KEY="key-1"
+        )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertNotIn("Idempotent-Replayed", response)
+        self.assertEqual(Post.objects.count(), 2)
+
+    def test_requests_without_key_always_run(self):
+        self.post_json(self.path, self.body)
+        self.post_json(self.path, self.body)
+
+        self.assertEqual(Post.objects.count(), 2)
+
+    def test_empty_key_is_invalid(self):
+        response = self.post_json(self.path, self.body, HTTP_IDEMPOTENCY_KEY="")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(Post.objects.exists())
+
+
+# Rows are otherwise only synced SETTLE_SECONDS after their last change
+@mock.patch("apps.abstract.sync.SETTLE_SECONDS", 0)
+class ChangesTests(BlogTestCase):
+    def setUp(self):
+        super().setUp()
+        self.path = reverse("post-changes")
+        self.posts = [
+            Post.objects.create(
+                author=self.user,
+                title=f"Post {i}",
+                body="Body",
+                status=Post.Status.PUBLISHED,
+            )
+            for i in range(3)
+        ]
+
+    def sync(self, since=None, path=None, **params):
+        if since is not None:
+            params["since"] = since
+        response = self.client.get(path or self.path, params)
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def get_ids(self, items):
+        return [item["id"] for item in items]
+
+    def test_initial_sync_returns_every_post(self):
+        data = self.sync()
+
+        self.assertEqual(self.get_ids(data["changed"]), [p.id for p in self.posts])
+        self.assertEqual(data["deleted"], [])
+        self.assertFalse(data["has_more"])
+
+    def test_pages_follow_the_token(self):
+        first = self.sync(limit=2)
+        second = self.sync(first["next"], limit=2)
+        third = self.sync(second["next"], limit=2)
+
+        self.assertTrue(first["has_more"])
+        self.assertFalse(second["has_more"])
+        self.assertEqual(
+            self.get_ids(first["changed"] + second["changed"]),
+            [p.id for p in self.posts],
+        )
+        self.assertEqual(third["changed"], [])
+
+    def test_only_changes_after_the_token_are_returned(self):
+        token = self.sync()["next"]
+        updated, deleted, _ = self.posts
+        updated.title = "Updated"
+        updated.save()
+        deleted.delete()
+        draft = Post.objects.create(
+            author=self.create_user("other@example.com"), title="Draft", body="Body"
+        )
+
+        data = self.sync(token)
+
+        self.assertEqual(self.get_ids(data["changed"]), [updated.id])
+        self.assertEqual(data["changed"][0]["title"], "Updated")
+        # Deleted posts and other authors' drafts are tombstones
+        self.assertEqual(self.get_ids(data["deleted"]), [deleted.id, draft.id])
+
+    def test_own_drafts_are_synced_to_their_author(self):
+        token = self.sync()["next"]
+        draft = Post.objects.create(author=self.user, title="Draft", body="Body")
+
+        response = self.client.get(self.path, {"since": token}, **self.auth)
+
+        self.assertEqual(self.get_ids(response.json()["changed"]), [draft.id])
+
+    def test_recent_changes_wait_for_the_settle_delay(self):
+        with mock.patch("apps.abstract.sync.SETTLE_SECONDS", 60):
+            data = self.sync()
+
+        self.assertEqual(data["changed"], [])
+        # The caught-up token still covers them on the next sync
+        self.assertEqual(
+            self.get_ids(self.sync(data["next"])["changed"]),
+            [p.id for p in self.posts],
+        )
+
+    def test_expired_token_is_gone(self):
+        issued_at = timezone.now() - TOKEN_MAX_AGE - timedelta(days=1)
+        token = encode_token((issued_at, 0), issued_at)
+
+        response = self.client.get(self.path, {"since": token})
+
+        self.assertEqual(response.status_code, 410)
+
+    def test_invalid_token_is_rejected(self):
+        response = self.client.get(self.path, {"since": "not-a-token"})
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_comment_changes(self):
+        post = self.posts[0]
+        comments = [
+            Comment.objects.create(post=post, author=self.user, body=f"Comment {i}")
+            for i in range(2)
+        ]
+        Comment.objects.create(post=self.posts[1], author=self.user, body="Elsewhere")
+        path = reverse("post-comment-changes", kwargs={"slug": post.slug})
+
+        data = self.sync(path=path)
+        comments[0].delete()
+        changes = self.sync(data["next"], path=path)
+
+        self.assertEqual(self.get_ids(data["changed"]), [c.id for c in comments])
+        self.assertEqual(changes["changed"], [])
+        self.assertEqual(self.get_ids(changes["deleted"]), [comments[0].id])
+
+
+class SurrogateKeyPurgeTests(BlogTestCase):
+    def setUp(self):
+        super().setUp()
+        self.post, self.other = [
+            Post.objects.create(
+                author=self.user,
+                title=title,
+                body="Body",
+                status=Post.Status.PUBLISHED,
+            )
+            for title in ("Cached", "Other")
+        ]
+        self.detail = reverse("post-detail", kwargs={"slug": self.post.slug})
+        self.list = reverse("post-list")
+
+    def get(self, path):
+        response = self.client.get(path)
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    def change(self, post, **fields):
+        with self.captureOnCommitCallbacks(execute=True):
+            for name, value in fields.items():
+                setattr(post, name, value)
+            post.save()
+
+    def test_responses_carry_their_surrogate_keys(self):
+        keys = self.get(self.detail)["Surrogate-Key"].split()
+
+        self.assertIn(f"post:{self.post.pk}", keys)
+        self.assertIn(f"author:{self.user.pk}", keys)
+
+    def test_change_purges_the_cached_detail(self):
+        self.assertEqual(self.get(self.detail)["X-Cache"], "MISS")
+        self.assertEqual(self.get(self.detail)["X-Cache"], "HIT")
+
+        self.change(self.post, title="Changed")
+        response = self.get(self.detail)
+
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(response.json()["title"], "Changed")
+
+    def test_change_of_another_post_keeps_the_entry(self):
+        self.get(self.detail)
+
+        self.change(self.other, title="Changed")
+
+        self.assertEqual(self.get(self.detail)["X-Cache"], "HIT")
+
+    def test_publishing_purges_the_list(self):
+        draft = Post.objects.create(author=self.user, title="Draft", body="Body")
+        self.get(self.list)
+
+        self.change(draft, status=Post.Status.PUBLISHED)
+        response = self.get(self.list)
+
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertIn(draft.id, [post["id"] for post in response.json()["results"]])
+
+    def test_author_change_purges_their_posts(self):
+        self.get(self.detail)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.first_name = "Renamed"
+            self.user.save()
+
+        self.assertEqual(self.get(self.detail)["X-Cache"], "MISS")
@@ -5,12 +5,17 @@ from rest_framework.routers import DefaultRouter
 from django.urls import path, include
 
 # Project modules
-from apps.blog.views import PostViewSet, CommentViewSet
+from apps.blog.views import PostViewSet, CommentViewSet, ExportViewSet
 
 router = DefaultRouter()
 router.register(r"posts", PostViewSet, basename="post")
 router.register(r"comments", CommentViewSet, basename="comment")
 
 urlpatterns = [
+    path(
+        "export/<str:resource>.<str:export_format>",
+        ExportViewSet.as_view({"get": "export"}),
+        name="export",
+    ),
     path("", include(router.urls)),
 ]
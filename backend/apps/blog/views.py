@@ -1,11 +1,13 @@
 # Python modules
-from typing import Any
+from typing import Any, Sequence
+import json
 import logging
 
 # Third-party modules
 from rest_framework.viewsets import ViewSet
 from rest_framework.decorators import action
-from rest_framework.permissions import AllowAny
+from rest_framework.permissions import AllowAny, IsAdminUser
+from rest_framework.negotiation import BaseContentNegotiation
 from rest_framework.response import Response as DRFResponse
 from rest_framework.request import Request as DRFRequest
 from rest_framework.status import (
@@ -15,26 +17,42 @@ from rest_framework.status import (
     HTTP_400_BAD_REQUEST,
     HTTP_401_UNAUTHORIZED,
 )
-from rest_framework.exceptions import NotFound, PermissionDenied
+from rest_framework.exceptions import NotFound, PermissionDenied, ValidationError
 
 # Django modules
 from django.db.models import Q
-from django.core.cache import cache
+from django.http import StreamingHttpResponse
+from django.urls import NoReverseMatch, reverse
 
 # Project modules
 from apps.blog.models import Post, Comment
 from apps.blog.serializers import (
-    PostListSerializer,
-    PostDetailSerializer,
     PostCreateUpdateSerializer,
     CommentSerializer,
 )
 from apps.blog.permissions import IsAuthorOrReadOnly
 from apps.abstract.pagination import DefaultPagination
 from apps.abstract.ratelimit import ratelimit
+from apps.abstract.idempotency import idempotent
+from apps.abstract.sync import get_changes
+from apps.blog.surrogate_keys import (
+    POSTS_LIST_KEY,
+    COMMENTS_LIST_KEY,
+    post_comments_key,
+)
+from apps.blog.fast_serializers import (
+    PostListValuesSerializer,
+    PostDetailValuesSerializer,
+    CommentValuesSerializer,
+)
+from apps.abstract.response_cache import cache_response, get_cached_entries
+from apps.blog.export import export, EXPORTS, EXPORT_FORMATS
 
 logger = logging.getLogger(__name__)
 
+# Constants
+BATCH_MAX_SIZE = 50
+
 
 class PostViewSet(ViewSet):
     """
@@ -42,10 +60,13 @@ class PostViewSet(ViewSet):
     - GET /api/posts/ — List published posts (no auth required)
     - POST /api/posts/ — Create post (auth required)
     - GET /api/posts/{slug}/ — Get single post (no auth required)
+    - GET /api/posts/batch/?slugs=a,b or ?ids=1,2 — Get several posts (no auth required)
+    - GET /api/posts/changes/?since=<token> — Posts changed since a sync token (no auth required)
     - PATCH /api/posts/{slug}/ — Update own post (auth required)
     - DELETE /api/posts/{slug}/ — Delete own post (auth required)
     - GET /api/posts/{slug}/comments/ — List comments (no auth required)
     - POST /api/posts/{slug}/comments/ — Add comment (auth required)
+    - GET /api/posts/{slug}/comments/changes/?since=<token> — Comments changed since a sync token (no auth required)
     """
 
     lookup_field: str = "slug"
@@ -65,6 +86,7 @@ class PostViewSet(ViewSet):
             if not permission.has_object_permission(request, self, obj):
                 raise PermissionDenied()
 
+    @cache_response(group="posts", timeout=60)
     def list(
         self,
         request: DRFRequest,
@@ -86,54 +108,41 @@ class PostViewSet(ViewSet):
             )
             logger.debug(f"Posts queryset count: {queryset.count()} for {user_info}")
 
+            serializer = PostListValuesSerializer.from_request(request)
+            queryset = serializer.prepare(queryset)
             paginator = self.pagination_class()
             page = paginator.paginate_queryset(queryset, request, view=self)
 
             if page is not None:
-                serializer: PostListSerializer = PostListSerializer(page, many=True)
-                return paginator.get_paginated_response(serializer.data)
+                return paginator.get_paginated_response(serializer.serialize(page))
 
-            serializer: PostListSerializer = PostListSerializer(queryset, many=True)
             return DRFResponse(
-                data=serializer.data,
+                data=serializer.serialize(queryset),
                 status=HTTP_200_OK,
             )
 
-        cache_key = "published_posts_list"
-        cached_data = cache.get(cache_key)
-
-        if cached_data is not None:
-            logger.info(f"Returning cached posts list for {user_info}")
-            return DRFResponse(
-                data=cached_data,
-                status=HTTP_200_OK,
-            )
-        logger.info(f"Cache miss - fetching posts from database for {user_info}")
+        logger.info(f"Fetching published posts from database for {user_info}")
         queryset = Post.objects.filter(status=Post.Status.PUBLISHED)
         logger.debug(f"Posts queryset count: {queryset.count()} for {user_info}")
+        serializer = PostListValuesSerializer.from_request(request)
+        queryset = serializer.prepare(queryset)
 
         paginator = self.pagination_class()
         page = paginator.paginate_queryset(queryset, request, view=self)
 
         if page is not None:
-            serializer: PostListSerializer = PostListSerializer(page, many=True)
-            response_data = paginator.get_paginated_response(serializer.data).data
-            cache.set(cache_key, response_data, 60)
-            logger.info("Cached posts list for 60 seconds")
-            return DRFResponse(
-                data=response_data,
+            response = paginator.get_paginated_response(serializer.serialize(page))
+        else:
+            page = list(queryset)
+            response = DRFResponse(
+                data=serializer.serialize(page),
                 status=HTTP_200_OK,
             )
 
-        serializer: PostListSerializer = PostListSerializer(queryset, many=True)
-        response_data = serializer.data
-        cache.set(cache_key, response_data, 60)
-        logger.info("Cached posts list for 60 seconds")
-        return DRFResponse(
-            data=response_data,
-            status=HTTP_200_OK,
-        )
+        response.surrogate_keys = {POSTS_LIST_KEY} | serializer.surrogate_keys(page)
+        return response
 
+    @idempotent()
     @ratelimit(key_func=lambda r: str(r.user.id) if r.user.is_authenticated else "anonymous", rate="20/m", method="POST")
     def create(
         self,
@@ -159,9 +168,6 @@ class PostViewSet(ViewSet):
         if serializer.is_valid():
             post = serializer.save(author=request.user)
 
-            cache.delete("published_posts_list")
-            logger.info("Invalidated published posts cache after post creation")
-
             logger.info(
                 f"Post created successfully: post_id={post.id}, "
                 f"slug={post.slug}, author_id={request.user.id}"
@@ -179,6 +185,7 @@ class PostViewSet(ViewSet):
             status=HTTP_400_BAD_REQUEST,
         )
 
+    @cache_response(group="posts", timeout=60)
     def retrieve(
         self,
         request: DRFRequest,
@@ -191,19 +198,193 @@ class PostViewSet(ViewSet):
 
         logger.info(f"Retrieving post with slug={slug}")
 
-        try:
-            post: Post = Post.objects.get(slug=slug)
-            logger.info(f"Post retrieved: post_id={post.id}, slug={slug}")
-        except Post.DoesNotExist:
+        serializer = PostDetailValuesSerializer.from_request(request)
+        post = serializer.prepare(Post.objects.filter(slug=slug)).first()
+        if post is None:
             logger.warning(f"Post not found: slug={slug}")
             raise NotFound(detail="Post not found")
+        logger.info(f"Post retrieved: post_id={post['id']}, slug={slug}")
+
+        response = DRFResponse(
+            data=serializer.serialize([post])[0],
+            status=HTTP_200_OK,
+        )
+        response.surrogate_keys = serializer.surrogate_keys([post])
+        return response
+
+    @action(
+        detail=False,
+        methods=("GET",),
+        url_path="batch",
+        url_name="batch",
+    )
+    @cache_response(group="posts", timeout=60)
+    def batch(
+        self,
+        request: DRFRequest,
+        *args: tuple[Any, ...],
+        **kwargs: dict[str, Any],
+    ) -> DRFResponse:
+        """
+        Resolve up to BATCH_MAX_SIZE posts by slug or id in one request.
+
+        Results follow the request order, missing posts are returned as
+        {"slug": ..., "detail": "Post not found"} markers. Slug lookups
+        reuse cached post details and query only the rest.
+        """
+        self.check_permissions(request)
+
+        lookup, values = self.get_batch_lookup(request)
+        serializer = PostDetailValuesSerializer.from_request(request)
+        logger.info(f"Batch retrieving {len(values)} posts by {lookup}")
+
+        requested = set(values)
+        found: dict[Any, Any] = {}
+        surrogate_keys = set()
+        sparse = "fields" in request.query_params or "expand" in request.query_params
+
+        if lookup == "slug" and not sparse:
+            paths = {}
+            for slug in requested:
+                try:
+                    paths[reverse("post-detail", kwargs={"slug": slug})] = slug
+                except NoReverseMatch:
+                    continue
+            cached = get_cached_entries("posts", request.get_host(), paths)
+            for path, entry in cached.items():
+                found[paths[path]] = json.loads(entry["body"])
+                surrogate_keys.update(entry["surrogate_keys"])
+        from_cache = len(found)
+
+        missing = requested - set(found)
+        if missing:
+            columns = serializer.get_columns()
+            if lookup not in columns:
+                columns.append(lookup)
+            rows = list(
+                Post.objects.filter(**{f"{lookup}__in": missing}).values(*columns)
+            )
+            for row, data in zip(rows, serializer.serialize(rows)):
+                found[row[lookup]] = data
+            surrogate_keys |= serializer.surrogate_keys(rows)
+
+        logger.info(
+            f"Batch retrieved {len(found)} of {len(requested)} posts, "
+            f"{from_cache} from cache"
+        )
+        results = [
+            found[value]
+            if value in found
+            else {lookup: value, "detail": "Post not found"}
+            for value in values
+        ]
+
+        response = DRFResponse(
+            data={"results": results},
+            status=HTTP_200_OK,
+        )
+        if len(found) < len(requested):
+            # Creating a post purges the list key, covering missing slugs
+            surrogate_keys.add(POSTS_LIST_KEY)
+        response.surrogate_keys = surrogate_keys
+        return response
+
+    @action(
+        detail=False,
+        methods=("GET",),
+        url_path="changes",
+        url_name="changes",
+    )
+    def changes(
+        self,
+        request: DRFRequest,
+        *args: tuple[Any, ...],
+        **kwargs: dict[str, Any],
+    ) -> DRFResponse:
+        """
+        Posts created, updated or deleted since ?since=, for incremental
+        client sync. Posts the requester can no longer see (deleted, or
+        someone else's draft) are returned as tombstones.
+        """
+        self.check_permissions(request)
+
+        rows, token, has_more = get_changes(
+            Post.objects.all(), request, columns=("status", "author_id")
+        )
+        user_id = request.user.id if request.user.is_authenticated else None
+        visible = {
+            row["id"]
+            for row in rows
+            if row["deleted_at"] is None
+            and (row["status"] == Post.Status.PUBLISHED or row["author_id"] == user_id)
+        }
+        logger.info(
+            f"Post changes: {len(visible)} changed, "
+            f"{len(rows) - len(visible)} removed, has_more={has_more}"
+        )
+        return self.get_changes_response(
+            PostDetailValuesSerializer.from_request(request),
+            Post.objects.filter(id__in=visible),
+            rows,
+            visible,
+            token,
+            has_more,
+        )
 
-        serializer: PostDetailSerializer = PostDetailSerializer(post)
+    def get_changes_response(
+        self,
+        serializer,
+        queryset,
+        rows: Sequence[dict[str, Any]],
+        visible: set[int],
+        token: str,
+        has_more: bool,
+    ) -> DRFResponse:
+        # Only the surviving rows are read in full, in the sync order
+        found = {row["id"]: row for row in serializer.prepare(queryset)}
+        changed = [found[row["id"]] for row in rows if row["id"] in found]
+        deleted = [
+            {
+                "id": row["id"],
+                "deleted_at": serializer.format_datetime(
+                    row["deleted_at"] or row["updated_at"]
+                ),
+            }
+            for row in rows
+            if row["id"] not in visible
+        ]
         return DRFResponse(
-            data=serializer.data,
+            data={
+                "changed": serializer.serialize(changed),
+                "deleted": deleted,
+                "next": token,
+                "has_more": has_more,
+            },
             status=HTTP_200_OK,
         )
 
+    def get_batch_lookup(self, request: DRFRequest) -> tuple[str, Sequence[Any]]:
+        slugs = request.query_params.get("slugs")
+        ids = request.query_params.get("ids")
+        if (slugs is None) == (ids is None):
+            raise ValidationError({"detail": "Pass exactly one of slugs or ids."})
+
+        lookup, param = ("slug", slugs) if slugs is not None else ("id", ids)
+        values = [value.strip() for value in param.split(",") if value.strip()]
+        if not values:
+            raise ValidationError({f"{lookup}s": ["This list may not be empty."]})
+        if len(values) > BATCH_MAX_SIZE:
+            raise ValidationError(
+                {f"{lookup}s": [f"At most {BATCH_MAX_SIZE} posts per request."]}
+            )
+
+        if lookup == "id":
+            try:
+                values = [int(value) for value in values]
+            except ValueError:
+                raise ValidationError({"ids": ["Ids must be integers."]})
+        return lookup, values
+
     def partial_update(
         self,
         request: DRFRequest,
@@ -240,9 +421,6 @@ class PostViewSet(ViewSet):
         if serializer.is_valid():
             serializer.save()
 
-            cache.delete("published_posts_list")
-            logger.info("Invalidated published posts cache after post update")
-
             logger.info(
                 f"Post updated successfully: post_id={post.id}, "
                 f"slug={slug}, user_id={request.user.id}"
@@ -303,6 +481,8 @@ class PostViewSet(ViewSet):
         url_name="comments",
         permission_classes=(AllowAny,),
     )
+    @idempotent()
+    @cache_response(group="comments", timeout=60)
     def comments(
         self,
         request: DRFRequest,
@@ -320,20 +500,30 @@ class PostViewSet(ViewSet):
 
         if request.method == "GET":
             logger.info(f"Listing comments for post: post_id={post.id}, slug={slug}")
-            comments_qs = post.comments.all().order_by("-created_at")
+            serializer = CommentValuesSerializer.from_request(request)
+            comments_qs = serializer.prepare(
+                post.comments.all().order_by("-created_at")
+            )
 
             paginator = self.pagination_class()
             page = paginator.paginate_queryset(comments_qs, request, view=self)
 
             if page is not None:
-                serializer: CommentSerializer = CommentSerializer(page, many=True)
-                return paginator.get_paginated_response(serializer.data)
+                response = paginator.get_paginated_response(
+                    serializer.serialize(page)
+                )
+            else:
+                page = list(comments_qs)
+                response = DRFResponse(
+                    data=serializer.serialize(page),
+                    status=HTTP_200_OK,
+                )
 
-            serializer: CommentSerializer = CommentSerializer(comments_qs, many=True)
-            return DRFResponse(
-                data=serializer.data,
-                status=HTTP_200_OK,
-            )
+            response.surrogate_keys = {
+                f"post:{post.id}",
+                post_comments_key(post.id),
+            } | serializer.surrogate_keys(page)
+            return response
 
         elif request.method == "POST":
             if not request.user.is_authenticated:
@@ -370,6 +560,44 @@ class PostViewSet(ViewSet):
                 status=HTTP_400_BAD_REQUEST,
             )
 
+    @action(
+        detail=True,
+        methods=("GET",),
+        url_path="comments/changes",
+        url_name="comment-changes",
+        permission_classes=(AllowAny,),
+    )
+    def comment_changes(
+        self,
+        request: DRFRequest,
+        slug: str = None,
+        *args: tuple[Any, ...],
+        **kwargs: dict[str, Any],
+    ) -> DRFResponse:
+        """
+        Comments of a post created, updated or deleted since ?since=.
+        """
+        try:
+            post: Post = Post.objects.get(slug=slug)
+        except Post.DoesNotExist:
+            logger.warning(f"Post not found for comment changes: slug={slug}")
+            raise NotFound(detail="Post not found")
+
+        rows, token, has_more = get_changes(post.comments.all(), request)
+        visible = {row["id"] for row in rows if row["deleted_at"] is None}
+        logger.info(
+            f"Comment changes: post_id={post.id}, {len(visible)} changed, "
+            f"{len(rows) - len(visible)} removed, has_more={has_more}"
+        )
+        return self.get_changes_response(
+            CommentValuesSerializer.from_request(request),
+            Comment.objects.filter(id__in=visible),
+            rows,
+            visible,
+            token,
+            has_more,
+        )
+
 
 class CommentViewSet(ViewSet):
     permission_classes: tuple = (IsAuthorOrReadOnly,)
@@ -388,6 +616,7 @@ class CommentViewSet(ViewSet):
             if not permission.has_object_permission(request, self, obj):
                 raise PermissionDenied()
 
+    @cache_response(group="comments", timeout=60)
     def list(
         self,
         request: DRFRequest,
@@ -399,20 +628,27 @@ class CommentViewSet(ViewSet):
         logger.info("Listing all comments")
         queryset = Comment.objects.all().order_by("-created_at")
         logger.debug(f"Total comments count: {queryset.count()}")
+        serializer = CommentValuesSerializer.from_request(request)
+        queryset = serializer.prepare(queryset)
 
         paginator = self.pagination_class()
         page = paginator.paginate_queryset(queryset, request, view=self)
 
         if page is not None:
-            serializer: CommentSerializer = CommentSerializer(page, many=True)
-            return paginator.get_paginated_response(serializer.data)
+            response = paginator.get_paginated_response(serializer.serialize(page))
+        else:
+            page = list(queryset)
+            response = DRFResponse(
+                data=serializer.serialize(page),
+                status=HTTP_200_OK,
+            )
 
-        serializer: CommentSerializer = CommentSerializer(queryset, many=True)
-        return DRFResponse(
-            data=serializer.data,
-            status=HTTP_200_OK,
+        response.surrogate_keys = {COMMENTS_LIST_KEY} | serializer.surrogate_keys(
+            page
         )
+        return response
 
+    @cache_response(group="comments", timeout=60)
     def retrieve(
         self,
         request: DRFRequest,
@@ -424,18 +660,19 @@ class CommentViewSet(ViewSet):
 
         logger.info(f"Retrieving comment with pk={pk}")
 
-        try:
-            comment: Comment = Comment.objects.get(pk=pk)
-            logger.info(f"Comment retrieved: comment_id={comment.id}")
-        except Comment.DoesNotExist:
+        serializer = CommentValuesSerializer.from_request(request)
+        comment = serializer.prepare(Comment.objects.filter(pk=pk)).first()
+        if comment is None:
             logger.warning(f"Comment not found: pk={pk}")
             raise NotFound(detail="Comment not found")
+        logger.info(f"Comment retrieved: comment_id={comment['id']}")
 
-        serializer: CommentSerializer = CommentSerializer(comment)
-        return DRFResponse(
-            data=serializer.data,
+        response = DRFResponse(
+            data=serializer.serialize([comment])[0],
             status=HTTP_200_OK,
         )
+        response.surrogate_keys = serializer.surrogate_keys([comment])
+        return response
 
     def partial_update(
         self,
@@ -522,3 +759,52 @@ class CommentViewSet(ViewSet):
             f"user_id={request.user.id}"
         )
         return DRFResponse(status=HTTP_204_NO_CONTENT)
+
+
+class ExportContentNegotiation(BaseContentNegotiation):
+    """
+    Exports pick their format from the URL, so the Accept header is ignored.
+    """
+
+    def select_parser(self, request, parsers):
+        return parsers[0]
+
+    def select_renderer(self, request, renderers, format_suffix=None):
+        return (renderers[0], renderers[0].media_type)
+
+
+class ExportViewSet(ViewSet):
+    """
+    Bulk export for analytics (staff only):
+    - GET /api/export/posts.jsonl, /api/export/posts.csv
+    - GET /api/export/comments.jsonl, /api/export/comments.csv
+
+    Rows are streamed in keyset chunks, memory stays constant
+    regardless of table size.
+    """
+
+    permission_classes: tuple = (IsAdminUser,)
+    content_negotiation_class = ExportContentNegotiation
+
+    def export(
+        self,
+        request: DRFRequest,
+        resource: str = None,
+        export_format: str = None,
+        *args: tuple[Any, ...],
+        **kwargs: dict[str, Any],
+    ) -> StreamingHttpResponse:
+        if resource not in EXPORTS or export_format not in EXPORT_FORMATS:
+            raise NotFound(detail="Unknown export")
+
+        logger.info(
+            f"Exporting {resource} as {export_format} for user_id={request.user.id}"
+        )
+        response = StreamingHttpResponse(
+            export(resource, export_format),
+            content_type=EXPORT_FORMATS[export_format],
+        )
+        response["Content-Disposition"] = (
+            f'attachment; filename="{resource}.{export_format}"'
+        )
+        return response
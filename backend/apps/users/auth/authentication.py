@@ -0,0 +1,144 @@
+# Python modules
+from typing import Any, Optional
+import logging
+import time
+
+# Third-party modules
+from rest_framework.request import Request as DRFRequest
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import Token
+
+# Django modules
+from django.conf import settings
+from django.core.cache import cache
+from django.db import router
+from django.db.models import DEFERRED
+
+# Project modules
+from apps.abstract.lru import LRUCache
+from apps.users.models import CustomUser
+
+logger = logging.getLogger(__name__)
+
+# Constants
+USER_SNAPSHOT_FIELDS = ("id", "email", "is_active", "is_staff")
+USER_SNAPSHOT_CACHE_KEY = "auth:user:{user_id}"
+
+_auth_settings: dict[str, Any] = getattr(settings, "AUTH_USER_CACHE", {})
+
+# raw token -> (user_id, token). Only maps a verified token to its user,
+# the user's state always comes from the snapshot below.
+_token_cache = LRUCache(
+    max_size=_auth_settings.get("LOCAL_MAX_SIZE", 10_000),
+    ttl=_auth_settings.get("LOCAL_TTL", 30),
+)
+
+
+def get_user_snapshot_cache_key(user_id: Any) -> str:
+    return USER_SNAPSHOT_CACHE_KEY.format(user_id=user_id)
+
+
+def invalidate_user_snapshot(user_id: Any) -> None:
+    """
+    Drop the cached snapshot of a user from Redis and from the local tier
+    of every process: TwoTierRedisCache broadcasts the delete over its
+    invalidation channel, and its local TTL bounds a lost message.
+
+    Args:
+        user_id: Primary key of the user
+    Returns:
+        None
+    """
+
+    try:
+        cache.delete(get_user_snapshot_cache_key(user_id))
+    except Exception as e:
+        logger.error(f"Failed to invalidate user snapshot: {e}", exc_info=True)
+
+
+def build_user_from_snapshot(snapshot: dict[str, Any]) -> CustomUser:
+    """
+    Build a CustomUser instance from a snapshot without touching the DB.
+    Fields outside the snapshot are deferred and load lazily on access.
+    """
+
+    values = [
+        snapshot[field.attname] if field.attname in snapshot else DEFERRED
+        for field in CustomUser._meta.concrete_fields
+    ]
+    return CustomUser.from_db(
+        router.db_for_read(CustomUser),
+        [field.attname for field in CustomUser._meta.concrete_fields],
+        values,
+    )
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that avoids the per-request user query.
+
+    Verified tokens are kept in a short-TTL in-process LRU. User snapshots
+    (id, email, is_active, is_staff) live in the cache, whose local tier
+    serves them in-process (see LOCAL_CACHE["KEY_PREFIXES"]). Snapshots are
+    invalidated in every process by the CustomUser post_save/post_delete
+    signals.
+    """
+
+    def authenticate(self, request: DRFRequest) -> Optional[tuple[CustomUser, Token]]:
+        header = self.get_header(request)
+        if header is None:
+            return None
+
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+
+        cached = _token_cache.get(raw_token)
+        if cached is not None:
+            user_id, validated_token = cached
+            return self.get_user_by_id(user_id), validated_token
+
+        validated_token = self.get_validated_token(raw_token)
+        user = self.get_user(validated_token)
+
+        ttl = _token_cache.ttl
+        exp = validated_token.get("exp")
+        if exp is not None:
+            ttl = min(ttl, exp - time.time())
+        _token_cache.set(raw_token, (user.pk, validated_token), ttl=ttl)
+
+        return user, validated_token
+
+    def get_user(self, validated_token: Token) -> CustomUser:
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken("Token contained no recognizable user identification") from e
+
+        return self.get_user_by_id(user_id)
+
+    def get_user_by_id(self, user_id: Any) -> CustomUser:
+        cache_key = get_user_snapshot_cache_key(user_id)
+        snapshot = cache.get(cache_key)
+
+        if snapshot is None:
+            logger.debug(f"User snapshot cache miss: user_id={user_id}")
+            snapshot = (
+                CustomUser.objects.filter(**{api_settings.USER_ID_FIELD: user_id})
+                .values(*USER_SNAPSHOT_FIELDS)
+                .first()
+            )
+            if snapshot is None:
+                raise AuthenticationFailed("User not found", code="user_not_found")
+            cache.set(
+                cache_key,
+                snapshot,
+                _auth_settings.get("REDIS_TTL", 300),
+            )
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not snapshot["is_active"]:
+            raise AuthenticationFailed("User is inactive", code="user_inactive")
+
+        return build_user_from_snapshot(snapshot)
@@ -11,11 +11,16 @@ from rest_framework.serializers import (
     ModelSerializer,
     ValidationError,
 )
-from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.serializers import (
+    TokenRefreshSerializer as BaseTokenRefreshSerializer,
+)
+from rest_framework_simplejwt.settings import api_settings
 from django.contrib.auth import authenticate
 
 # Project modules
 from apps.users.models import CustomUser
+from apps.users.auth.authentication import CachedJWTAuthentication
+from apps.users.auth.tokens import RefreshToken
 
 logger = logging.getLogger(__name__)
 
@@ -122,3 +127,37 @@ class LoginSerializer(Serializer):
             "access": str(refresh.access_token),
             "refresh": str(refresh),
         }
+
+
+class TokenRefreshSerializer(BaseTokenRefreshSerializer):
+    """
+    Token refresh serializer backed by the Redis token blacklist
+
+    Methods:
+        - validate: Validate the refresh token, rotate and blacklist it
+    """
+
+    token_class = RefreshToken
+
+    def validate(self, attrs: dict[str, Any]) -> dict[str, str]:
+        refresh = self.token_class(attrs["refresh"])
+
+        user_id = refresh.payload.get(api_settings.USER_ID_CLAIM, None)
+        if user_id:
+            # Raises AuthenticationFailed for missing or inactive users
+            CachedJWTAuthentication().get_user_by_id(user_id)
+
+        data = {"access": str(refresh.access_token)}
+
+        if api_settings.ROTATE_REFRESH_TOKENS:
+            if api_settings.BLACKLIST_AFTER_ROTATION:
+                refresh.blacklist()
+
+            refresh.set_jti()
+            refresh.set_exp()
+            refresh.set_iat()
+
+            data["refresh"] = str(refresh)
+
+        logger.debug(f"Refresh token rotated for user_id={user_id}")
+        return data
@@ -0,0 +1,126 @@
+# Python modules
+from typing import Any
+import logging
+import time
+from threading import Lock
+
+# Third-party modules
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken as BaseRefreshToken
+
+# Django modules
+from django.conf import settings
+from django.core.cache import cache
+
+# Project modules
+from apps.abstract.bloom import BloomFilter
+
+logger = logging.getLogger(__name__)
+
+# Constants
+BLACKLIST_CACHE_KEY = "token_blacklist:{jti}"
+
+
+class RedisTokenBlacklist:
+    """
+    Refresh token blacklist stored in Redis, keyed by JTI.
+
+    Every entry expires together with its token, so Redis cleans
+    itself up. A per-process Bloom filter remembers JTIs this worker
+    has seen blacklisted, so replays are rejected without a round trip
+    and clean tokens skip the lookup entirely. The filter is rotated
+    every token lifetime, since older JTIs fail the exp check anyway.
+
+    Methods:
+        - add: Atomically blacklist a JTI, False if it already was
+        - contains: Check whether a JTI is blacklisted
+    """
+
+    def __init__(self, capacity: int = 100_000, error_rate: float = 0.001) -> None:
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.rotate_after = api_settings.REFRESH_TOKEN_LIFETIME.total_seconds()
+        self._current = BloomFilter(capacity, error_rate)
+        self._previous = BloomFilter(capacity, error_rate)
+        self._rotated_at = time.monotonic()
+        self._lock = Lock()
+
+    def _rotate_if_needed(self) -> None:
+        now = time.monotonic()
+        if (
+            now - self._rotated_at < self.rotate_after
+            and self._current.count < self.capacity
+        ):
+            return
+
+        with self._lock:
+            if now - self._rotated_at < self.rotate_after and (
+                self._current.count < self.capacity
+            ):
+                return
+            self._previous = self._current
+            self._current = BloomFilter(self.capacity, self.error_rate)
+            self._rotated_at = now
+
+    def _remember(self, jti: str) -> None:
+        self._rotate_if_needed()
+        self._current.add(jti)
+
+    def might_contain(self, jti: str) -> bool:
+        return self._current.might_contain(jti) or self._previous.might_contain(jti)
+
+    def add(self, jti: str, exp: int) -> bool:
+        timeout = max(1, int(exp - time.time()))
+        added = cache.add(BLACKLIST_CACHE_KEY.format(jti=jti), 1, timeout)
+        self._remember(jti)
+        return added
+
+    def contains(self, jti: str) -> bool:
+        if not self.might_contain(jti):
+            return False
+
+        return cache.has_key(BLACKLIST_CACHE_KEY.format(jti=jti))
+
+
+_blacklist_settings: dict[str, Any] = getattr(settings, "TOKEN_BLACKLIST", {})
+
+token_blacklist = RedisTokenBlacklist(
+    capacity=_blacklist_settings.get("BLOOM_CAPACITY", 100_000),
+    error_rate=_blacklist_settings.get("BLOOM_ERROR_RATE", 0.001),
+)
+
+
+class RefreshToken(BaseRefreshToken):
+    """
+    Refresh token backed by the Redis blacklist instead of
+    the rest_framework_simplejwt.token_blacklist app.
+    """
+
+    def verify(self, *args: tuple[Any, ...], **kwargs: dict[str, Any]) -> None:
+        self.check_blacklist()
+        super().verify(*args, **kwargs)
+
+    def check_blacklist(self) -> None:
+        """
+        Raise TokenError if this token is known to be blacklisted.
+
+        Only JTIs flagged by the local Bloom filter hit Redis here,
+        cross-worker replays are caught by the atomic claim in blacklist.
+        System check users.E001 keeps that claim on every refresh.
+        """
+
+        jti = self.payload.get(api_settings.JTI_CLAIM)
+        if jti and token_blacklist.contains(jti):
+            raise TokenError("Token is blacklisted")
+
+    def blacklist(self) -> None:
+        """
+        Blacklist this token. The SET NX doubles as the authoritative
+        check, so a token can be rotated at most once across all workers.
+        """
+
+        jti = self.payload[api_settings.JTI_CLAIM]
+        if not token_blacklist.add(jti, self.payload["exp"]):
+            logger.warning(f"Blacklisted refresh token reused: jti={jti}")
+            raise TokenError("Token is blacklisted")
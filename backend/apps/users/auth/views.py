@@ -10,12 +10,15 @@ from rest_framework.request import Request as DRFRequest
 from rest_framework.status import HTTP_200_OK, HTTP_201_CREATED, HTTP_400_BAD_REQUEST
 from rest_framework.decorators import action
 
-from rest_framework_simplejwt.serializers import TokenRefreshSerializer
 from rest_framework_simplejwt.exceptions import TokenError, InvalidToken
 
 
 # Project modules
-from apps.users.auth.serializers import RegistrationSerializer, LoginSerializer
+from apps.users.auth.serializers import (
+    RegistrationSerializer,
+    LoginSerializer,
+    TokenRefreshSerializer,
+)
 from apps.abstract.ratelimit import ratelimit, get_client_ip
 
 logger = logging.getLogger(__name__)
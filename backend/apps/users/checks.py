@@ -0,0 +1,31 @@
+# Third-party modules
+from rest_framework_simplejwt import settings as jwt_settings
+
+# Django modules
+from django.core.checks import Error, Tags, register
+
+
+@register(Tags.security)
+def check_token_rotation(app_configs, **kwargs):
+    """
+    RefreshToken.check_blacklist only asks Redis about JTIs the local
+    Bloom filter flags, so a token blacklisted by another worker passes
+    it. The atomic claim of the rotation in TokenRefreshSerializer is
+    what rejects the replay, which needs both settings on.
+    """
+
+    # Through the module, override_settings replaces api_settings
+    api_settings = jwt_settings.api_settings
+    if api_settings.ROTATE_REFRESH_TOKENS and api_settings.BLACKLIST_AFTER_ROTATION:
+        return []
+    return [
+        Error(
+            "Refresh tokens must be rotated and blacklisted after rotation.",
+            hint=(
+                "Set SIMPLE_JWT ROTATE_REFRESH_TOKENS and BLACKLIST_AFTER_ROTATION "
+                "to True, replays are only caught by the rotation's atomic claim."
+            ),
+            obj="settings.SIMPLE_JWT",
+            id="users.E001",
+        )
+    ]
@@ -0,0 +1,154 @@
+# Python modules
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    TimeoutError as FutureTimeoutError,
+)
+from threading import BoundedSemaphore, Lock
+from typing import Any, Callable, Optional
+import logging
+
+# Third-party modules
+from rest_framework.exceptions import APIException
+
+# Django modules
+import django
+from django.conf import settings
+from django.contrib.auth import hashers
+
+logger = logging.getLogger(__name__)
+
+
+class PBKDF2PasswordHasher(hashers.PBKDF2PasswordHasher):
+    """
+    PBKDF2 hasher whose iteration count can be tuned through
+    settings.PASSWORD_HASHING["PBKDF2_ITERATIONS"] (see benchmark_hashers).
+    Existing hashes are upgraded on the next successful login.
+    """
+
+    @property
+    def iterations(self) -> int:
+        return getattr(settings, "PASSWORD_HASHING", {}).get(
+            "PBKDF2_ITERATIONS",
+            hashers.PBKDF2PasswordHasher.iterations,
+        )
+
+
+_executor: Optional[Executor] = None
+_executor_lock = Lock()
+_slots: Optional[BoundedSemaphore] = None
+
+
+class HashingUnavailable(APIException):
+    status_code = 503
+    default_detail = "Too many password checks in progress, try again later."
+    default_code = "hashing_unavailable"
+
+
+def _init_worker() -> None:
+    """Make sure Django is configured inside spawned hashing processes."""
+    django.setup()
+
+
+def get_executor() -> Executor:
+    """
+    Return the shared hashing pool, creating it on first use.
+
+    Configured by settings.PASSWORD_HASHING:
+        - EXECUTOR: "thread" or "process"
+        - MAX_WORKERS: number of concurrent hashes per server process
+        - MAX_PENDING: hashes allowed to wait for a worker, beyond that
+          requests are rejected with 503 instead of queued
+    """
+
+    global _executor, _slots
+
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                config: dict[str, Any] = getattr(settings, "PASSWORD_HASHING", {})
+                max_workers = config.get("MAX_WORKERS", 2)
+                _slots = BoundedSemaphore(
+                    max_workers + config.get("MAX_PENDING", max_workers)
+                )
+
+                if config.get("EXECUTOR", "thread") == "process":
+                    _executor = ProcessPoolExecutor(
+                        max_workers=max_workers,
+                        initializer=_init_worker,
+                    )
+                else:
+                    _executor = ThreadPoolExecutor(
+                        max_workers=max_workers,
+                        thread_name_prefix="password-hashing",
+                    )
+                logger.debug(
+                    f"Password hashing pool started: {type(_executor).__name__}, "
+                    f"max_workers={max_workers}"
+                )
+
+    return _executor
+
+
+def _run(func: Callable[..., Any], *args: Any) -> Any:
+    timeout = getattr(settings, "PASSWORD_HASHING", {}).get("TIMEOUT")
+    executor = get_executor()
+    if not _slots.acquire(blocking=False):
+        logger.warning("Password hashing pool saturated, rejecting request")
+        raise HashingUnavailable()
+
+    try:
+        future = executor.submit(func, *args)
+    except BaseException:
+        _slots.release()
+        raise
+    # The slot is held until the hash is done, not until the caller gives up
+    future.add_done_callback(lambda _: _slots.release())
+
+    try:
+        return future.result(timeout=timeout)
+    except FutureTimeoutError:
+        future.cancel()
+        logger.warning(f"Password hashing timed out after {timeout}s")
+        raise HashingUnavailable()
+
+
+def make_password(raw_password: Optional[str]) -> str:
+    """
+    Hash a password in the bounded hashing pool.
+
+    Args:
+        raw_password: Plain text password, None for an unusable one
+    Returns:
+        Encoded password hash
+    """
+
+    if raw_password is None:
+        return hashers.make_password(None)
+    return _run(hashers.make_password, raw_password)
+
+
+def check_password(
+    raw_password: str,
+    encoded: str,
+    setter: Optional[Callable[[str], None]] = None,
+) -> bool:
+    """
+    Verify a password in the bounded hashing pool.
+
+    Args:
+        raw_password: Plain text password
+        encoded: Stored password hash
+        setter: Called with the raw password when the hash must be upgraded
+    Returns:
+        Whether the password matches
+    """
+
+    if raw_password is None or not hashers.is_password_usable(encoded):
+        return False
+
+    is_correct, must_update = _run(hashers.verify_password, raw_password, encoded)
+    if setter and is_correct and must_update:
+        setter(raw_password)
+    return is_correct
@@ -0,0 +1,141 @@
+# Python modules
+from concurrent.futures import ThreadPoolExecutor
+import statistics
+import time
+
+# Django modules
+from django.conf import settings
+from django.contrib.auth.hashers import get_hashers
+from django.core.management.base import BaseCommand
+
+# Constants
+DEFAULT_ITERATIONS = "100000,260000,390000,600000,720000,1000000"
+BENCHMARK_PASSWORD = "correct-horse-battery-staple"
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the configured password hashers and PBKDF2 iteration "
+        "counts on this host against a latency target"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--iterations",
+            default=DEFAULT_ITERATIONS,
+            help="Comma separated iteration counts for iteration based hashers",
+        )
+        parser.add_argument(
+            "--rounds",
+            type=int,
+            default=5,
+            help="Hashes per variant for the latency measurement",
+        )
+        parser.add_argument(
+            "--target-ms",
+            type=float,
+            default=250.0,
+            help="Latency budget for a single hash in milliseconds",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=getattr(settings, "PASSWORD_HASHING", {}).get("MAX_WORKERS", 2),
+            help="Parallel hashes for the throughput measurement",
+        )
+
+    def handle(self, *args, **options):
+        """
+        Time every available hasher variant and recommend the strongest
+        PBKDF2 iteration count whose median latency fits the target.
+        """
+        iterations = [int(value) for value in options["iterations"].split(",")]
+        rounds = options["rounds"]
+        target_ms = options["target_ms"]
+        concurrency = options["concurrency"]
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Benchmarking hashers: rounds={rounds}, "
+                f"concurrency={concurrency}, target={target_ms:.0f} ms"
+            )
+        )
+        self.stdout.write(
+            f"{'algorithm':<24}{'cost':>10}{'median ms':>12}"
+            f"{'max ms':>10}{'hashes/s':>12}"
+        )
+
+        recommended = None
+        for hasher in get_hashers():
+            variants = [(hasher, "default")]
+            if hasattr(hasher, "iterations"):
+                variants = [
+                    (
+                        type(type(hasher).__name__, (type(hasher),), {"iterations": n})(),
+                        n,
+                    )
+                    for n in iterations
+                ]
+
+            for variant, cost in variants:
+                try:
+                    variant.encode(BENCHMARK_PASSWORD, variant.salt())
+                except ValueError as e:
+                    self.stdout.write(
+                        self.style.WARNING(f"{hasher.algorithm:<24}skipped: {e}")
+                    )
+                    break
+
+                timings = self._measure_latency(variant, rounds)
+                throughput = self._measure_throughput(variant, rounds, concurrency)
+                median_ms = statistics.median(timings)
+
+                line = (
+                    f"{variant.algorithm:<24}{cost!s:>10}{median_ms:>12.1f}"
+                    f"{max(timings):>10.1f}{throughput:>12.1f}"
+                )
+                fits = median_ms <= target_ms
+                self.stdout.write(line if fits else self.style.WARNING(line))
+
+                if (
+                    fits
+                    and variant.algorithm == get_hashers()[0].algorithm
+                    and isinstance(cost, int)
+                ):
+                    recommended = (cost, median_ms, throughput)
+
+        if recommended is None:
+            self.stdout.write(
+                self.style.ERROR("No iteration count of the default hasher fits the target")
+            )
+            return
+
+        cost, median_ms, throughput = recommended
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"\nRecommended PASSWORD_HASHING['PBKDF2_ITERATIONS'] = {cost} "
+                f"({median_ms:.1f} ms per hash, {throughput:.1f} hashes/s "
+                f"with {concurrency} workers)"
+            )
+        )
+
+    def _measure_latency(self, hasher, rounds):
+        timings = []
+        for _ in range(rounds):
+            salt = hasher.salt()
+            started = time.perf_counter()
+            hasher.encode(BENCHMARK_PASSWORD, salt)
+            timings.append((time.perf_counter() - started) * 1000)
+        return timings
+
+    def _measure_throughput(self, hasher, rounds, concurrency):
+        total = rounds * concurrency
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            list(
+                executor.map(
+                    lambda salt: hasher.encode(BENCHMARK_PASSWORD, salt),
+                    [hasher.salt() for _ in range(total)],
+                )
+            )
+        return total / (time.perf_counter() - started)
@@ -14,6 +14,7 @@ from django.contrib.auth.models import (
 # Project modules
 from apps.abstract.models import AbstractTimeStamptModel
 from apps.users.manager import CustomUserManager
+from apps.users import hashing
 
 
 # Constants
@@ -50,6 +51,8 @@ class CustomUser(
 
     Methods:
         - __str__: Return a string representation of the user
+        - set_password: Hash the password in the bounded hashing pool
+        - check_password: Verify the password in the bounded hashing pool
     """
 
     email = EmailField(
@@ -90,3 +93,16 @@ class CustomUser(
 
     def __str__(self):
         return f"Email: {self.email}, Fullname: {self.first_name} {self.last_name}"
+
+    def set_password(self, raw_password):
+        self.password = hashing.make_password(raw_password)
+        self._password = raw_password
+
+    def check_password(self, raw_password):
+        def setter(raw_password):
+            self.set_password(raw_password)
+            # Password hash upgrades shouldn't be considered password changes.
+            self._password = None
+            self.save(update_fields=["password"])
+
+        return hashing.check_password(raw_password, self.password, setter)
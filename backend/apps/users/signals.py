@@ -0,0 +1,27 @@
+# Django modules
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+# Project modules
+from apps.users.models import CustomUser
+from apps.users.auth.authentication import invalidate_user_snapshot
+from apps.abstract import surrogate
+
+
+@receiver(post_save, sender=CustomUser)
+@receiver(post_delete, sender=CustomUser)
+def invalidate_cached_user(sender, instance, **kwargs):
+    """
+    Drop the cached auth snapshot whenever a user is saved,
+    deactivated, soft-deleted or removed.
+    """
+    invalidate_user_snapshot(instance.pk)
+
+
+@receiver(post_save, sender=CustomUser)
+@receiver(post_delete, sender=CustomUser)
+def purge_author_responses(sender, instance, **kwargs):
+    """
+    Purge cached responses that embed this user as an author.
+    """
+    surrogate.purge_on_commit(f"author:{instance.pk}")
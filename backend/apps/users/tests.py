@@ -1,3 +1,122 @@
-from django.test import TestCase
+# Python modules
+from unittest import mock
+import json
+import time
 
-# Create your tests here.
+# Third-party modules
+from rest_framework_simplejwt.settings import api_settings
+
+# Django modules
+from django.conf import settings
+from django.core import checks
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+# Project modules
+from apps.users.auth.tokens import (
+    BLACKLIST_CACHE_KEY,
+    RedisTokenBlacklist,
+    RefreshToken,
+)
+from apps.users.models import CustomUser
+
+# Constants
+FAST_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
+
+@override_settings(PASSWORD_HASHERS=FAST_HASHERS)
+class TokenBlacklistTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = CustomUser.objects.create_user(
+            email="user@example.com",
+            first_name="Test",
+            last_name="User",
+            password="test-password",
+        )
+        self.path = reverse("auth-refresh")
+
+    def refresh(self, token):
+        return self.client.post(
+            self.path,
+            json.dumps({"refresh": str(token)}),
+            content_type="application/json",
+        )
+
+    def test_login_issues_tokens(self):
+        response = self.client.post(
+            reverse("auth-token"),
+            json.dumps({"email": "user@example.com", "password": "test-password"}),
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(set(response.json()), {"access", "refresh"})
+
+    def test_refresh_rotates_the_token(self):
+        token = RefreshToken.for_user(self.user)
+
+        response = self.refresh(token)
+
+        self.assertEqual(response.status_code, 200)
+        rotated = RefreshToken(response.json()["refresh"])
+        self.assertNotEqual(
+            rotated[api_settings.JTI_CLAIM], token[api_settings.JTI_CLAIM]
+        )
+        self.assertEqual(self.refresh(rotated).status_code, 200)
+
+    def test_rotated_token_cannot_be_reused(self):
+        token = RefreshToken.for_user(self.user)
+        self.refresh(token)
+
+        self.assertEqual(self.refresh(token).status_code, 401)
+
+    def test_token_blacklisted_by_another_worker_is_rejected(self):
+        token = RefreshToken.for_user(self.user)
+        # Only Redis knows, this process' Bloom filter has not seen it
+        cache.add(BLACKLIST_CACHE_KEY.format(jti=token[api_settings.JTI_CLAIM]), 1, 60)
+
+        self.assertEqual(self.refresh(token).status_code, 401)
+
+
+class RedisTokenBlacklistTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.blacklist = RedisTokenBlacklist(capacity=100)
+        self.exp = int(time.time()) + 60
+
+    def test_add_claims_a_jti_once(self):
+        self.assertTrue(self.blacklist.add("jti-1", self.exp))
+        self.assertFalse(self.blacklist.add("jti-1", self.exp))
+        self.assertTrue(self.blacklist.contains("jti-1"))
+
+    def test_clean_tokens_skip_redis(self):
+        with mock.patch.object(cache, "has_key") as has_key:
+            self.assertFalse(self.blacklist.contains("jti-1"))
+        has_key.assert_not_called()
+
+    def test_entries_expire_with_the_token(self):
+        self.blacklist.add("jti-1", self.exp)
+
+        ttl = cache.ttl(BLACKLIST_CACHE_KEY.format(jti="jti-1"))
+        self.assertTrue(0 < ttl <= 60)
+
+
+class TokenRotationCheckTests(TestCase):
+    def get_errors(self):
+        return [
+            error.id
+            for error in checks.run_checks(tags=[checks.Tags.security])
+            if error.id.startswith("users.")
+        ]
+
+    def test_rotation_with_blacklist_passes(self):
+        self.assertEqual(self.get_errors(), [])
+
+    def test_rotation_without_blacklist_fails(self):
+        for name in ("ROTATE_REFRESH_TOKENS", "BLACKLIST_AFTER_ROTATION"):
+            with self.subTest(name), override_settings(
+                SIMPLE_JWT={**settings.SIMPLE_JWT, name: False}
+            ):
+                self.assertEqual(self.get_errors(), ["users.E001"])
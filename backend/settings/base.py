@@ -55,6 +55,10 @@ LOGGING = {
             "{name} {module}.{funcName}: {lineno} - {message}",
             "style": "{",
         },
+        "message": {
+            "format": "{message}",
+            "style": "{",
+        },
     },
     "filters": {
         "require_debug_true": {
@@ -86,6 +90,15 @@ LOGGING = {
             "filters": ["require_debug_true"],
             "encoding": "utf-8",
         },
+        "slow_queries": {
+            "class": "logging.handlers.RotatingFileHandler",
+            "level": "INFO",
+            "filename": "logs/slow_queries.jsonl",
+            "maxBytes": 10 * 1024 * 1024,  # 10 MB
+            "backupCount": 5,
+            "formatter": "message",
+            "encoding": "utf-8",
+        },
     },
     "loggers": {
         "apps.users": {
@@ -98,6 +111,16 @@ LOGGING = {
             "level": "DEBUG",
             "propagate": False,
         },
+        "apps.abstract": {
+            "handlers": ["console", "file"],
+            "level": "INFO",
+            "propagate": False,
+        },
+        "slow_queries": {
+            "handlers": ["slow_queries"],
+            "level": "INFO",
+            "propagate": False,
+        },
         "django.request": {
             "handlers": ["file", "debug_only"],
             "level": "WARNING",
@@ -123,15 +146,39 @@ SIMPLE_JWT = {
     "AUTH_TOKEN_CLASSES": ("rest_framework_simplejwt.tokens.AccessToken",),
 }
 
+# Authenticated user snapshots (seconds / entries). LOCAL_* size the
+# verified token LRU, snapshots use the cache's local tier
+AUTH_USER_CACHE = {
+    "LOCAL_TTL": 30,
+    "LOCAL_MAX_SIZE": 10_000,
+    "REDIS_TTL": 300,
+}
+
+# Redis refresh token blacklist with a per-process Bloom prefilter
+TOKEN_BLACKLIST = {
+    "BLOOM_CAPACITY": 100_000,
+    "BLOOM_ERROR_RATE": 0.001,
+}
+
 """
 Django Rest Framework
 """
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "apps.users.auth.authentication.CachedJWTAuthentication",
     ),
     "DEFAULT_PERMISSION_CLASSES": ("rest_framework.permissions.IsAuthenticated",),
+    # orjson backed, with a stdlib fallback when orjson is not installed
+    "DEFAULT_RENDERER_CLASSES": (
+        "apps.abstract.renderers.JSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
+    "DEFAULT_PARSER_CLASSES": (
+        "apps.abstract.parsers.JSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ),
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.CursorPagination",
     "PAGE_SIZE": 100,
 }
@@ -142,26 +189,155 @@ Caching
 
 CACHES = {
     "default": {
-        "BACKEND": "django_redis.cache.RedisCache",
+        "BACKEND": "apps.abstract.cache_backends.TwoTierRedisCache",
         "LOCATION": "redis://redis:6379/1",
         "OPTIONS": {
             "CLIENT_CLASS": "django_redis.client.DefaultClient",
+            # In-process LRU in front of Redis for the hottest keys
+            "LOCAL_CACHE": {
+                "MAX_SIZE": 1000,
+                "TTL": 5,
+                # auth:user: deletes are broadcast, so a deactivated
+                # user is dropped by every worker at once
+                "KEY_PREFIXES": ["response:", "auth:user:"],
+            },
         },
         "KEY_PREFIX": "blog",
         "TIMEOUT": 300,
     }
 }
 
+# Stampede protection for hot keys (apps.abstract.cache.get_or_rebuild)
+CACHE_STAMPEDE = {
+    "BETA": 1.0,
+    "STALE_TIMEOUT": 300,
+    "LOCK_TIMEOUT": 10,
+    "WAIT_TIMEOUT": 2.0,
+}
+
+# Idempotency-Key handling of POST endpoints (apps.abstract.idempotency)
+IDEMPOTENCY = {
+    # Seconds a stored response is replayed to retries
+    "TIMEOUT": 86400,
+    # Seconds a key stays in flight if its worker dies mid-request
+    "LOCK_TIMEOUT": 30,
+    "MAX_KEY_LENGTH": 255,
+}
+
+# Delta sync endpoints (apps.abstract.sync)
+SYNC = {
+    "PAGE_SIZE": 100,
+    "MAX_PAGE_SIZE": 500,
+    # Upper bound on commit delay, changes are synced that much later
+    "SETTLE_SECONDS": 5,
+    # Keep at most purge_deleted --older-than, older tokens may miss tombstones
+    "TOKEN_MAX_AGE_DAYS": 30,
+}
+
+"""
+Profiling
+"""
+
+# Fraction of requests profiled by ProfilingMiddleware
+# (Server-Timing header + one JSON log line per sampled request)
+PROFILING = {
+    "SAMPLE_RATE": config(  # noqa: F405
+        "PROFILING_SAMPLE_RATE", default=0.01, cast=float
+    ),
+}
+
+"""
+Metrics
+"""
+
+# Bearer token required by /metrics, empty leaves it open with DEBUG
+# on and closed otherwise
+# (set PROMETHEUS_MULTIPROC_DIR to aggregate across workers)
+METRICS_TOKEN = config("METRICS_TOKEN", default="")  # noqa: F405
+
+"""
+Slow query log
+"""
+
+# Written by SlowQueryMiddleware to logs/slow_queries.jsonl,
+# summarized by `manage.py slow_queries`
+SLOW_QUERIES = {
+    "THRESHOLD_MS": config(  # noqa: F405
+        "SLOW_QUERY_THRESHOLD_MS", default=100, cast=int
+    ),
+    # Runs inline on the request's connection, enable while investigating
+    "EXPLAIN": config("SLOW_QUERY_EXPLAIN", default=False, cast=bool),  # noqa: F405
+    # Full scans of these are logged once per statement, slow or not,
+    # when EXPLAIN is on
+    "WATCHED_TABLES": ("blog_post", "blog_comment"),
+}
+
+"""
+Traffic capture
+"""
+
+# Sampled request log replayed by `manage.py replay_traffic`,
+# one file per worker process
+TRAFFIC_CAPTURE = {
+    "SAMPLE_RATE": config(  # noqa: F405
+        "TRAFFIC_CAPTURE_SAMPLE_RATE", default=0.0, cast=float
+    ),
+    "FILE": "logs/traffic-{pid}.jsonl",
+    "MAX_BYTES": 50 * 1024 * 1024,  # 50 MB
+    "BACKUP_COUNT": 5,
+}
+
+"""
+Load shedding
+"""
+
+# Adaptive per-process concurrency limit of ConcurrencyLimitMiddleware
+CONCURRENCY_LIMIT = {
+    "ENABLED": config(  # noqa: F405
+        "CONCURRENCY_LIMIT_ENABLED", default=True, cast=bool
+    ),
+    "INITIAL_LIMIT": 20,
+    "MIN_LIMIT": 4,
+    "MAX_LIMIT": 200,
+    "TOLERANCE": 2.0,
+    "BACKOFF": 0.9,
+    "COOLDOWN": 1.0,
+    # Reads default to "normal", writes to "low", cached reads are never shed
+    "ROUTE_PRIORITIES": {
+        "auth-token": "high",
+        "auth-refresh": "high",
+        "export": "low",
+    },
+}
+
+"""
+Database routing
+"""
+
+# Aliases of read replicas, declared in the env settings
+DATABASE_REPLICAS = []
+DATABASE_ROUTERS = ["apps.abstract.routers.PrimaryReplicaRouter"]
+REPLICATED_MODELS = ["blog.Post", "blog.Comment", "blog.Tag", "blog.Category"]
+# Read-your-writes window after a successful write
+REPLICA_STICKINESS_SECONDS = 5
+
 """
 Middleware | Templates | Validators
 """
 
 MIDDLEWARE = [
+    "apps.abstract.middleware.AsyncStreamingMiddleware",
+    "apps.abstract.middleware.MetricsMiddleware",
+    "apps.abstract.middleware.ConcurrencyLimitMiddleware",
+    "apps.abstract.middleware.ProfilingMiddleware",
+    "apps.abstract.middleware.SlowQueryMiddleware",
+    "apps.abstract.middleware.TrafficCaptureMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "apps.abstract.middleware.PrimaryStickinessMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
@@ -198,6 +374,24 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 
+PASSWORD_HASHERS = [
+    "apps.users.hashing.PBKDF2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    "django.contrib.auth.hashers.Argon2PasswordHasher",
+    "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
+    "django.contrib.auth.hashers.ScryptPasswordHasher",
+]
+
+# Bounded pool for password hashing, see manage.py benchmark_hashers
+PASSWORD_HASHING = {
+    "EXECUTOR": config("PASSWORD_HASHING_EXECUTOR", default="thread"),  # noqa: F405
+    "MAX_WORKERS": config("PASSWORD_HASHING_WORKERS", default=2, cast=int),  # noqa: F405
+    "MAX_PENDING": config("PASSWORD_HASHING_PENDING", default=8, cast=int),  # noqa: F405
+    "TIMEOUT": 30,
+    "PBKDF2_ITERATIONS": 720_000,
+}
+
+
 """
 Internalizations
 """
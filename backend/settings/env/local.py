@@ -13,6 +13,17 @@ DATABASES = {
     },
 }
 
+# Optional second SQLite file acting as a read replica,
+# refreshed from the primary with manage.py sync_replica
+BLOG_DB_REPLICA = config("BLOG_DB_REPLICA", default="")  # noqa: F405
+if BLOG_DB_REPLICA:
+    DATABASES["replica"] = {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": BLOG_DB_REPLICA,
+        "TEST": {"MIRROR": "default"},
+    }
+    DATABASE_REPLICAS = ["replica"]
+
 REDIS_HOST = "localhost"
 REDIS_PORT = 6379
 REDIS_DB = 0
@@ -1,15 +1,22 @@
 # Project modules
 from settings.base import *  # noqa: F403
+from apps.abstract.db.sqlite3.base import DEFAULT_PRAGMAS
 
 
 DEBUG = False
 ALLOWED_HOSTS = ["localhost"]
 
 # Database configuration
+# WAL + tuned pragmas, persistent connections and BEGIN IMMEDIATE writes,
+# see manage.py benchmark_sqlite
 DATABASES = {
     "default": {
-        "ENGINE": "django.db.backends.sqlite3",
+        "ENGINE": "apps.abstract.db.sqlite3",
         "NAME": "db.sqlite3",
+        "CONN_MAX_AGE": 600,
+        "CONN_HEALTH_CHECKS": True,
+        "TRANSACTION_MODE": "IMMEDIATE",
+        "PRAGMAS": DEFAULT_PRAGMAS,
     },
 }
 
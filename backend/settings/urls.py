@@ -2,9 +2,13 @@
 from django.contrib import admin
 from django.urls import path, include
 
+# Project modules
+from apps.abstract.metrics import metrics_view
+
 
 urlpatterns = [
     path("admin/", admin.site.urls),
+    path("metrics", metrics_view, name="metrics"),
     path("api/", include("apps.users.auth.urls")),
     path("api/", include("apps.users.urls")),
     path("api/", include("apps.blog.urls")),